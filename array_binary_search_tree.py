@@ -0,0 +1,251 @@
+import array
+import typing
+
+from errors import InvalidStorageException, InvalidTypeException, RootNodeDeleteException
+from sorters import BaseSorter, FloatSorter, IntegerSorter
+import vectorized
+
+
+class ArrayBinarySearchTree:
+    """
+    Same tree as BinarySearchTreeNode, same placement rules and same results, but
+    instead of one python object per node we keep every node field in its own typed array,
+    the node is just an index to them. Consider the following tree:
+
+                43          index 0
+               /  \\
+             21    89       index 1 and 2
+
+        keys   = [43, 89, 21]     <- nodes get an index in the order they are added
+        left   = [ 2, -1, -1]     <- -1 means there is no node on that side
+        right  = [ 1, -1, -1]
+        levels = [ 0,  1,  1]     <- -1 here means the index is free (removed node)
+
+    An int node takes 28 bytes instead of a python object, only numeric sorters can use it,
+    and ints have to fit on 64 bits.
+    """
+
+    array_types = {
+        IntegerSorter: "q",
+        FloatSorter: "d",
+    }
+
+    def __init__(
+        self,
+        sorter: typing.Type[BaseSorter],
+        node_value: typing.Any,
+    ):
+        if sorter not in self.array_types:
+            raise InvalidStorageException(f"Array storage does not support {sorter.__name__}.")
+
+        self.sorter = sorter
+        sorter.validate_value(node_value)
+        self._keys = array.array(self.array_types[sorter])
+        self._left = array.array("q")
+        self._right = array.array("q")
+        self._levels = array.array("i")
+        self._free_indexes: list[int] = []
+        self._new_node(node_value, level=0)  # <- root node is always index 0
+
+    @classmethod
+    def from_sorted(
+            cls,
+            sorter: typing.Type[BaseSorter],
+            values: typing.Sequence[typing.Any],
+    ) -> "ArrayBinarySearchTree":
+        """
+        Build a minimum height tree in O(n) from sorted values without duplicates,
+        the middle value is the root (see BinarySearchTreeNode.from_sorted).
+        """
+        middle = (len(values) - 1) // 2
+        tree = cls(sorter=sorter, node_value=values[middle])
+        stack = [(0, 0, middle, len(values))]
+        while stack:
+            index, low, middle, high = stack.pop()
+            level = tree._levels[index] + 1
+            if low < middle:
+                left_middle = (low + middle - 1) // 2
+                tree._left[index] = tree._new_node(values[left_middle], level)
+                stack.append((tree._left[index], low, left_middle, middle))
+            if middle + 1 < high:
+                right_middle = (middle + high) // 2
+                tree._right[index] = tree._new_node(values[right_middle], level)
+                stack.append((tree._right[index], middle + 1, right_middle, high))
+        return tree
+
+    def _new_node(self, value: typing.Any, level: int) -> int:
+        """Store a node on a free index if there is one, or at the end of the arrays"""
+        try:
+            if self._free_indexes:
+                index = self._free_indexes[-1]
+                self._keys[index] = value
+                self._free_indexes.pop()
+                self._left[index] = self._right[index] = -1
+                self._levels[index] = level
+                return index
+
+            self._keys.append(value)
+        except OverflowError:
+            raise InvalidStorageException("Array storage only accepts 64 bits integers.")
+        self._left.append(-1)
+        self._right.append(-1)
+        self._levels.append(level)
+        return len(self._keys) - 1
+
+    def __len__(self) -> int:
+        return len(self._keys) - len(self._free_indexes)
+
+    @property
+    def node_value(self) -> typing.Any:
+        """Value of the root node"""
+        return self._keys[0]
+
+    @property
+    def depth(self) -> int:
+        """Highest level of any node, a single pass over the levels array"""
+        return max(self._levels)
+
+    @property
+    def deepest_nodes(self) -> tuple[int, list]:
+        """
+        Nodes at the tree depth level are leaves, so their left to right
+        order is just their values order.
+        """
+        depth = self.depth
+        return depth, sorted(
+            key for key, level in zip(self._keys, self._levels) if level == depth
+        )
+
+    @property
+    def min_value(self) -> typing.Any:
+        """Get the lowest value of whole tree"""
+        index = 0
+        while self._left[index] >= 0:
+            index = self._left[index]
+        return self._keys[index]
+
+    @property
+    def max_value(self) -> typing.Any:
+        """Get the higher value of whole tree"""
+        index = 0
+        while self._right[index] >= 0:
+            index = self._right[index]
+        return self._keys[index]
+
+    def get_ordered_values(self, reverse: bool = False) -> list[typing.Any]:
+        """Get a list of all tree values ordered (or reverse), with an explicit stack"""
+        keys = self._keys
+        first_side, second_side = self._left, self._right
+        if reverse:
+            first_side, second_side = second_side, first_side
+
+        result = []
+        stack = []
+        index = 0
+        while stack or index >= 0:
+            if index >= 0:
+                stack.append(index)
+                index = first_side[index]
+                continue
+            index = stack.pop()
+            result.append(keys[index])
+            index = second_side[index]
+        return result
+
+    def _search(self, value: typing.Any) -> tuple[int, int, typing.Optional[array.array]]:
+        """
+        Walk down looking for the value, it returns a tuple with:
+        index / -1      index of the node that holds the value, -1 when it is not on the tree
+        parent / -1     index of the last node before it
+        side / None     the array (left or right) that links parent with the value place
+        """
+        keys, left, right = self._keys, self._left, self._right
+        parent, side = -1, None
+        index = 0
+        while index >= 0:
+            key = keys[index]
+            if value == key:
+                return index, parent, side
+            parent = index
+            side = left if value < key else right
+            index = side[index]
+        return -1, parent, side
+
+    def add(self, value: typing.Any, trusted: bool = False):
+        """Add a value to tree, following the same placement rules than BinarySearchTreeNode"""
+        if not trusted:
+            self.sorter.validate_value(value)
+
+        index, parent, side = self._search(value)
+        if index >= 0:
+            return  # <- We already have it, we do nothing for now
+
+        side[parent] = self._new_node(value, self._levels[parent] + 1)
+
+    def add_multiple(self, values: typing.Iterable, trusted: bool = False):
+        """Add multiple values to tree"""
+        if not isinstance(values, typing.Iterable):
+            raise InvalidTypeException(
+                "Method add_multiple accepts iterable data only for input."
+            )
+        if vectorized.is_buffer(values):
+            # See BinarySearchTreeNode.add_multiple
+            vectorized.validate_buffer(values, self.sorter)
+            values = vectorized.middle_first(vectorized.sort_unique_buffer(values))
+            trusted = True
+        for _value in values:
+            self.add(_value, trusted=trusted)
+
+    def _shift_levels(self, index: int, delta: int):
+        """Move every node of the subtree that starts at index up or down some levels"""
+        stack = [index] if index >= 0 else []
+        while stack:
+            index = stack.pop()
+            self._levels[index] += delta
+            for child in (self._left[index], self._right[index]):
+                if child >= 0:
+                    stack.append(child)
+
+    def remove(self, value: typing.Any) -> bool:
+        """
+        Delete only the node that match a certain value, following the same rules
+        than BinarySearchTreeNode.remove (two children nodes take their successor value),
+        the freed index is used by next added values.
+        """
+        self.sorter.validate_value(value)
+        index, parent, side = self._search(value)
+        if index < 0:
+            return False
+
+        keys, left, right = self._keys, self._left, self._right
+        if left[index] >= 0 and right[index] >= 0:
+            parent, side, successor = index, right, right[index]
+            while left[successor] >= 0:
+                parent, side, successor = successor, left, left[successor]
+            keys[index] = keys[successor]
+            index = successor
+
+        child = left[index] if left[index] >= 0 else right[index]
+        if parent >= 0:
+            side[parent] = child
+            self._shift_levels(child, -1)
+        elif child < 0:
+            raise RootNodeDeleteException("Cannot remove the last value of the tree.")
+        else:
+            # The root is always index 0, so it takes the value and children of its only child
+            keys[0], left[0], right[0] = keys[child], left[child], right[child]
+            self._shift_levels(left[0], -1)
+            self._shift_levels(right[0], -1)
+            index = child
+
+        self._levels[index] = -1
+        self._free_indexes.append(index)
+        return True
+
+    def remove_multiple(self, values: typing.Iterable) -> int:
+        """Delete multiple values, returns how many of them were on the tree"""
+        if not isinstance(values, typing.Iterable):
+            raise InvalidTypeException(
+                "Method remove_multiple accepts iterable data only for input."
+            )
+        return sum(self.remove(_value) for _value in values)
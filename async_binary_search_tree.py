@@ -0,0 +1,158 @@
+import asyncio
+import collections
+import functools
+import typing
+
+from binary_search_tree import BinarySearchTreeNode
+from errors import InvalidStorageException
+from multiset_binary_search_tree import MultisetBinarySearchTreeNode
+from persistent_binary_search_tree import PersistentBinarySearchTreeNode
+
+
+class AsyncBinarySearchTree:
+    """
+    Wrapper to use a tree from asyncio code without blocking the event loop for long.
+    Values added by many coroutines at the same time are gathered and added with a single
+    <add_multiple> per batch (one cache clear per batch instead of one per value), and we
+    give the loop back between batches, so other coroutines run while we ingest.
+
+        tree = AsyncBinarySearchTree(make_binary_search_tree(values=[50]))
+        await asyncio.gather(*(tree.add(value) for value in values))
+        assert await tree.contains(values[0])
+
+    Queries that cost O(depth) run right away, they are short. Everything runs on the
+    event loop thread, so it is not a way to share the tree with other threads.
+    Persistent trees are not accepted, their changes give back a new root that we would lose.
+    """
+
+    # Tree methods we give as coroutines, all of them walk a single path
+    query_methods = frozenset({
+        "contains", "floor", "ceiling", "predecessor", "successor",
+        "rank", "select", "count_between", "percentile",
+    })
+
+    def __init__(self, tree: BinarySearchTreeNode, batch_size: int = 1000):
+        if isinstance(tree, PersistentBinarySearchTreeNode):
+            raise InvalidStorageException("Persistent trees can not be wrapped, changes give a new root.")
+        self.tree = tree
+        self.batch_size = batch_size
+        self._pending: list[tuple[typing.Any, asyncio.Future]] = []
+        self._flush_task: typing.Optional[asyncio.Task] = None
+        self._write_lock = asyncio.Lock()  # <- batches and ordered walks don't mix
+
+    def __getattr__(self, name: str) -> typing.Callable:
+        if name not in self.query_methods:
+            raise AttributeError(f"{type(self).__name__} has no attribute {name}.")
+        method = getattr(self.tree, name)
+
+        @functools.wraps(method)
+        async def query(*args, **kwargs):
+            return method(*args, **kwargs)
+
+        return query
+
+    def __len__(self) -> int:
+        return len(self.tree)
+
+    async def add(self, value: typing.Any):
+        """
+        Add a value to the tree, it waits for the batch it goes in.
+        Every add of the same loop iteration (and the ones that arrive while a batch
+        is running) go in the same batch.
+        """
+        self.tree.sorter.validate_value(value)  # <- a wrong type fails right here
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((value, future))
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush())
+        await future
+
+    async def _flush(self):
+        async with self._write_lock:
+            self._flush_task = None  # <- next adds start a new batch
+            pending, self._pending = self._pending, []
+            for start in range(0, len(pending), self.batch_size):
+                batch = pending[start:start + self.batch_size]
+                size = len(self.tree)
+                try:
+                    self.tree.add_multiple([value for value, _ in batch], trusted=True)
+                except Exception:
+                    self._add_one_by_one(batch, added=len(self.tree) - size)
+                else:
+                    for _, future in batch:
+                        if not future.done():  # <- the waiting coroutine may be cancelled
+                            future.set_result(None)
+                await asyncio.sleep(0)
+
+    def _add_one_by_one(self, batch: list[tuple[typing.Any, asyncio.Future]], added: int):
+        """
+        A value of the batch that can not be compared with the tree ones (a naive datetime
+        on an aware tree) stops add_multiple half way. We add the batch again value by value,
+        so that value fails on its own and the others get in. Adding again the values that
+        already got in does nothing, but on multisets it would count them twice: there
+        add_multiple adds every copy of a value at once, values in first seen order,
+        so the <added> copies are the ones of the first values, we skip those.
+        """
+        done = set()
+        if isinstance(self.tree, MultisetBinarySearchTreeNode):
+            for value, count in collections.Counter(value for value, _ in batch).items():
+                if added < count:
+                    break
+                added -= count
+                done.add(value)
+        for value, future in batch:
+            try:
+                if value not in done:
+                    self.tree.add(value, trusted=True)
+            except Exception as error:
+                if not future.done():
+                    future.set_exception(error)
+            else:
+                if not future.done():
+                    future.set_result(None)
+
+    async def flush(self):
+        """Wait until every value added so far is on the tree"""
+        if self._flush_task is not None:
+            await self._flush_task  # <- the batch that has not started yet
+        async with self._write_lock:
+            pass  # <- the batch that was already running
+
+    async def add_many(self, values: typing.Union[typing.Iterable, typing.AsyncIterable]):
+        """
+        Add values from an iterable or an async iterable, <batch_size> values at a time,
+        giving the loop back after every batch.
+        """
+        batch = []
+        if isinstance(values, typing.AsyncIterable):
+            async for _value in values:
+                batch.append(_value)
+                if len(batch) >= self.batch_size:
+                    await self._add_batch(batch)
+                    batch = []
+        else:
+            for _value in values:
+                batch.append(_value)
+                if len(batch) >= self.batch_size:
+                    await self._add_batch(batch)
+                    batch = []
+        if batch:
+            await self._add_batch(batch)
+
+    async def _add_batch(self, values: list):
+        async with self._write_lock:
+            self.tree.add_multiple(values)
+        await asyncio.sleep(0)
+
+    async def get_ordered_values(self, reverse: bool = False) -> list[typing.Any]:
+        """
+        Same values than the tree <get_ordered_values>, giving the loop back every
+        <batch_size> values. No batch gets in while we walk the tree.
+        """
+        result = []
+        async with self._write_lock:
+            for _value in self.tree.iter_ordered(reverse=reverse):
+                result.append(_value)
+                if len(result) % self.batch_size == 0:
+                    await asyncio.sleep(0)
+        return result
@@ -0,0 +1,123 @@
+import typing
+
+from binary_search_tree import BinarySearchTreeNode
+
+
+class BalancedBinarySearchTreeNode(BinarySearchTreeNode):
+    r"""
+    Self balancing (AVL) flavour of the binary search tree node.
+    A regular node just appends the value to the leaf it reaches, so sorted input
+    ends up as a linked list. Here after each change we walk back up the path
+    and rotate any node whose sides heights differ by more than one.
+    Consider adding 1, 2, 3 in that order:
+
+            1                       2
+             \                     / \
+              2        ->         1   3
+               \
+                3
+
+    Rotations are done "in place" by swapping values between nodes, so the root
+    node object that the user holds is always the root of the tree.
+    """
+
+    __slots__ = ()
+
+    @property
+    def balance_factor(self) -> int:
+        """Left side height minus right side height, AVL keeps it between -1 and 1"""
+        return self._height_of(self._left_node) - self._height_of(self._right_node)
+
+    def _swap_values(self, other: "BalancedBinarySearchTreeNode"):
+        self.node_value, other.node_value = other.node_value, self.node_value
+
+    def _rotate_right(self):
+        r"""
+        The left child takes our place, we move down to its right side.
+        Example:             z                  y
+                            / \                / \
+                           y   T3     ->     T1   z
+                          / \                    / \
+                        T1   T2                T2   T3
+        """
+        pivot = self._left_node
+        self._swap_values(pivot)  # <- self now holds "y" value and pivot holds "z"
+        top_subtree, middle_subtree, bottom_subtree = (
+            pivot._left_node,
+            pivot._right_node,
+            self._right_node,
+        )
+        self._left_node = top_subtree
+        pivot._left_node = middle_subtree
+        pivot._right_node = bottom_subtree
+        self._right_node = pivot
+
+        self._shift_levels(top_subtree, -1)
+        self._shift_levels(bottom_subtree, 1)
+        pivot._update_subtree_stats()
+        self._update_subtree_stats()
+        pivot.clear_cached_properties()
+        self.clear_cached_properties()
+
+    def _rotate_left(self):
+        """Mirror of <_rotate_right>, the right child takes our place"""
+        pivot = self._right_node
+        self._swap_values(pivot)
+        top_subtree, middle_subtree, bottom_subtree = (
+            pivot._right_node,
+            pivot._left_node,
+            self._left_node,
+        )
+        self._right_node = top_subtree
+        pivot._right_node = middle_subtree
+        pivot._left_node = bottom_subtree
+        self._left_node = pivot
+
+        self._shift_levels(top_subtree, -1)
+        self._shift_levels(bottom_subtree, 1)
+        pivot._update_subtree_stats()
+        self._update_subtree_stats()
+        pivot.clear_cached_properties()
+        self.clear_cached_properties()
+
+    def _rebalance(self):
+        """Apply the AVL single or double rotation needed to fix this node, if any"""
+        self._update_subtree_stats()
+        balance = self.balance_factor
+        if balance > 1:
+            if self._left_node.balance_factor < 0:  # <- left-right case
+                self._left_node._rotate_left()
+            self._rotate_right()
+        elif balance < -1:
+            if self._right_node.balance_factor > 0:  # <- right-left case
+                self._right_node._rotate_right()
+            self._rotate_left()
+
+    @staticmethod
+    def _rebalance_path(path: list["BalancedBinarySearchTreeNode"]):
+        for node in reversed(path):
+            node._rebalance()
+
+    def _attach(
+            self,
+            path: list["BalancedBinarySearchTreeNode"],
+            side: str,
+            created_node: "BalancedBinarySearchTreeNode",
+    ) -> list["BalancedBinarySearchTreeNode"]:
+        """
+        Same placement rules as a regular node, then we rebalance the path
+        we followed, from the new leaf up to this node.
+        """
+        setattr(path[-1], side, created_node)
+        self._rebalance_path(path)
+        return path
+
+    def _remove(self, value: typing.Any) -> typing.Optional[list["BalancedBinarySearchTreeNode"]]:
+        """
+        Same single node delete as a regular node, then we rebalance
+        the path from the removed node up to this node.
+        """
+        path = super()._remove(value)
+        if path is not None:
+            self._rebalance_path(path)
+        return path
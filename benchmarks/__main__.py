@@ -0,0 +1,205 @@
+"""
+Benchmark suite for the main tree operations, for every sorter and input distribution:
+building with make_binary_search_tree, add, add_multiple, remove, get_ordered_values and the
+whole tree properties (depth, deepest_nodes, min_value, max_value, read right after a change,
+so nothing is cached yet). Each case reports seconds, values per second and the peak memory
+of the build, and the whole run can be written as JSON to compare with a later one.
+Run it from the repository root:
+
+    python -m benchmarks --sizes 1000 10000 --output before.json
+    python -m benchmarks --sizes 1000 10000 --output after.json --compare before.json
+
+Trees are balanced unless --unbalanced is given (sorted inputs make plain trees quadratic,
+keep the sizes small with it).
+"""
+import argparse
+import datetime
+import gc
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+import typing
+
+from make_bst import make_binary_search_tree
+
+SIZES = (1_000, 10_000, 100_000, 1_000_000)
+SORTERS = ("int", "float", "char")
+DISTRIBUTIONS = ("random", "sorted", "reversed", "duplicates")
+PROPERTIES = ("depth", "deepest_nodes", "min_value", "max_value")
+# Printable characters below the surrogates, the char sorter has no more than that to sort
+CHARACTERS = [chr(code) for code in range(0x21, 0xD800)]
+
+
+def make_values(sorter: str, distribution: str, size: int, generator: random.Random) -> list:
+    """
+    <size> values for the sorter: random ones, sorted, reversed, or drawn from about
+    size / 100 different values. Chars repeat once size goes over the characters we have.
+    """
+    high = max(size // 100, 10) if distribution == "duplicates" else size * 10
+    if sorter == "char":
+        high = min(high, len(CHARACTERS))
+    keys = [generator.randrange(high) for _ in range(size)]
+    if distribution == "sorted":
+        keys.sort()
+    elif distribution == "reversed":
+        keys.sort(reverse=True)
+
+    if sorter == "int":
+        return keys
+    if sorter == "float":
+        return [key + 0.5 for key in keys]
+    return [CHARACTERS[key] for key in keys]
+
+
+def per_second(count: int, seconds: float) -> typing.Optional[float]:
+    return count / seconds if seconds else None  # <- too fast for the clock
+
+
+def timed(function: typing.Callable) -> float:
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def run_case(sorter: str, distribution: str, size: int, balanced: bool, seed: int) -> dict:
+    generator = random.Random(seed)
+    values = make_values(sorter, distribution, size, generator)
+    # Values for the point operations, as many as we can afford on small and big trees
+    operations = min(size, 10_000)
+    new_values = make_values(sorter, "random", operations, generator)
+    batch = make_values(sorter, "random", operations, generator)
+    results = {}
+
+    def record(name: str, seconds: float, count: int):
+        results[name] = {"count": count, "seconds": seconds, "per_second": per_second(count, seconds)}
+
+    gc.collect()
+    tracemalloc.start()
+    make_binary_search_tree(values=values, balanced=balanced)
+    peak_memory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    tree = None
+
+    def build():
+        nonlocal tree
+        tree = make_binary_search_tree(values=values, balanced=balanced)
+
+    record("make_binary_search_tree", timed(build), size)
+    unique = len(tree)
+
+    def add():
+        for _value in new_values:
+            tree.add(_value)
+
+    record("add", timed(add), operations)
+    record("add_multiple", timed(lambda: tree.add_multiple(batch)), operations)
+    to_remove = generator.sample(tree.get_ordered_values(), min(operations, len(tree) - 1))
+
+    def remove():
+        for _value in to_remove:
+            tree.remove(_value)
+
+    record("remove", timed(remove), len(to_remove))
+    record("get_ordered_values", timed(tree.get_ordered_values), len(tree))
+    for name in PROPERTIES:
+        tree.add(new_values[0])  # <- so the property is computed again, not read from cache
+        tree.remove(new_values[0])
+        record(name, timed(lambda: getattr(tree, name)), len(tree))
+
+    return {
+        "sorter": sorter,
+        "distribution": distribution,
+        "size": size,
+        "unique": unique,
+        "balanced": balanced,
+        "peak_memory_bytes": peak_memory,
+        "operations": results,
+    }
+
+
+def best_of(runs: list[dict]) -> dict:
+    """First run, with the fastest time of every operation among all runs"""
+    best = runs[0]
+    for name, result in best["operations"].items():
+        result["seconds"] = min(run["operations"][name]["seconds"] for run in runs)
+        result["per_second"] = per_second(result["count"], result["seconds"])
+    return best
+
+
+def case_key(case: dict) -> tuple:
+    return case["sorter"], case["distribution"], case["size"], case["balanced"]
+
+
+def compare(cases: list[dict], previous_path: str):
+    """Print how much slower (> 1) or faster (< 1) every operation got since the previous run"""
+    with open(previous_path) as file:
+        previous = {case_key(case): case for case in json.load(file)["cases"]}
+    print(f"\nseconds now / seconds in {previous_path}")
+    for case in cases:
+        before = previous.get(case_key(case))
+        if before is None:
+            continue
+        ratios = " ".join(
+            f"{name}={result['seconds'] / before['operations'][name]['seconds']:.2f}"
+            for name, result in case["operations"].items()
+            if before["operations"].get(name, {}).get("seconds")
+        )
+        print(f"{case['sorter']:<6}{case['distribution']:<12}{case['size']:<10}{ratios}")
+
+
+def main(arguments: typing.Optional[list[str]] = None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+    parser.add_argument("--sorters", nargs="+", choices=SORTERS, default=SORTERS)
+    parser.add_argument("--distributions", nargs="+", choices=DISTRIBUTIONS, default=DISTRIBUTIONS)
+    parser.add_argument("--unbalanced", action="store_true", help="plain trees instead of AVL ones")
+    parser.add_argument("--repeat", type=int, default=1, help="keep the best time of that many runs")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="JSON file of a previous run to compare with")
+    args = parser.parse_args(arguments)
+
+    cases = []
+    print(f"{'sorter':<8}{'input':<12}{'size':>10}{'unique':>10}{'peak MB':>10}  values per second")
+    for size in args.sizes:
+        for sorter in args.sorters:
+            for distribution in args.distributions:
+                case = best_of([
+                    run_case(sorter, distribution, size, not args.unbalanced, args.seed)
+                    for _ in range(args.repeat)
+                ])
+                cases.append(case)
+                rates = " ".join(
+                    f"{name}={result['per_second']:.3g}"
+                    for name, result in case["operations"].items()
+                    if result["per_second"] is not None
+                )
+                print(
+                    f"{sorter:<8}{distribution:<12}{size:>10}{case['unique']:>10}"
+                    f"{case['peak_memory_bytes'] / 2 ** 20:>10.1f}  {rates}",
+                    flush=True,
+                )
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(
+                {
+                    "date": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+                    "python": sys.version,
+                    "platform": platform.platform(),
+                    "arguments": vars(args),
+                    "cases": cases,
+                },
+                file,
+                indent=2,
+            )
+    if args.compare:
+        compare(cases, args.compare)
+
+
+if __name__ == "__main__":
+    main()
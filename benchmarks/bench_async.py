@@ -0,0 +1,69 @@
+"""
+Event loop latency while many coroutines ingest values: a ticker coroutine asks to wake up
+every millisecond and we record how late it wakes up. We compare a blocking add_multiple
+call with AsyncBinarySearchTree, adding from many coroutines and with add_many.
+Run it from the repository root:
+
+    python -m benchmarks.bench_async
+"""
+import asyncio
+import random
+import statistics
+import time
+
+from async_binary_search_tree import AsyncBinarySearchTree
+from make_bst import make_binary_search_tree
+
+
+async def ticker(lags: list, stop: asyncio.Event, interval: float = 0.001):
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(time.perf_counter() - start - interval)
+
+
+async def run(mode: str, producers: int, values: list, batch_size: int) -> tuple[float, list]:
+    tree = make_binary_search_tree(values=[values[0]], balanced=True)
+    async_tree = AsyncBinarySearchTree(tree, batch_size=batch_size)
+    chunk_size = len(values) // producers
+
+    async def produce(chunk: list):
+        for value in chunk:
+            await async_tree.add(value)
+
+    lags = []
+    stop = asyncio.Event()
+    ticker_task = asyncio.create_task(ticker(lags, stop))
+    await asyncio.sleep(0.01)
+    start = time.perf_counter()
+    if mode == "add_multiple":
+        tree.add_multiple(values)  # <- nothing else runs until it is done
+    elif mode == "add_many":
+        await async_tree.add_many(values)
+    else:
+        await asyncio.gather(*(
+            produce(values[start:start + chunk_size]) for start in range(0, len(values), chunk_size)
+        ))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await ticker_task
+    return elapsed, lags
+
+
+def main(size: int = 200_000, producers: int = 100, batch_size: int = 100, seed: int = 0):
+    generator = random.Random(seed)
+    values = [generator.randint(0, size * 10) for _ in range(size)]
+    print(f"{size} random ints, {producers} coroutines, batches of {batch_size}, ticker every 1 ms")
+    print(f"{'mode':<28}{'seconds':>10}{'lag p50 ms':>12}{'lag p99 ms':>12}{'lag max ms':>12}")
+    for mode in ("add_multiple", "add", "add_many"):
+        elapsed, lags = asyncio.run(run(mode, producers, values, batch_size))
+        lags_ms = sorted(lag * 1000 for lag in lags) or [0.0]
+        p99 = lags_ms[int(len(lags_ms) * 0.99) - 1] if len(lags_ms) > 1 else lags_ms[0]
+        print(
+            f"{mode:<28}{elapsed:>10.3f}{statistics.median(lags_ms):>12.2f}"
+            f"{p99:>12.2f}{lags_ms[-1]:>12.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+"""
+Build a tree from a snapshot of random ints, adding values one by one against bulk load.
+Run it from the repository root:
+
+    python -m benchmarks.bench_bulk_load
+"""
+import random
+import time
+
+from make_bst import make_binary_search_tree
+
+
+def measure(values: list[int], **options) -> float:
+    """Wall time of make_binary_search_tree, in seconds"""
+    start = time.perf_counter()
+    make_binary_search_tree(values=values, **options)
+    return time.perf_counter() - start
+
+
+def main(sizes: tuple[int, ...] = (100_000, 1_000_000), seed: int = 0):
+    print(f"{'size':>10}{'add_multiple s':>18}{'balanced s':>14}{'bulk_load s':>14}")
+    generator = random.Random(seed)
+    for size in sizes:
+        values = [generator.randint(0, size * 10) for _ in range(size)]
+        one_by_one = measure(values)
+        balanced = measure(values, balanced=True)
+        bulk_load = measure(values, bulk_load=True)
+        print(f"{size:>10}{one_by_one:>18.3f}{balanced:>14.3f}{bulk_load:>14.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Time add_multiple with the old cache clearing (dir() scan on every node of every path)
+against the class registry plus path-only invalidation. Run it from the repository root:
+
+    python -m benchmarks.bench_cache_invalidation
+"""
+import random
+import time
+import typing
+
+from binary_search_tree import BinarySearchTreeNode
+from cache_manager import cached_property
+from sorters import IntegerSorter
+
+
+class LegacyCacheBinarySearchTreeNode(BinarySearchTreeNode):
+    """Cache clearing as it was before, every node of every insert path scans dir()"""
+
+    __slots__ = ()
+
+    def clear_cached_properties(self, properties: list[str] = None):
+        attributes = [i for i in dir(type(self))]
+        if properties is not None:
+            attributes = [i for i in attributes if i in properties]
+        for _attribute in attributes:
+            if isinstance(getattr(type(self), _attribute), cached_property):
+                if self._cache is not None:
+                    self._cache.pop(_attribute, None)
+
+    def add_multiple(self, values: typing.Iterable):
+        for _value in values:
+            path = self._insert(_value)
+            for _node in path or []:
+                _node.clear_cached_properties()
+        self.clear_cached_properties()
+
+
+def measure(node_class: typing.Type[BinarySearchTreeNode], values: list[int]) -> float:
+    """Wall time of building a tree with add_multiple, in seconds"""
+    root = node_class(sorter=IntegerSorter, node_value=values[0])
+    start = time.perf_counter()
+    root.add_multiple(values[1:])
+    return time.perf_counter() - start
+
+
+def main(size: int = 100_000, seed: int = 0):
+    values = list(range(size))
+    random.Random(seed).shuffle(values)
+
+    before = measure(LegacyCacheBinarySearchTreeNode, values)
+    after = measure(BinarySearchTreeNode, values)
+    print(f"add_multiple of {size} random ints")
+    print(f"{'before (dir() scan per path node)':<40}{before:>10.3f} s")
+    print(f"{'after (registry, dirty once per bulk)':<40}{after:>10.3f} s")
+    print(f"{'speedup':<40}{before / after:>10.1f} x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Read throughput of a shared ConcurrentBinarySearchTree with 1, 4 and 16 reader threads,
+while a background thread keeps adding values with add_multiple.
+Run it from the repository root:
+
+    python -m benchmarks.bench_concurrent
+"""
+import random
+import threading
+import time
+
+from make_bst import make_binary_search_tree
+
+
+def measure(threads: int, size: int, reads: int, seed: int = 0) -> tuple[float, float]:
+    """Reads per second of all reader threads, and batches the writer got in per second"""
+    generator = random.Random(seed)
+    tree = make_binary_search_tree(
+        values=[generator.randint(0, size * 10) for _ in range(size)],
+        balanced=True,
+        concurrent=True,
+    )
+    batches = [[generator.randint(0, size * 10) for _ in range(100)] for _ in range(1000)]
+    queries = [generator.randint(0, size * 10) for _ in range(reads)]
+    readers_done = threading.Event()
+    written_batches = []
+
+    def write():
+        for batch in batches:
+            if readers_done.is_set():
+                break
+            tree.add_multiple(batch)
+            written_batches.append(batch)
+
+    def read():
+        for value in queries:
+            tree.contains(value)
+            tree.rank(value)
+
+    writer = threading.Thread(target=write)
+    readers = [threading.Thread(target=read) for _ in range(threads)]
+    start = time.perf_counter()
+    writer.start()
+    for reader in readers:
+        reader.start()
+    for reader in readers:
+        reader.join()
+    elapsed = time.perf_counter() - start
+    readers_done.set()
+    writer.join()
+    return threads * reads * 2 / elapsed, len(written_batches) / elapsed
+
+
+def main(size: int = 100_000, reads: int = 20_000):
+    print(f"balanced tree of {size} ints, {reads} contains + rank per reader thread")
+    print(f"{'threads':>8}{'reads/s':>14}{'writer batches/s':>20}")
+    for threads in (1, 4, 16):
+        reads_per_second, batches_per_second = measure(threads, size, reads)
+        print(f"{threads:>8}{reads_per_second:>14.0f}{batches_per_second:>20.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""
+Monitoring loop that reads depth and deepest_nodes after every add, with depth computed
+from a scan of every leaf, like before, against the heights every node keeps now.
+Run it from the repository root:
+
+    python -m benchmarks.bench_depth
+"""
+import random
+import time
+
+from make_bst import make_binary_search_tree
+
+
+def leaf_scan_deepest_nodes(tree) -> tuple[int, list]:
+    """depth and deepest_nodes as they were computed before, from every leaf"""
+    depth = max(set(node.level for node in tree.leaf_nodes))
+    return depth, [node.node_value for node in tree.leaf_nodes if node.level == depth]
+
+
+def main(size: int = 20_000, polled_adds: int = 1000, seed: int = 0):
+    generator = random.Random(seed)
+    values = [generator.randint(0, size * 10) for _ in range(size + polled_adds)]
+    print(f"tree of {size} random ints, {polled_adds} adds with a depth read after each one")
+    print(f"{'depth from':<20}{'seconds':>10}")
+    for name, poll in (
+        ("leaf scan", leaf_scan_deepest_nodes),
+        ("kept heights", lambda tree: (tree.depth, tree.deepest_nodes)),
+    ):
+        tree = make_binary_search_tree(values=values[:size])
+        start = time.perf_counter()
+        for _value in values[size:]:
+            tree.add(_value)
+            poll(tree)
+        print(f"{name:<20}{time.perf_counter() - start:>10.3f}")
+    print(f"level histogram: {tree.level_histogram()}")
+
+
+if __name__ == "__main__":
+    main()
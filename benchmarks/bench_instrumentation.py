@@ -0,0 +1,41 @@
+"""
+Cost of the instrumentation: the same adds, removes and ordered walks with it never enabled,
+enabled, and after disabling it again (which should be as fast as never enabled).
+Run it from the repository root:
+
+    python -m benchmarks.bench_instrumentation
+"""
+import random
+import time
+
+import instrumentation
+from make_bst import make_binary_search_tree
+
+
+def workload(values: list, removed: list) -> float:
+    start = time.perf_counter()
+    tree = make_binary_search_tree(values=values[:1], balanced=True)
+    for _value in values:
+        tree.add(_value)
+    for _value in removed:
+        tree.remove(_value)
+    tree.get_ordered_values()
+    tree.min_value
+    return time.perf_counter() - start
+
+
+def main(size: int = 100_000, seed: int = 0):
+    generator = random.Random(seed)
+    values = [generator.randint(0, size * 10) for _ in range(size)]
+    removed = values[:size // 2]
+    print(f"{size} adds, {size // 2} removes and an ordered walk on a balanced tree")
+    print(f"{'instrumentation':<20}{'seconds':>10}")
+    print(f"{'never enabled':<20}{workload(values, removed):>10.3f}")
+    with instrumentation.instrumented() as stats:
+        print(f"{'enabled':<20}{workload(values, removed):>10.3f}")
+    print(f"{'disabled again':<20}{workload(values, removed):>10.3f}")
+    print(f"comparisons per add: {stats.comparisons_per_call('add'):.1f}")
+
+
+if __name__ == "__main__":
+    main()
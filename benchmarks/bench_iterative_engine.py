@@ -0,0 +1,158 @@
+"""
+Compare the old recursive node operations against the iterative ones on skewed trees.
+Run it from the repository root:
+
+    python -m benchmarks.bench_iterative_engine
+"""
+import sys
+import time
+import typing
+
+from binary_search_tree import BinarySearchTreeNode
+from cache_manager import cached_property
+from errors import EqualValuesException, RootNodeDeleteException
+from sorters import IntegerSorter
+
+
+class RecursiveBinarySearchTreeNode(BinarySearchTreeNode):
+    """The node operations as they were before, one recursive call per tree level"""
+
+    __slots__ = ()
+
+    @cached_property
+    def leaf_nodes(self) -> list[typing.Any]:
+        if self._left_node is None and self._right_node is None:
+            return [self]
+        result = []
+        if self._left_node is not None:
+            result += self._left_node.leaf_nodes
+        if self._right_node is not None:
+            result += self._right_node.leaf_nodes
+        return result
+
+    @cached_property
+    def min_value(self):
+        if self._left_node is not None:
+            return self._left_node.min_value
+        return self.node_value
+
+    @cached_property
+    def max_value(self):
+        if self._right_node is not None:
+            return self._right_node.max_value
+        return self.node_value
+
+    def get_ordered_values(self, reverse: bool = False) -> list[typing.Any]:
+        result = []
+        sides_order = ["_left_node", "_right_node"]
+        if reverse:
+            sides_order.reverse()
+        first_side_node = getattr(self, sides_order[0], None)
+        if first_side_node is not None:
+            result += first_side_node.get_ordered_values(reverse=reverse)
+        result.append(self.node_value)
+        second_side_node = getattr(self, sides_order[1], None)
+        if second_side_node is not None:
+            result += second_side_node.get_ordered_values(reverse=reverse)
+        return result
+
+    def add(self, value: typing.Any, bypass_cache_clear: bool = False):
+        try:
+            side = (
+                "_left_node"
+                if self.sorter.is_lower_than(value, self.node_value)
+                else "_right_node"
+            )
+            side_node = getattr(self, side, None)
+            if side_node is not None:
+                side_node.add(value)
+            else:
+                setattr(
+                    self,
+                    side,
+                    type(self)(sorter=self.sorter, node_value=value, level=self.level + 1),
+                )
+        except EqualValuesException:
+            return
+        finally:
+            self.clear_cached_properties()
+
+    def remove(self, value: typing.Any):
+        try:
+            if value == self.node_value and self.is_root:
+                raise RootNodeDeleteException("Cannot remove root node.")
+            side = (
+                "_left_node"
+                if self.sorter.is_lower_than(value, self.node_value)
+                else "_right_node"
+            )
+            side_node = getattr(self, side, None)
+            if side_node is not None:
+                if side_node.node_value == value:
+                    setattr(self, side, None)
+                    return True
+                side_node.remove(value)
+            return False
+        finally:
+            self.clear_cached_properties()
+
+
+def make_skewed_tree(node_class: typing.Type[BinarySearchTreeNode], size: int):
+    """
+    Link <size> sorted values as a right-only chain, the worst case shape.
+    We link nodes directly, inserting them one by one is O(n²).
+    """
+    root = node = node_class(sorter=IntegerSorter, node_value=0)
+    for value in range(1, size):
+        node._right_node = node_class(sorter=IntegerSorter, node_value=value, level=value)
+        node = node._right_node
+    return root
+
+
+def measure(
+        node_class: typing.Type[BinarySearchTreeNode],
+        size: int,
+        operation: str,
+        repeat: int = 5,
+) -> float:
+    """
+    Best wall time of <repeat> runs, in milliseconds.
+    Every run gets a fresh tree, so no cached property is already computed on any node.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        tree = make_skewed_tree(node_class, size)
+        start = time.perf_counter()
+        if operation == "add":
+            tree.add(size)  # <- higher than any value, the deepest possible insert
+        elif operation == "remove":
+            tree.remove(size - 1)  # <- the deepest node
+        elif operation == "get_ordered_values":
+            tree.get_ordered_values()
+        else:
+            getattr(tree, operation)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+OPERATIONS = ["add", "remove", "get_ordered_values", "leaf_nodes", "min_value", "max_value"]
+
+
+def main(sizes: typing.Sequence[int] = (100, 200, 400), huge_size: int = 1_000_000):
+    print(f"{'operation':<20}{'size':>10}{'recursive ms':>16}{'iterative ms':>16}")
+    for size in sizes:
+        for operation in OPERATIONS:
+            recursive_ms = measure(RecursiveBinarySearchTreeNode, size, operation)
+            iterative_ms = measure(BinarySearchTreeNode, size, operation)
+            print(f"{operation:<20}{size:>10}{recursive_ms:>16.3f}{iterative_ms:>16.3f}")
+
+    # Recursive cached properties take two frames per level, 500 levels is already too much for them.
+    # Far beyond the recursion limit, only the iterative engine can go here
+    print(f"\nskewed tree of {huge_size} values, recursion limit is {sys.getrecursionlimit()}")
+    for operation in OPERATIONS:
+        iterative_ms = measure(BinarySearchTreeNode, huge_size, operation, repeat=1)
+        print(f"{operation:<20}{huge_size:>10}{'-':>16}{iterative_ms:>16.3f}")
+
+
+if __name__ == "__main__":
+    main()
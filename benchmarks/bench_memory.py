@@ -0,0 +1,95 @@
+"""
+Bytes per node of the previous __dict__ based node, that cached leaf_nodes lists on every
+node, against the current __slots__ node with lazy caching and the array storage.
+Run it from the repository root:
+
+    python -m benchmarks.bench_memory
+"""
+import functools
+import gc
+import tracemalloc
+import typing
+
+from array_binary_search_tree import ArrayBinarySearchTree
+from binary_search_tree import BinarySearchTreeNode
+from sorters import IntegerSorter
+
+
+class LegacyBinarySearchTreeNode:
+    """Node layout as it was before: attributes in a __dict__, recursive leaf_nodes cached per node"""
+
+    _left_node: "LegacyBinarySearchTreeNode" = None
+    _right_node: "LegacyBinarySearchTreeNode" = None
+
+    def __init__(self, sorter: typing.Type, node_value: typing.Any, level: int = 0):
+        self.sorter = sorter
+        self.node_value = node_value
+        self.level = level
+
+    @classmethod
+    def from_sorted(cls, sorter: typing.Type, values: list) -> "LegacyBinarySearchTreeNode":
+        """
+        Minimum height tree like BinarySearchTreeNode.from_sorted, but with only the attributes
+        this layout had, that one also sets subtree sizes and heights, they would take
+        room in every __dict__ here.
+        """
+        def build(low: int, high: int, level: int) -> typing.Optional["LegacyBinarySearchTreeNode"]:
+            if low >= high:
+                return None
+            middle = (low + high - 1) // 2
+            node = cls(sorter=sorter, node_value=values[middle], level=level)
+            left_node, right_node = build(low, middle, level + 1), build(middle + 1, high, level + 1)
+            if left_node is not None:
+                node._left_node = left_node  # <- unset children stay on the class, not in __dict__
+            if right_node is not None:
+                node._right_node = right_node
+            return node
+
+        return build(0, len(values), 0)
+
+    @functools.cached_property
+    def leaf_nodes(self) -> list:
+        if self._left_node is None and self._right_node is None:
+            return [self]
+        result = []
+        if self._left_node is not None:
+            result += self._left_node.leaf_nodes
+        if self._right_node is not None:
+            result += self._right_node.leaf_nodes
+        return result
+
+    @functools.cached_property
+    def depth(self) -> int:
+        return max(set(i.level for i in self.leaf_nodes))
+
+
+def measure(build: typing.Callable, size: int) -> tuple[float, float]:
+    """
+    Bytes per node right after building a balanced tree of <size> ints,
+    and after reading its depth (which fills the caches).
+    """
+    values = list(range(size))
+    gc.collect()
+    tracemalloc.start()
+    tree = build(IntegerSorter, values)
+    built = tracemalloc.get_traced_memory()[0]
+    tree.depth
+    cached = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return built / size, cached / size
+
+
+def main(size: int = 1_000_000):
+    print(f"tree of {size} ints, bytes per node")
+    print(f"{'node':<30}{'built':>10}{'after depth':>14}")
+    for name, build in (
+        ("before (__dict__)", LegacyBinarySearchTreeNode.from_sorted),
+        ("after (__slots__)", BinarySearchTreeNode.from_sorted),
+        ("array storage", ArrayBinarySearchTree.from_sorted),
+    ):
+        built, cached = measure(build, size)
+        print(f"{name:<30}{built:>10.1f}{cached:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
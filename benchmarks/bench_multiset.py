@@ -0,0 +1,51 @@
+"""
+Counting very repetitive values (HTTP status codes and latencies rounded to the millisecond):
+a regular tree next to a Counter, like we had to do before, against a multiset tree.
+We report the build time, the nodes and the memory each one needs.
+Run it from the repository root:
+
+    python -m benchmarks.bench_multiset
+"""
+import collections
+import gc
+import random
+import time
+import tracemalloc
+
+from make_bst import make_binary_search_tree
+
+
+def measure(build) -> tuple[float, float, object]:
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return elapsed, memory, result
+
+
+def main(size: int = 500_000, seed: int = 0):
+    generator = random.Random(seed)
+    datasets = {
+        "status codes": generator.choices([200, 201, 204, 301, 304, 400, 401, 403, 404, 500, 503], k=size),
+        "latencies ms": [round(generator.lognormvariate(3, 0.8)) for _ in range(size)],
+    }
+    print(f"{size} values per dataset")
+    print(f"{'dataset':<16}{'structure':<20}{'seconds':>10}{'nodes':>10}{'memory MB':>12}")
+    for name, values in datasets.items():
+        def tree_and_counter():
+            return make_binary_search_tree(values=values, balanced=True), collections.Counter(values)
+
+        elapsed, memory, (tree, _) = measure(tree_and_counter)
+        print(f"{name:<16}{'tree + Counter':<20}{elapsed:>10.3f}{sum(tree.level_histogram()):>10}{memory / 2 ** 20:>12.2f}")
+        elapsed, memory, multiset_tree = measure(
+            lambda: make_binary_search_tree(values=values, balanced=True, multiset=True)
+        )
+        nodes = sum(multiset_tree.level_histogram())
+        print(f"{name:<16}{'multiset tree':<20}{elapsed:>10.3f}{nodes:>10}{memory / 2 ** 20:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
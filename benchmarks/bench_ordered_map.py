@@ -0,0 +1,44 @@
+"""
+Ordered index from keys to records: a regular tree next to a dict, like we had to do
+before (range on the tree, then a dict lookup per key), against an ordered map tree
+that keeps the payloads on the nodes.
+Run it from the repository root:
+
+    python -m benchmarks.bench_ordered_map
+"""
+import random
+import time
+
+from make_bst import make_binary_search_tree
+
+
+def main(size: int = 200_000, queries: int = 2000, width: int = 500, seed: int = 0):
+    generator = random.Random(seed)
+    records = {generator.randint(0, size * 10): f"record {index}" for index in range(size)}
+    lows = [generator.randint(0, size * 10) for _ in range(queries)]
+    print(f"{len(records)} records, {queries} range queries {width} keys wide, then {queries} gets")
+    print(f"{'structure':<20}{'range s':>10}{'get s':>10}")
+
+    tree = make_binary_search_tree(values=list(records), balanced=True)
+    start = time.perf_counter()
+    for low in lows:
+        [(key, records[key]) for key in tree.range(low, low + width)]
+    range_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    for low in lows:
+        records.get(low) if low in tree else None  # <- the tree says if it is there, the dict has it
+    print(f"{'tree + dict':<20}{range_seconds:>10.3f}{time.perf_counter() - start:>10.3f}")
+
+    ordered_map = make_binary_search_tree(values=records, balanced=True, ordered_map=True)
+    start = time.perf_counter()
+    for low in lows:
+        list(ordered_map.range_items(low, low + width))
+    range_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    for low in lows:
+        ordered_map.get(low)
+    print(f"{'ordered map':<20}{range_seconds:>10.3f}{time.perf_counter() - start:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
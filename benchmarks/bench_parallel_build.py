@@ -0,0 +1,39 @@
+"""
+Scaling of make_binary_search_tree(workers=N) with 1, 2, 4 and 8 worker processes.
+The speedup is bounded by the CPUs of the machine, and by the parent work that does not
+split: sending chunks to the workers, merging the sorted runs and <from_sorted>.
+Run it from the repository root:
+
+    python -m benchmarks.bench_parallel_build
+"""
+import os
+import random
+import time
+
+from make_bst import make_binary_search_tree
+
+
+def measure(values: list[int], workers: int) -> float:
+    """Wall time of make_binary_search_tree, in seconds"""
+    start = time.perf_counter()
+    if workers == 1:
+        make_binary_search_tree(values=values, bulk_load=True)
+    else:
+        make_binary_search_tree(values=values, workers=workers)
+    return time.perf_counter() - start
+
+
+def main(size: int = 10_000_000, seed: int = 0):
+    generator = random.Random(seed)
+    values = [generator.randint(0, size * 10) for _ in range(size)]
+    print(f"{size} random ints, {os.cpu_count()} CPUs")
+    print(f"{'workers':>8}{'seconds':>12}{'speedup':>10}")
+    baseline = None
+    for workers in (1, 2, 4, 8):
+        elapsed = measure(values, workers)
+        baseline = baseline or elapsed
+        print(f"{workers:>8}{elapsed:>12.3f}{baseline / elapsed:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
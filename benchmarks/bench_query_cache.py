@@ -0,0 +1,46 @@
+"""
+Mostly read workload: the usual whole-tree queries (ordered values both ways, deepest nodes,
+min and max) again and again, with an add every <reads_per_write> rounds.
+We compare the plain tree (per node cached properties) with CachedBinarySearchTree.
+Run it from the repository root:
+
+    python -m benchmarks.bench_query_cache
+"""
+import random
+import time
+
+from cached_binary_search_tree import CachedBinarySearchTree
+from make_bst import make_binary_search_tree
+
+
+def run(tree, rounds: int, reads_per_write: int, new_values: list) -> float:
+    start = time.perf_counter()
+    for round_index in range(rounds):
+        if round_index % reads_per_write == 0:
+            tree.add(new_values[round_index // reads_per_write])
+        tree.get_ordered_values()
+        tree.get_ordered_values(reverse=True)
+        tree.deepest_nodes
+        tree.min_value
+        tree.max_value
+    return time.perf_counter() - start
+
+
+def main(size: int = 20_000, rounds: int = 300, seed: int = 0):
+    generator = random.Random(seed)
+    values = [generator.randint(0, size * 10) for _ in range(size)]
+    new_values = [generator.randint(0, size * 10) for _ in range(rounds)]
+    print(f"{size} random ints, {rounds} rounds of 5 queries")
+    print(f"{'reads per write':<18}{'plain s':>10}{'cached s':>10}{'hit rate':>10}")
+    for reads_per_write in (1, 10, 100):
+        plain_tree = make_binary_search_tree(values=values, balanced=True)
+        plain = run(plain_tree, rounds, reads_per_write, new_values)
+        cached_tree = CachedBinarySearchTree(make_binary_search_tree(values=values, balanced=True))
+        cached = run(cached_tree, rounds, reads_per_write, new_values)
+        info = cached_tree.cache_info()
+        hit_rate = info.hits / (info.hits + info.misses)
+        print(f"{reads_per_write:<18}{plain:>10.3f}{cached:>10.3f}{hit_rate:>10.1%}")
+
+
+if __name__ == "__main__":
+    main()
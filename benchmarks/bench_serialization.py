@@ -0,0 +1,57 @@
+"""
+Start up time of a big tree: build it from the source values, load it from a dump,
+or open the dump with mmap. Run it from the repository root:
+
+    python -m benchmarks.bench_serialization
+"""
+import os
+import random
+import tempfile
+import time
+
+import serialization
+from make_bst import make_binary_search_tree
+
+
+def main(size: int = 1_000_000, seed: int = 0):
+    generator = random.Random(seed)
+    values = [generator.randint(0, size * 10) for _ in range(size)]
+
+    start = time.perf_counter()
+    tree = make_binary_search_tree(values=values)
+    build = time.perf_counter() - start
+
+    file_descriptor, path = tempfile.mkstemp(suffix=".bst")
+    try:
+        with os.fdopen(file_descriptor, "wb") as file:
+            start = time.perf_counter()
+            serialization.dump(tree, file)
+            dump = time.perf_counter() - start
+
+        start = time.perf_counter()
+        with open(path, "rb") as file:
+            serialization.load(file)
+        load = time.perf_counter() - start
+
+        start = time.perf_counter()
+        with serialization.MappedBinarySearchTree(path) as mapped_tree:
+            opened = time.perf_counter() - start
+            start = time.perf_counter()
+            for value in values[:10_000]:
+                mapped_tree.contains(value)
+            mapped_queries = time.perf_counter() - start
+
+        file_size = os.path.getsize(path)
+    finally:
+        os.remove(path)
+
+    print(f"tree of {size} random ints, {file_size / size:.1f} bytes per node on disk")
+    print(f"{'build from values':<35}{build:>10.3f} s")
+    print(f"{'dump':<35}{dump:>10.3f} s")
+    print(f"{'load':<35}{load:>10.3f} s")
+    print(f"{'open with mmap':<35}{opened:>10.6f} s")
+    print(f"{'10000 contains on the mmap':<35}{mapped_queries:>10.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Per insert and per lookup cost of a key sorter (case insensitive strings) on regular nodes,
+where every level calls the sorter compare and computes both keys again, against keyed
+nodes, that compute the key once per value and compare the kept keys natively.
+Strings ordered by themselves (StringSorter) are the baseline.
+Run it from the repository root:
+
+    python -m benchmarks.bench_sorter_keys
+"""
+import random
+import string
+import time
+import typing
+
+from binary_search_tree import BinarySearchTreeNode
+from keyed_binary_search_tree import KeyedBinarySearchTreeNode
+from sorters import BaseSorter, KeySorter, StringSorter
+
+
+class CaseInsensitiveSorter(KeySorter):
+    allowed_type = str
+    key = staticmethod(str.casefold)
+
+
+def measure(node_class: typing.Type[BinarySearchTreeNode], sorter: typing.Type[BaseSorter], values: list[str]):
+    """Average cost of one insert through add_multiple and of one contains, in microseconds"""
+    root = node_class(sorter=sorter, node_value=values[0])
+    start = time.perf_counter()
+    root.add_multiple(values[1:], trusted=True)
+    insert = (time.perf_counter() - start) / (len(values) - 1) * 1_000_000
+    start = time.perf_counter()
+    for _value in values:
+        root.contains(_value)
+    lookup = (time.perf_counter() - start) / len(values) * 1_000_000
+    return insert, lookup
+
+
+def main(size: int = 100_000, seed: int = 0):
+    generator = random.Random(seed)
+    values = ["".join(generator.choices(string.ascii_letters, k=12)) for _ in range(size)]
+
+    cases = {
+        "key sorter, regular nodes": (BinarySearchTreeNode, CaseInsensitiveSorter),
+        "key sorter, keyed nodes": (KeyedBinarySearchTreeNode, CaseInsensitiveSorter),
+        "native strings (StringSorter)": (BinarySearchTreeNode, StringSorter),
+    }
+    print(f"{size} random strings of 12 letters, cost per operation")
+    print(f"{'':<35}{'insert':>10}{'contains':>12}")
+    for name, (node_class, sorter) in cases.items():
+        insert, lookup = measure(node_class, sorter, values)
+        print(f"{name:<35}{insert:>7.2f} us{lookup:>9.2f} us")
+
+
+if __name__ == "__main__":
+    main()
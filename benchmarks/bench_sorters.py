@@ -0,0 +1,81 @@
+"""
+Per insert cost of validating on every comparison (is_lower_than) against validating
+once at the tree boundary and comparing without validation on the way down (natively for ints,
+with the trusted three-way compare for other sorters).
+Run it from the repository root:
+
+    python -m benchmarks.bench_sorters
+"""
+import random
+import time
+import timeit
+import typing
+
+from binary_search_tree import BinarySearchTreeNode
+from errors import EqualValuesException
+from sorters import IntegerSorter
+
+
+class ValidatingBinarySearchTreeNode(BinarySearchTreeNode):
+    """Insertion as it was before, every comparison validates both values again"""
+
+    __slots__ = ()
+
+    def _insert(self, value: typing.Any) -> typing.Optional[list["BinarySearchTreeNode"]]:
+        path = []
+        node = self
+        try:
+            while True:
+                path.append(node)
+                side = (
+                    "_left_node"
+                    if self.sorter.is_lower_than(value, node.node_value)
+                    else "_right_node"
+                )
+                side_node = getattr(node, side)
+                if side_node is None:
+                    setattr(
+                        node,
+                        side,
+                        type(self)(sorter=self.sorter, node_value=value, level=node.level + 1),
+                    )
+                    return path
+                node = side_node
+        except EqualValuesException:
+            return None
+
+
+def measure(node_class: typing.Type[BinarySearchTreeNode], values: list[int]) -> float:
+    """Average cost of one insert through add_multiple, in microseconds"""
+    root = node_class(sorter=IntegerSorter, node_value=values[0])
+    start = time.perf_counter()
+    root.add_multiple(values[1:])
+    return (time.perf_counter() - start) / (len(values) - 1) * 1_000_000
+
+
+def main(size: int = 100_000, seed: int = 0):
+    values = list(range(size))
+    random.Random(seed).shuffle(values)
+
+    before = measure(ValidatingBinarySearchTreeNode, values)
+    after = measure(BinarySearchTreeNode, values)
+    print(f"add_multiple of {size} random ints, cost per insert")
+    print(f"{'validate on every comparison':<35}{before:>10.2f} us")
+    print(f"{'validate once, trusted compare':<35}{after:>10.2f} us")
+    print(f"{'speedup':<35}{before / after:>10.1f} x")
+
+    # A single comparison in isolation, where the validation overhead really shows
+    number = 1_000_000
+    comparisons = {
+        "is_lower_than (validating)": lambda: IntegerSorter.is_lower_than(1, 2),
+        "compare (trusted)": lambda: IntegerSorter.compare(1, 2),
+        "native (what trees do for ints)": lambda: 1 < 2,
+    }
+    print("\ncost per comparison")
+    for name, statement in comparisons.items():
+        cost = timeit.timeit(statement, number=number) / number * 1_000_000_000
+        print(f"{name:<35}{cost:>10.1f} ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Build a tree from a typed buffer and look up a batch of keys, value by value against
+the bulk path (numpy when it is installed, sorted() and bisect otherwise).
+Run it from the repository root:
+
+    python -m benchmarks.bench_vectorized
+"""
+import array
+import random
+import time
+import typing
+
+from make_bst import make_binary_search_tree
+from vectorized import numpy
+
+
+def measure(function: typing.Callable, *args) -> float:
+    """Wall time of a single call, in seconds"""
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+def main(size: int = 1_000_000, seed: int = 0):
+    generator = random.Random(seed)
+    values = array.array("q", (generator.randint(0, size * 10) for _ in range(size)))
+    queries = array.array("q", (generator.randint(0, size * 10) for _ in range(size)))
+    if numpy is not None:
+        values, queries = numpy.asarray(values), numpy.asarray(queries)
+
+    print(f"{size} int64 keys, bulk path with {'numpy' if numpy is not None else 'bisect'}")
+    build_loop = measure(make_binary_search_tree, values.tolist())
+    build_bulk = measure(make_binary_search_tree, values)
+    print(f"{'build, add one by one':<35}{build_loop:>10.3f} s")
+    print(f"{'build, sort + from_sorted':<35}{build_bulk:>10.3f} s")
+
+    tree = make_binary_search_tree(values=values)
+    query_list = queries.tolist()
+    contains_loop = measure(lambda: [tree.contains(i) for i in query_list])
+    tree.contains_many(queries[:1])  # <- the ordered snapshot is built once, then cached
+    contains_bulk = measure(tree.contains_many, queries)
+    rank_bulk = measure(tree.rank_many, queries)
+    print(f"{'contains, one by one':<35}{contains_loop:>10.3f} s")
+    print(f"{'contains_many':<35}{contains_bulk:>10.3f} s")
+    print(f"{'rank_many':<35}{rank_bulk:>10.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,14 @@
-import functools
+import math
+import operator
 import typing
 
-from sorters import BaseSorter
-from errors import EqualValuesException, InvalidTypeException, RootNodeDeleteException
-from cache_manager import CacheManager
+from sorters import BaseSorter, EQUAL, HIGHER, LOWER
+from errors import InvalidTypeException, RootNodeDeleteException, SorterMismatchException
+from cache_manager import CacheManager, cached_property
+import vectorized
+
+_END = object()  # <- marks the end of an ordered values iterator (see <_merge_values>)
+_node_value = operator.attrgetter("node_value")
 
 
 class BinarySearchTreeNode(CacheManager):
@@ -17,8 +22,13 @@ class BinarySearchTreeNode(CacheManager):
                 43         # root node
                /  \
              21    89      # child nodes
+
+    Nodes use __slots__ instead of a __dict__, big trees have millions of them.
+    Subclasses should declare their own __slots__ too, or they get a __dict__ back.
     """
 
+    __slots__ = ("sorter", "node_value", "level", "_left_node", "_right_node", "_size", "_height")
+
     def __init__(
         self,
         sorter: typing.Type[BaseSorter],
@@ -28,15 +38,81 @@ class BinarySearchTreeNode(CacheManager):
         self.sorter = sorter
         self.node_value = node_value
         self.level = level
+        self._left_node: typing.Optional["BinarySearchTreeNode"] = None
+        self._right_node: typing.Optional["BinarySearchTreeNode"] = None
+        self._size = 1  # <- number of values in the subtree of this node, itself included
+        self._height = 0  # <- number of jumps to the deepest leaf below this node
+        self._cache = None  # <- cached properties, created on first read (see CacheManager)
+
+    @classmethod
+    def from_sorted(
+            cls,
+            sorter: typing.Type[BaseSorter],
+            values: typing.Sequence[typing.Any],
+    ) -> "BinarySearchTreeNode":
+        r"""
+        Build a minimum height tree in O(n) from values already ordered by the sorter
+        and without duplicates (see BaseSorter.sort_unique), no comparison is needed.
+        The middle value is the root, and each half builds the same way its side,
+        so a subtree of k values is as high as it can be with k values: k.bit_length() - 1.
+
+        [1, 2, 3, 4, 5, 6, 7]  ->          4
+                                         /   \
+                                        2     6
+                                       / \   / \
+                                      1   3 5   7
+        """
+        middle = (len(values) - 1) // 2
+        root_node = cls(sorter=sorter, node_value=values[middle])
+        root_node._size = len(values)
+        root_node._height = len(values).bit_length() - 1
+
+        # Every item is a node that still has to build its children, with the bounds
+        # of its values slice: values[low:high], where the node is values[middle].
+        stack = [(root_node, 0, middle, len(values))]
+        while stack:
+            node, low, middle, high = stack.pop()
+            if low < middle:
+                left_middle = (low + middle - 1) // 2
+                node._left_node = cls(
+                    sorter=sorter, node_value=values[left_middle], level=node.level + 1
+                )
+                node._left_node._size = middle - low
+                node._left_node._height = (middle - low).bit_length() - 1
+                stack.append((node._left_node, low, left_middle, middle))
+            if middle + 1 < high:
+                right_middle = (middle + high) // 2
+                node._right_node = cls(
+                    sorter=sorter, node_value=values[right_middle], level=node.level + 1
+                )
+                node._right_node._size = high - middle - 1
+                node._right_node._height = (high - middle - 1).bit_length() - 1
+                stack.append((node._right_node, middle + 1, right_middle, high))
 
-    _left_node: "BinarySearchTreeNode" = None
-    _right_node: "BinarySearchTreeNode" = None
+        return root_node
 
     @property
     def is_root(self) -> bool:
         return self.level == 0
 
-    @functools.cached_property
+    def __len__(self) -> int:
+        """Number of values on the tree (below this node), kept up to date on every change"""
+        return self._size
+
+    @staticmethod
+    def _height_of(node: typing.Optional["BinarySearchTreeNode"]) -> int:
+        return -1 if node is None else node._height
+
+    def _update_subtree_stats(self):
+        """Recompute what the node knows about its subtree (size and height) from its children"""
+        self._size = (
+            1
+            + (self._left_node._size if self._left_node is not None else 0)
+            + (self._right_node._size if self._right_node is not None else 0)
+        )
+        self._height = 1 + max(self._height_of(self._left_node), self._height_of(self._right_node))
+
+    @cached_property
     def leaf_nodes(self) -> list[typing.Any]:
         """
         Any node that does not have any child is considered a leaf node.
@@ -49,17 +125,21 @@ class BinarySearchTreeNode(CacheManager):
                         /
                        60  <- leaf
         """
-        if self._left_node is None and self._right_node is None:
-            return [self]  # <- no children so is a leaf node, we return a list to merge recursively
-
         result = []
-        if self._left_node is not None:
-            result += self._left_node.leaf_nodes
-        if self._right_node is not None:
-            result += self._right_node.leaf_nodes
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if node._left_node is None and node._right_node is None:
+                result.append(node)  # <- no children so is a leaf node
+                continue
+            # Right side goes first into the stack, so left side leaves come out first
+            if node._right_node is not None:
+                stack.append(node._right_node)
+            if node._left_node is not None:
+                stack.append(node._left_node)
         return result
 
-    @functools.cached_property
+    @cached_property
     def depth(self):
         """
         The depth is the highest level that any node has, or we can also say,
@@ -70,10 +150,12 @@ class BinarySearchTreeNode(CacheManager):
                                 /
                                13               <- level 2, so depth = 2
 
+        Every node keeps the height of its subtree up to date, so it is just
+        our level plus our height, no need to look at the leaves.
         """
-        return max(set(i.level for i in self.leaf_nodes))
+        return self.level + self._height
 
-    @functools.cached_property
+    @cached_property
     def deepest_nodes(self) -> tuple[int, list]:
         """
         Deepest nodes are nodes that are at the same level of tree depth (see depth property),
@@ -83,24 +165,68 @@ class BinarySearchTreeNode(CacheManager):
         Returns a tuple with 2 items:
         int:            depth of whole tree
         [values...]     deepest nodes values
+        We only go down the sides as high as the node minus one, those lead to the deepest
+        nodes, so we visit the paths to them and never the rest of the tree.
+        """
+        result = []
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if node._height == 0:
+                result.append(node.node_value)  # <- the paths we follow end at the deepest level
+                continue
+            # Right side goes first into the stack, so left side values come out first
+            for child in (node._right_node, node._left_node):
+                if child is not None and child._height == node._height - 1:
+                    stack.append(child)
+        return self.depth, result
+
+    def level_histogram(self) -> list[int]:
+        r"""
+        Number of nodes on every level below this node (index 0 is this node), a tree made
+        by sorted values has one per level, a minimum height one doubles them every level:
+        Example:                    77          -> [1, 2, 1]
+                                   /  \
+                                 55    94
+                                /
+                               13
+        Handy as a skew metric, it goes through every node, so it costs O(n).
         """
-        return self.depth, [
-            i.node_value for i in self.leaf_nodes if i.level == self.depth
-        ]
+        histogram = []
+        level_nodes = [self]
+        while level_nodes:
+            histogram.append(len(level_nodes))
+            level_nodes = [
+                child
+                for node in level_nodes
+                for child in (node._left_node, node._right_node)
+                if child is not None
+            ]
+        return histogram
 
-    @functools.cached_property
+    @cached_property
     def min_value(self):
         """Get the lowest value of whole tree"""
-        if self._left_node is not None:
-            return self._left_node.min_value
-        return self.node_value
+        node = self
+        while node._left_node is not None:
+            node = node._left_node
+        return node.node_value
 
-    @functools.cached_property
+    @cached_property
     def max_value(self):
         """Get the higher value of whole tree"""
-        if self._right_node is not None:
-            return self._right_node.max_value
-        return self.node_value
+        node = self
+        while node._right_node is not None:
+            node = node._right_node
+        return node.node_value
+
+    @cached_property
+    def _sorted_keys(self) -> typing.Any:
+        """
+        Ordered values snapshot for batch lookups (see <contains_many>), it is cleared
+        like any other cached property when the tree below this node changes.
+        """
+        return vectorized.make_sorted_keys(self.get_ordered_values())
 
     def get_ordered_values(self, reverse: bool = False) -> list[typing.Any]:
         """
@@ -109,109 +235,631 @@ class BinarySearchTreeNode(CacheManager):
 
         tree with values = [5, 3, 7, 2, 9, 1] returns [1, 2, 3, 5, 7, 9] (or reverse)
         """
-        result = []
+        return list(self.iter_ordered(reverse=reverse))
 
-        sides_order = ["_left_node", "_right_node"]
+    def iter_ordered(self, reverse: bool = False) -> typing.Iterator[typing.Any]:
+        """
+        Same values than <get_ordered_values> but one by one, we never build the whole list,
+        so reading the first few values is cheap. It only keeps the path to the current node.
+        The tree should not change while we iterate it.
+        """
+        return map(_node_value, self._ordered_nodes(reverse=reverse))
+
+    def _ordered_nodes(self, reverse: bool = False) -> typing.Iterator["BinarySearchTreeNode"]:
+        """Nodes in the order of their values, see <iter_ordered>"""
+        first_side, second_side = "_left_node", "_right_node"
         if reverse:
-            sides_order.reverse()
+            first_side, second_side = second_side, first_side
 
-        first_side_node = getattr(self, sides_order[0], None)
-        if first_side_node is not None:
-            result += first_side_node.get_ordered_values(reverse=reverse)
+        # Explicit stack instead of recursion, so very deep (skewed) trees
+        # don't hit the interpreter recursion limit.
+        stack = []
+        node = self
+        while stack or node is not None:
+            if node is not None:
+                stack.append(node)
+                node = getattr(node, first_side)
+                continue
+            node = stack.pop()
+            yield node
+            node = getattr(node, second_side)
 
-        result.append(self.node_value)
+    def __iter__(self) -> typing.Iterator[typing.Any]:
+        return self.iter_ordered()
 
-        second_side_node = getattr(self, sides_order[1], None)
-        if second_side_node is not None:
-            result += second_side_node.get_ordered_values(reverse=reverse)
+    def __reversed__(self) -> typing.Iterator[typing.Any]:
+        return self.iter_ordered(reverse=True)
 
-        return result
+    def range(
+            self,
+            low: typing.Any = None,
+            high: typing.Any = None,
+            inclusive: typing.Union[bool, tuple[bool, bool]] = True,
+    ) -> typing.Iterator[typing.Any]:
+        """
+        Ordered values between low and high (None means no limit on that side), one by one.
+        inclusive can be a bool for both limits, or a (low, high) tuple of bools.
+        We never go into a side that is out of the limits: if a node is lower than low,
+        its whole left side is lower too. And we stop at the first value higher than high.
+        """
+        return map(_node_value, self._range_nodes(low, high, inclusive))
+
+    def _range_nodes(
+            self,
+            low: typing.Any,
+            high: typing.Any,
+            inclusive: typing.Union[bool, tuple[bool, bool]],
+    ) -> typing.Iterator["BinarySearchTreeNode"]:
+        """Nodes whose values are between low and high, see <range>"""
+        low_inclusive, high_inclusive = (
+            (inclusive, inclusive) if isinstance(inclusive, bool) else inclusive
+        )
+        for limit in (low, high):
+            if limit is not None:
+                self.sorter.validate_value(limit)
+        compare = self.sorter.compare
+        below_low = {LOWER} if low_inclusive else {LOWER, EQUAL}
+        above_high = {HIGHER} if high_inclusive else {HIGHER, EQUAL}
+
+        stack = []
+        node = self
+        while stack or node is not None:
+            if node is not None:
+                if low is not None and compare(node.node_value, low) in below_low:
+                    node = node._right_node  # <- this node and its left side are out
+                    continue
+                stack.append(node)
+                node = node._left_node
+                continue
+            node = stack.pop()
+            if high is not None and compare(node.node_value, high) in above_high:
+                return  # <- every next value is higher
+            yield node
+            node = node._right_node
+
+    def find(self, value: typing.Any) -> typing.Optional["BinarySearchTreeNode"]:
+        """
+        Get the node that holds the value, or None when it is not on the tree.
+        We follow the tree structure, so it costs one comparison per level instead
+        of going through all the values.
+        """
+        self.sorter.validate_value(value)
+        _, found_node, _ = self._search(value)
+        return found_node
+
+    def contains(self, value: typing.Any) -> bool:
+        """Check if the value is on the tree (see <find>)"""
+        return self.find(value) is not None
+
+    def __contains__(self, value: typing.Any) -> bool:
+        return self.contains(value)
+
+    def _closest(self, value: typing.Any, below: bool, inclusive: bool) -> typing.Any:
+        """
+        Closest value below (or above) the given one, None when there is no such value.
+        Every node lower than the value (when looking below) is a candidate, and the
+        next candidates can only be on its right side, so we keep the last one found.
+        Example:                 20         <- floor(17): 20 is higher, go left
+                                /  \
+                              10    30      <- 10 is lower, candidate, go right
+                                \
+                                 15         <- 15 is lower, candidate, no right side -> 15
+        """
+        self.sorter.validate_value(value)
+        compare = self.sorter.compare
+        candidate_result = HIGHER if below else LOWER  # <- value compared with a candidate node
+        towards_value = "_right_node" if below else "_left_node"
+        away_from_value = "_left_node" if below else "_right_node"
+
+        closest_value = None
+        node = self
+        while node is not None:
+            result = compare(value, node.node_value)
+            if result == EQUAL and inclusive:
+                return node.node_value
+            if result == candidate_result:
+                closest_value = node.node_value
+                node = getattr(node, towards_value)
+            else:
+                node = getattr(node, away_from_value)
+        return closest_value
+
+    def floor(self, value: typing.Any) -> typing.Any:
+        """Highest value on the tree that is lower or equal than the given one, or None"""
+        return self._closest(value, below=True, inclusive=True)
+
+    def ceiling(self, value: typing.Any) -> typing.Any:
+        """Lowest value on the tree that is higher or equal than the given one, or None"""
+        return self._closest(value, below=False, inclusive=True)
+
+    def predecessor(self, value: typing.Any) -> typing.Any:
+        """Highest value on the tree that is strictly lower than the given one, or None"""
+        return self._closest(value, below=True, inclusive=False)
+
+    def successor(self, value: typing.Any) -> typing.Any:
+        """Lowest value on the tree that is strictly higher than the given one, or None"""
+        return self._closest(value, below=False, inclusive=False)
+
+    def _count_below(self, value: typing.Any, inclusive: bool) -> int:
+        r"""
+        Number of values on the tree lower than the given one (or equal, when inclusive).
+        Every node keeps the size of its subtree, so when we go right we count the node
+        and its whole left side at once, one comparison per level.
+        Example:                 20  (5)       <- rank(25): higher, 1 + 2 on left side, go right
+                                /  \
+                          (2) 10    30  (2)    <- lower, go left
+                                \   /
+                                15 25          <- equal, count its left side (none) -> 3
+        """
+        self.sorter.validate_value(value)
+        compare = self.sorter.compare
+        count = 0
+        node = self
+        while node is not None:
+            result = compare(value, node.node_value)
+            if result == HIGHER or (result == EQUAL and inclusive):
+                # The node and its left side, everything on the subtree but its right side
+                count += node._size - (node._right_node._size if node._right_node is not None else 0)
+                if result == EQUAL:
+                    return count
+                node = node._right_node
+            elif result == EQUAL:
+                return count + (node._left_node._size if node._left_node is not None else 0)
+            else:
+                node = node._left_node
+        return count
+
+    def rank(self, value: typing.Any) -> int:
+        """
+        Number of values on the tree strictly lower than the given one, which is
+        the position the value has (or would have) on the ordered values.
+        """
+        return self._count_below(value, inclusive=False)
+
+    def select(self, index: int) -> typing.Any:
+        """
+        Value at the given position of the ordered values (0 is the lowest one),
+        negative positions count from the end like on lists. We skip whole sides
+        using their sizes, so it costs O(depth) instead of walking the values.
+        """
+        size = self._size
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("Tree index out of range.")
+
+        node = self
+        while True:
+            left_size = node._left_node._size if node._left_node is not None else 0
+            if index < left_size:
+                node = node._left_node
+                continue
+            # Positions the node and its left side take (more than one with multiset nodes)
+            left_and_node = node._size - (node._right_node._size if node._right_node is not None else 0)
+            if index < left_and_node:
+                return node.node_value
+            index -= left_and_node
+            node = node._right_node
+
+    def count_between(
+            self,
+            low: typing.Any,
+            high: typing.Any,
+            inclusive: typing.Union[bool, tuple[bool, bool]] = True,
+    ) -> int:
+        """
+        Number of values between low and high without going through them (see <range>),
+        inclusive can be a bool for both limits, or a (low, high) tuple of bools.
+        """
+        low_inclusive, high_inclusive = (
+            (inclusive, inclusive) if isinstance(inclusive, bool) else inclusive
+        )
+        count = self._count_below(high, inclusive=high_inclusive) - self._count_below(
+            low, inclusive=not low_inclusive
+        )
+        return max(count, 0)
+
+    def percentile(self, percent: float) -> typing.Any:
+        """
+        Value at the given percentile (0 to 100) using the nearest rank method,
+        it is always a value of the tree, 50 gives the (lower) median.
+        """
+        if not 0 <= percent <= 100:
+            raise ValueError("Percentile must be between 0 and 100.")
+        rank = math.ceil(percent / 100 * self._size)
+        return self.select(max(rank, 1) - 1)
+
+    def _validate_many(self, values: typing.Iterable) -> typing.Iterable:
+        if vectorized.is_buffer(values):
+            vectorized.validate_buffer(values, self.sorter)
+            return values
+        values = list(values)
+        for _value in values:
+            self.sorter.validate_value(_value)
+        return values
+
+    def contains_many(self, values: typing.Iterable) -> typing.Any:
+        """
+        <contains> for a batch of values, we search them all at once on a snapshot of the
+        ordered values (binary search in C with numpy), instead of walking down per value.
+        Returns a numpy array of bools when numpy is installed, a list otherwise.
+        The first call after a change pays for the snapshot, O(n). Only int and float
+        trees take the snapshot, the others search value by value and give a list.
+        """
+        values = self._validate_many(values)
+        if not vectorized.supports_sorter(self.sorter):
+            return [self.contains(_value) for _value in values]
+        return vectorized.contains_many(self._sorted_keys, values)
+
+    def rank_many(self, values: typing.Iterable) -> typing.Any:
+        """<rank> for a batch of values, the same way as <contains_many>"""
+        values = self._validate_many(values)
+        if not vectorized.supports_sorter(self.sorter):
+            return [self.rank(_value) for _value in values]
+        return vectorized.rank_many(self._sorted_keys, values)
 
     def add(
             self,
             value: typing.Any,
-            bypass_cache_clear: bool = False,  # <- when we use <add_multiple> calls at the end only.
-    ):
+            bypass_cache_clear: bool = False,  # <- the caller takes care of clearing the path cache.
+            trusted: bool = False,  # <- value was already validated, see <add_multiple>.
+    ) -> typing.Optional[list["BinarySearchTreeNode"]]:
         """
         Add a value to tree, we should do it from root only, value placement and validation
         will be resolved by self sorter.
         When we add a new value, the root check if is lower or higher using sorter,
-        then check if there's already a child node, if is, call the child add method
-        and the rest is the same.
+        then check if there's already a child node, if is, we move down to it
+        and the rest is the same (a loop, not recursion, so skewed trees can be deep).
         Example:               50           <- we add 59, is higher so put to right, there
-                              /   \n           is already a node, so we call <add> from it.
+                              /   \n           is already a node, so we move down to it.
                             25     76       <- is lower, we put on left and there is no node.
                                   /
                                 59          <- ends here
+        With bypass_cache_clear=True nothing is cleared and we give back the nodes whose
+        cached properties got stale (None when nothing changed), for the caller to clear
+        them with <clear_cached_nodes>, once for many adds:
+
+            dirty_nodes = tree.add(5, bypass_cache_clear=True) or []
+            tree.clear_cached_nodes(dirty_nodes)
         """
-        try:
-            # Get the side destination for this value
-            side = (
-                "_left_node"
-                if self.sorter.is_lower_than(value, self.node_value)
-                else "_right_node"
-            )
-            side_node = getattr(self, side, None)
+        if not trusted:
+            self.sorter.validate_value(value)
 
-            if side_node is not None:
-                side_node.add(
-                    value
-                )  # <- We already have a node on the side, so we call its own add method
-            else:
-                # In case we don't have a node, we create one with new value
-                created_node = BinarySearchTreeNode(
-                    sorter=self.sorter,
-                    node_value=value,
-                    level=self.level + 1,
-                )
-                setattr(self, side, created_node)  # <- put the node in a side of parent
+        path = self._insert(value)
+        if bypass_cache_clear:
+            return path
+        if path is not None:
+            self.clear_cached_nodes(path)
 
-        except EqualValuesException:
-            # We do nothing for now
-            return
-        finally:
-            self.clear_cached_properties()
+    def _search(
+            self, value: typing.Any
+    ) -> tuple[list["BinarySearchTreeNode"], typing.Optional["BinarySearchTreeNode"], typing.Optional[str]]:
+        """
+        Walk down from this node looking for the value, it returns a tuple with:
+        [nodes...]      the nodes we went through before finding it (or falling off the tree)
+        node / None     the node that holds the value, None when it is not on the tree
+        side / None     side of the last path node where the value is (or should be)
+        The value should be validated already. When the sorter order is the type own order
+        we compare values directly, otherwise we call the sorter three-way compare per level.
+        Values of an allowed type that still can not be compared (a naive datetime against
+        an aware one, tuples with different item types) raise InvalidTypeException.
+        """
+        path = []
+        side = None
+        node = self
+        if self.sorter.native_order:
+            try:
+                while node is not None:
+                    node_value = node.node_value
+                    if value == node_value:
+                        return path, node, side
+                    path.append(node)
+                    if value < node_value:
+                        side, node = "_left_node", node._left_node
+                    else:
+                        side, node = "_right_node", node._right_node
+            except TypeError:
+                raise InvalidTypeException(f"We can not compare {value!r} and {node.node_value!r}.")
+        else:
+            compare = self.sorter.compare
+            while node is not None:
+                result = compare(value, node.node_value)
+                if result == EQUAL:
+                    return path, node, side
+                path.append(node)
+                side = "_left_node" if result == LOWER else "_right_node"
+                node = getattr(node, side)
+        return path, None, side
 
-    def remove(self, value: typing.Any):
+    def _insert(self, value: typing.Any) -> typing.Optional[list["BinarySearchTreeNode"]]:
         """
-        Delete the node that match a certain value and its children,
-        we find the node using the tree structure. We know the path
-        to follow by checking if is lower or higher.
+        Place the value below this node and return the nodes we went through, those are
+        the only ones whose cached properties are not valid anymore.
+        Returns None when the value is already on the tree, so nothing changed.
         """
-        try:
-            if (
-                value == self.node_value
-            ):  # <- The root node is the only one we cannot delete
-                if self.is_root:
-                    raise RootNodeDeleteException("Cannot remove root node.")
-
-            side = (
-                "_left_node"
-                if self.sorter.is_lower_than(value, self.node_value)
-                else "_right_node"
-            )
-            side_node = getattr(self, side, None)
+        path, found_node, side = self._search(value)
+        if found_node is not None:
+            return self._add_existing(path, found_node)
+
+        # We fell off the tree on a side of the last node, we create one with new value there
+        created_node = type(self)(
+            sorter=self.sorter,
+            node_value=value,
+            level=path[-1].level + 1,
+        )
+        return self._attach(path, side, created_node)
+
+    def _attach(
+            self, path: list["BinarySearchTreeNode"], side: str, created_node: "BinarySearchTreeNode"
+    ) -> list["BinarySearchTreeNode"]:
+        """
+        Put a new leaf on the side of the last path node (where <_search> fell off the tree),
+        and update what the path nodes know about their subtrees. Returns the path.
+        """
+        setattr(path[-1], side, created_node)  # <- put the node in a side of parent
+        child_height = 0
+        for _node in reversed(path):
+            _node._size += 1
+            if _node._height <= child_height:
+                _node._height = child_height + 1  # <- the new node made this side higher
+            child_height = _node._height
+        return path
 
-            if side_node is not None:
-                if side_node.node_value == value:
-                    setattr(self, side, None)
-                    return True
+    def _add_existing(
+            self, path: list["BinarySearchTreeNode"], node: "BinarySearchTreeNode"
+    ) -> typing.Optional[list["BinarySearchTreeNode"]]:
+        """
+        The value we add is already on the node (path goes down to it), values are unique
+        so nothing changes and we return None. Multiset nodes count it instead.
+        """
+        return None
+
+    def _remove_existing(self, path: list["BinarySearchTreeNode"], node: "BinarySearchTreeNode") -> bool:
+        """
+        Called when we are about to take the node out (path goes down to it). Returns True
+        when the node should stay, multiset nodes only drop a copy while they have more.
+        """
+        return False
+
+    @staticmethod
+    def _shift_levels(node: typing.Optional["BinarySearchTreeNode"], delta: int):
+        """
+        When a whole subtree moves up or down, every node inside it changes
+        its level, and cached properties that depend on levels are no longer valid.
+        """
+        stack = [node] if node is not None else []
+        while stack:
+            current = stack.pop()
+            current.level += delta
+            current.clear_cached_properties()
+            if current._left_node is not None:
+                stack.append(current._left_node)
+            if current._right_node is not None:
+                stack.append(current._right_node)
+
+    def _take_value(self, other: "BinarySearchTreeNode"):
+        """Hold the value of other node, which is about to leave the tree"""
+        self.node_value = other.node_value
 
-                side_node.remove(value)
+    def _remove(self, value: typing.Any) -> typing.Optional[list["BinarySearchTreeNode"]]:
+        r"""
+        Take out only the node that holds the value, and return the nodes whose subtree
+        changed (see <_insert>), or None when the value is not on the tree.
+        A node with one child (or none) is replaced by it, the child subtree moves up a level.
+        A node with two children takes the value of its in-order successor, the lowest value
+        of its right side, which never has a left child, so we remove that one instead.
+        Example:               50                          62
+                              /   \                        /   \
+                            25     75     remove 50 ->   25     75
+                                  /  \                          \
+                                62    87                         87
+        The node we start from never leaves, when it is the one to remove, it takes
+        the value and the children of its only child, so the root object is always the root.
+        """
+        path, node, side = self._search(value)
+        if node is None:
+            return None
+        if self._remove_existing(path, node):
+            path.append(node)
+            return path  # <- one of its copies went, the node stays
+
+        if node._left_node is not None and node._right_node is not None:
+            path.append(node)
+            side, successor = "_right_node", node._right_node
+            while successor._left_node is not None:
+                path.append(successor)
+                side, successor = "_left_node", successor._left_node
+            node._take_value(successor)
+            node = successor
+
+        child = node._left_node if node._left_node is not None else node._right_node
+        if path:
+            setattr(path[-1], side, child)
+            self._shift_levels(child, -1)
+        elif child is None:
+            raise RootNodeDeleteException("Cannot remove the last value of the tree.")
+        else:
+            node._take_value(child)
+            node._left_node, node._right_node = child._left_node, child._right_node
+            self._shift_levels(node._left_node, -1)
+            self._shift_levels(node._right_node, -1)
+            path.append(node)
+
+        for _node in reversed(path):
+            _node._update_subtree_stats()
+        return path
+
+    def remove(self, value: typing.Any) -> bool:
+        """
+        Delete the node that match a certain value, the rest of values stay on the tree.
+        We find the node using the tree structure, so it costs O(depth).
+        Returns False when the value is not on the tree.
+        """
+        self.sorter.validate_value(value)
+        path = self._remove(value)
+        if path is None:
             return False
+        self.clear_cached_nodes(path)
+        return True
 
+    def remove_multiple(self, values: typing.Iterable) -> int:
+        """
+        Delete multiple values from this node, like <add_multiple> we clear
+        every dirty node only once at the end. Returns how many values were removed.
+        """
+        if not isinstance(values, typing.Iterable):
+            raise InvalidTypeException(
+                "Method remove_multiple accepts iterable data only for input."
+            )
+
+        dirty_nodes = set()
+        removed = 0
+        validate_value = self.sorter.validate_value
+        try:
+            for _value in values:
+                validate_value(_value)
+                path = self._remove(_value)
+                if path is not None:
+                    dirty_nodes.update(path)
+                    removed += 1
         finally:
-            self.clear_cached_properties()
+            self.clear_cached_nodes(dirty_nodes)  # <- also when a value stops us half way
+        return removed
 
-    def add_multiple(self, values: typing.Iterable):
+    def add_multiple(self, values: typing.Iterable, trusted: bool = False):
         """
-        Add multiple values from this node
+        Add multiple values from this node.
+        Values are validated one by one when they get in, with trusted=True
+        the caller guarantees they were already validated (see make_binary_search_tree).
         """
         if not isinstance(values, typing.Iterable):
             raise InvalidTypeException(
                 "Method add_multiple accepts iterable data only for input."
             )
 
-        for _value in values:
-            self.add(_value, bypass_cache_clear=True)
+        if vectorized.is_buffer(values):
+            # Typed buffers are validated at once, sorted and deduplicated in bulk,
+            # and we add them middle first so they don't make a list below a leaf.
+            vectorized.validate_buffer(values, self.sorter)
+            values = vectorized.middle_first(vectorized.sort_unique_buffer(values))
+            trusted = True
+
+        # Paths of many values share most of their nodes (the root is on all of them),
+        # so we collect them and clear every dirty node only once at the end.
+        dirty_nodes = set()
+        validate_value = self.sorter.validate_value
+        try:
+            for _value in values:
+                if not trusted:
+                    validate_value(_value)  # <- once per value, comparisons below trust it
+                path = self._insert(_value)
+                if path is not None:
+                    dirty_nodes.update(path)
+        finally:
+            self.clear_cached_nodes(dirty_nodes)  # <- also when a value stops us half way
+
+    def _check_same_sorter(self, other: "BinarySearchTreeNode"):
+        if other.sorter is not self.sorter:
+            raise SorterMismatchException(
+                f"Cannot combine a {self.sorter.__name__} tree with a {other.sorter.__name__} one."
+            )
+
+    def _merge_values(
+            self,
+            other: "BinarySearchTreeNode",
+            only_self: bool,
+            both: bool,
+            only_other: bool,
+    ) -> list[typing.Any]:
+        """
+        Walk the ordered values of both trees at the same time, like the merge step of
+        merge sort, and keep the values that are only on self, on both, or only on other.
+        Each value is compared once, so it costs O(n + m) and the result is already
+        ordered and without duplicates, ready for <from_sorted>.
+        """
+        self._check_same_sorter(other)
+        compare = self.sorter.compare
+        result = []
+        self_values, other_values = iter(self), iter(other)
+        self_value = next(self_values, _END)
+        other_value = next(other_values, _END)
+        while self_value is not _END and other_value is not _END:
+            comparison = compare(self_value, other_value)
+            if comparison == LOWER:
+                if only_self:
+                    result.append(self_value)
+                self_value = next(self_values, _END)
+            elif comparison == HIGHER:
+                if only_other:
+                    result.append(other_value)
+                other_value = next(other_values, _END)
+            else:
+                if both:
+                    result.append(self_value)  # <- equal values, self one wins
+                self_value = next(self_values, _END)
+                other_value = next(other_values, _END)
+
+        # One of them ran out, the rest of the other one has no pair
+        if only_self and self_value is not _END:
+            result.append(self_value)
+            result.extend(self_values)
+        if only_other and other_value is not _END:
+            result.append(other_value)
+            result.extend(other_values)
+        return result
+
+    def _from_sorted_or_none(self, values: list[typing.Any]) -> typing.Optional["BinarySearchTreeNode"]:
+        """A tree of the same class than self, or None when there are no values for it"""
+        if not values:
+            return None
+        return type(self).from_sorted(sorter=self.sorter, values=values)
+
+    def union(self, other: "BinarySearchTreeNode") -> "BinarySearchTreeNode":
+        """
+        New minimum height tree with the values of both trees, built in O(n + m)
+        instead of adding the values of one tree to the other one by one.
+        """
+        return self._from_sorted_or_none(
+            self._merge_values(other, only_self=True, both=True, only_other=True)
+        )
+
+    def intersection(self, other: "BinarySearchTreeNode") -> typing.Optional["BinarySearchTreeNode"]:
+        """New tree with the values that are on both trees, or None when there are none"""
+        return self._from_sorted_or_none(
+            self._merge_values(other, only_self=False, both=True, only_other=False)
+        )
+
+    def difference(self, other: "BinarySearchTreeNode") -> typing.Optional["BinarySearchTreeNode"]:
+        """New tree with the values of self that are not on other, or None when there are none"""
+        return self._from_sorted_or_none(
+            self._merge_values(other, only_self=True, both=False, only_other=False)
+        )
+
+    def merge(self, other: "BinarySearchTreeNode"):
+        """
+        Add the values of other tree to this one, like <union> but in place: this node
+        takes the value and the children of the union root, so references to it are
+        still valid. Call it from the root, we don't update the nodes above this one.
+        """
+        self._take_tree(self.union(other))
+
+    def _take_tree(self, root_node: "BinarySearchTreeNode"):
+        """This node takes the value and the children of the root of other tree, see <merge>"""
+        self._take_value(root_node)
+        self._left_node, self._right_node = root_node._left_node, root_node._right_node
+        if self.level:
+            self._shift_levels(self._left_node, self.level)
+            self._shift_levels(self._right_node, self.level)
+        self._update_subtree_stats()
         self.clear_cached_properties()
+
+    def split(
+            self, value: typing.Any
+    ) -> tuple[typing.Optional["BinarySearchTreeNode"], typing.Optional["BinarySearchTreeNode"]]:
+        """
+        Two new trees, one with the values lower than the given value, and other one with
+        the rest (higher or equal), None for a side without values. This tree does not change.
+        """
+        index = self.rank(value)
+        values = self.get_ordered_values()
+        return self._from_sorted_or_none(values[:index]), self._from_sorted_or_none(values[index:])
@@ -1,22 +1,77 @@
-import functools
+import typing
+
+
+class cached_property:
+    """
+    Same idea as functools.cached_property, compute once and keep the value, but it works
+    with __slots__ classes: values are stored in the "_cache" dict of the instance, which
+    is created only when some property is actually read (see CacheManager).
+    """
+
+    def __init__(self, func: typing.Callable):
+        self.func = func
+        self.attribute_name = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner: typing.Type, name: str):
+        self.attribute_name = name
+
+    def __get__(self, instance: typing.Optional["CacheManager"], owner: typing.Type = None):
+        if instance is None:
+            return self
+
+        cache = instance._cache
+        if cache is None:
+            cache = instance._cache = {}  # <- first cached value of this instance
+        try:
+            return cache[self.attribute_name]
+        except KeyError:
+            value = cache[self.attribute_name] = self.func(instance)
+            return value
 
 
 class CacheManager:
     """
-    The goal of this class is to provide some useful functools cache compatible tricks
+    The goal of this class is to provide some useful cache tricks for classes
+    that use the <cached_property> decorator above.
     """
 
+    __slots__ = ("_cache",)
+
+    # Names of every cached_property of the class, we collect them once
+    # when the class is created instead of scanning dir() on every clear.
+    _cached_properties: tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._cached_properties = tuple(
+            _attribute
+            for _attribute in dir(cls)
+            if isinstance(getattr(cls, _attribute, None), cached_property)
+        )
+
     def clear_cached_properties(self, properties: list[str] = None):
         """
-        Any property that has functools.cached_property decorator will be forced to refresh its data
-        by settings it to None.
+        Any property that has cached_property decorator will be forced to refresh its data
+        by removing its stored value.
+        """
+        if self._cache is None:
+            return  # <- nothing was read since last clear
+
+        if properties is None:
+            self._cache = None
+            return
+
+        for _attribute in self._cached_properties:
+            if _attribute in properties:
+                self._cache.pop(_attribute, None)  # <- Then delete the actual value
+
+    @staticmethod
+    def clear_cached_nodes(nodes: typing.Iterable["CacheManager"]):
+        """
+        Clear cached properties of given nodes only. When a value is added or removed
+        just the nodes on its path know about it, the rest of the cache is still right.
         """
-        attributes = [i for i in dir(type(self))]
-        if properties is not None:
-            attributes = [i for i in attributes if i in properties]
-
-        for _attribute in attributes:
-            if isinstance(
-                    getattr(type(self), _attribute), functools.cached_property
-            ):  # <- check if is a cached_property
-                vars(self).pop(_attribute, None)  # <- Then delete the actual value
+        for _node in nodes:
+            if _node._cache is not None:
+                _node._cache = None
@@ -0,0 +1,153 @@
+import collections
+import functools
+import typing
+
+from binary_search_tree import BinarySearchTreeNode
+from errors import InvalidStorageException
+from persistent_binary_search_tree import PersistentBinarySearchTreeNode
+
+CacheInfo = collections.namedtuple("CacheInfo", ["hits", "misses", "evictions", "maxsize", "currsize"])
+
+
+class QueryCache:
+    """
+    Bounded cache of query results, the least recently used one goes when it is full.
+    Results belong to a version of the tree: the first lookup with a newer version
+    drops every result of the old one.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        self.maxsize = maxsize
+        self.version = 0
+        self.hits = self.misses = self.evictions = 0
+        self._results: collections.OrderedDict = collections.OrderedDict()
+
+    def get(self, key: typing.Hashable, version: int, compute: typing.Callable) -> typing.Any:
+        """Result for the key at this version, computing (and keeping) it when we don't have it"""
+        if version != self.version:
+            self._results.clear()
+            self.version = version
+        try:
+            result = self._results[key]
+        except KeyError:
+            pass
+        else:
+            self.hits += 1
+            self._results.move_to_end(key)
+            return result
+
+        self.misses += 1
+        result = self._results[key] = compute()
+        if len(self._results) > self.maxsize:
+            self._results.popitem(last=False)
+            self.evictions += 1
+        return result
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.evictions, self.maxsize, len(self._results))
+
+    def clear(self):
+        self._results.clear()
+        self.hits = self.misses = self.evictions = 0
+
+
+def _copy_lists(result: typing.Any) -> typing.Any:
+    """Copy of the lists of a kept result (deepest_nodes has one inside a tuple), so callers can change them"""
+    if isinstance(result, list):
+        return list(result)
+    if isinstance(result, tuple) and any(isinstance(item, list) for item in result):
+        return tuple(_copy_lists(item) for item in result)
+    return result
+
+
+class CachedBinarySearchTree:
+    """
+    Wrapper that keeps the results of the queries we read again and again between
+    changes, keyed by query name and arguments, in a single bounded LRU cache for the
+    whole tree (cached properties of the nodes are per node and have no bound).
+    Every change through the wrapper that changes the number of values bumps the tree
+    version, which makes every kept result stale at once. Change the tree through the
+    wrapper only, changes made to the wrapped tree directly are not seen.
+
+    Results we keep are shared between calls, so lists come as a new copy on every call.
+    Persistent trees are not accepted, their changes give back a new root that we would lose.
+    """
+
+    # Queries we cache, properties are keyed by their name only
+    cached_properties = frozenset({"depth", "deepest_nodes", "min_value", "max_value"})
+    cached_methods = frozenset({
+        "get_ordered_values", "contains", "floor", "ceiling", "predecessor", "successor",
+        "rank", "select", "count_between", "percentile", "level_histogram", "count",
+    })
+    write_methods = frozenset({"add", "add_multiple", "remove", "remove_multiple", "merge"})
+
+    def __init__(self, tree: BinarySearchTreeNode, maxsize: int = 128):
+        if isinstance(tree, PersistentBinarySearchTreeNode):
+            raise InvalidStorageException("Persistent trees can not be wrapped, changes give a new root.")
+        self.tree = tree
+        self.version = 0
+        self.cache = QueryCache(maxsize=maxsize)
+
+    def __getattr__(self, name: str) -> typing.Any:
+        if name in self.cached_properties:
+            return _copy_lists(self.cache.get((name,), self.version, lambda: getattr(self.tree, name)))
+        if name in self.cached_methods:
+            return self._cached_method(name)
+        if name in self.write_methods:
+            return self._write_method(name)
+        raise AttributeError(f"{type(self).__name__} has no attribute {name}.")
+
+    def _cached_method(self, name: str, method: typing.Optional[typing.Callable] = None) -> typing.Callable:
+        method = method or getattr(self.tree, name)
+
+        @functools.wraps(method)
+        def cached_method(*args, **kwargs):
+            # 1 and 1.0 are the same dict key, but only one of them is valid on the tree
+            key = (
+                name,
+                args,
+                tuple(map(type, args)),
+                tuple(sorted((keyword, value, type(value)) for keyword, value in kwargs.items())),
+            )
+            try:
+                hash(key)
+            except TypeError:
+                return method(*args, **kwargs)  # <- lists and such as arguments, not cached
+            return _copy_lists(self.cache.get(key, self.version, lambda: method(*args, **kwargs)))
+
+        return cached_method
+
+    def _write_method(self, name: str) -> typing.Callable:
+        method = getattr(self.tree, name)
+
+        @functools.wraps(method)
+        def write_method(*args, **kwargs):
+            size = len(self.tree)
+            try:
+                return method(*args, **kwargs)
+            finally:
+                # Adding values already there, or removing missing ones, changes nothing
+                if len(self.tree) != size:
+                    self.version += 1
+
+        return write_method
+
+    def range(self, *args, **kwargs) -> list[typing.Any]:
+        """Same values than the tree <range>, as a list so we can keep it"""
+        def range_list(*range_args, **range_kwargs):
+            return list(self.tree.range(*range_args, **range_kwargs))
+
+        return self._cached_method("range", range_list)(*args, **kwargs)
+
+    def __len__(self) -> int:
+        return len(self.tree)
+
+    def __contains__(self, value: typing.Any) -> bool:
+        return self.contains(value)
+
+    def cache_info(self) -> CacheInfo:
+        """Hits, misses and evictions since the cache was created, like functools.lru_cache"""
+        return self.cache.info()
+
+    def cache_clear(self):
+        self.cache.clear()
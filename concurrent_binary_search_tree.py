@@ -0,0 +1,179 @@
+import contextlib
+import functools
+import threading
+import types
+import typing
+
+from array_binary_search_tree import ArrayBinarySearchTree
+from binary_search_tree import BinarySearchTreeNode
+from errors import InvalidStorageException
+from persistent_binary_search_tree import PersistentBinarySearchTreeNode
+
+
+class ReadWriteLock:
+    """
+    Many readers at the same time, or a single writer alone.
+    A waiting writer stops new readers from getting in, otherwise a steady
+    flow of reads would keep it waiting forever. It is not reentrant.
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = False
+        self._waiting_writers = 0
+
+    def acquire_read(self):
+        with self._condition:
+            while self._writer or self._waiting_writers:
+                self._condition.wait()
+            self._readers += 1
+
+    def release_read(self):
+        with self._condition:
+            self._readers -= 1
+            if not self._readers:
+                self._condition.notify_all()
+
+    def acquire_write(self):
+        with self._condition:
+            self._waiting_writers += 1
+            while self._writer or self._readers:
+                self._condition.wait()
+            self._waiting_writers -= 1
+            self._writer = True
+
+    def release_write(self):
+        with self._condition:
+            self._writer = False
+            self._condition.notify_all()
+
+    @contextlib.contextmanager
+    def read_locked(self):
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextlib.contextmanager
+    def write_locked(self):
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
+
+@functools.lru_cache(maxsize=None)
+def _is_method(tree_class: typing.Type, name: str) -> bool:
+    """
+    Methods are looked up without the lock, only calling them takes it. Anything else
+    (properties, cached properties, node slots) reads the tree, so it takes the lock.
+    """
+    for _class in tree_class.__mro__:
+        if name in _class.__dict__:
+            return isinstance(_class.__dict__[name], types.FunctionType)
+    return False
+
+
+class ConcurrentBinarySearchTree:
+    """
+    Wrapper to share a tree between threads, with the same methods and properties
+    than the tree it wraps. Reads run at the same time, changes run alone.
+    This also keeps cached properties right: a cached property can only be computed
+    under the read lock, so no change can happen in the middle and leave a stale value,
+    and changes clear the caches they touch before any reader gets in again.
+    Two readers may compute the same cached property at once, both get the same value.
+
+    Methods that give back lazy iterators (range, iter_ordered) or nodes (find)
+    would escape the lock, here they give back lists, or are not available.
+    Persistent trees are not accepted, their changes give back a new root that we would
+    lose, and they need no lock anyway: keep a reference to the root you read.
+    """
+
+    # Tree attributes we give access to, all of them under the read lock
+    read_attributes = frozenset({
+        "sorter", "node_value", "depth", "deepest_nodes", "min_value", "max_value",
+        "get_ordered_values", "contains", "floor", "ceiling", "predecessor", "successor",
+        "rank", "select", "count_between", "percentile", "contains_many", "rank_many",
+        "union", "intersection", "difference", "split", "level_histogram", "count", "get",
+    })
+    # Tree methods that change it, all of them under the write lock
+    write_attributes = frozenset({
+        "add", "add_multiple", "remove", "remove_multiple", "merge", "put", "pop",
+    })
+
+    def __init__(self, tree: typing.Union[BinarySearchTreeNode, ArrayBinarySearchTree]):
+        if isinstance(tree, PersistentBinarySearchTreeNode):
+            raise InvalidStorageException("Persistent trees can not be wrapped, changes give a new root.")
+        self._tree = tree
+        self._lock = ReadWriteLock()
+
+    def __getattr__(self, name: str) -> typing.Any:
+        if name in self.read_attributes:
+            locked = self._lock.read_locked
+        elif name in self.write_attributes:
+            locked = self._lock.write_locked
+        else:
+            raise AttributeError(f"{type(self).__name__} has no attribute {name}.")
+
+        if not _is_method(type(self._tree), name):
+            with locked():
+                return getattr(self._tree, name)  # <- properties are computed right here
+
+        method = getattr(self._tree, name)  # <- a bound method, nothing of the tree is read yet
+
+        @functools.wraps(method)
+        def locked_method(*args, **kwargs):
+            with locked():
+                return method(*args, **kwargs)
+
+        return locked_method
+
+    def range(self, *args, **kwargs) -> list[typing.Any]:
+        """Same values than the tree <range>, read at once under the lock"""
+        with self._lock.read_locked():
+            return list(self._tree.range(*args, **kwargs))
+
+    def items(self, reverse: bool = False) -> list[tuple[typing.Any, typing.Any]]:
+        """Same pairs than the ordered map <items>, read at once under the lock"""
+        with self._lock.read_locked():
+            return list(self._tree.items(reverse=reverse))
+
+    def range_items(self, *args, **kwargs) -> list[tuple[typing.Any, typing.Any]]:
+        """Same pairs than the ordered map <range_items>, read at once under the lock"""
+        with self._lock.read_locked():
+            return list(self._tree.range_items(*args, **kwargs))
+
+    def __len__(self) -> int:
+        with self._lock.read_locked():
+            return len(self._tree)
+
+    def __contains__(self, value: typing.Any) -> bool:
+        with self._lock.read_locked():
+            return self._tree.contains(value)
+
+    def __iter__(self) -> typing.Iterator[typing.Any]:
+        """Iterate a snapshot of the ordered values, changes after it are not seen"""
+        return iter(self.get_ordered_values())
+
+    def read_locked(self) -> typing.ContextManager[BinarySearchTreeNode]:
+        """
+        Hold the read lock for a few reads in a row that should see the same tree,
+        use the wrapped tree it gives (calling the wrapper inside can deadlock,
+        the lock is not reentrant and a writer may be waiting):
+
+            with concurrent_tree.read_locked() as tree:
+                assert tree.min_value == tree.get_ordered_values()[0]
+        """
+        return self._locked_tree(self._lock.read_locked)
+
+    def write_locked(self) -> typing.ContextManager[BinarySearchTreeNode]:
+        """Hold the write lock for a few changes in a row, like <read_locked>"""
+        return self._locked_tree(self._lock.write_locked)
+
+    @contextlib.contextmanager
+    def _locked_tree(self, locked: typing.Callable):
+        with locked():
+            yield self._tree
@@ -25,3 +25,15 @@ class RootNodeDeleteException(Exception):
 
 class TypeSorterNotFoundException(Exception):
     pass
+
+
+class InvalidStorageException(Exception):
+    pass
+
+
+class SorterMismatchException(Exception):
+    pass
+
+
+class InstrumentationException(Exception):
+    pass
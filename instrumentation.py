@@ -0,0 +1,242 @@
+"""
+Opt-in instrumentation of the trees, to find out why one got slow: a skewed tree makes long
+search paths, a write heavy one keeps clearing caches, and non native sorters make every
+comparison cost a call. While it is enabled we count, per operation:
+
+    calls           how many times it was called
+    seconds         time spent inside it, in total
+    comparisons     values compared while searching (one per node of the search path,
+                    and one more when the value is found)
+    nodes_visited   values given by ordered traversals (iter_ordered and range)
+
+and for the whole cache: cached property hits, misses, and nodes whose cache was cleared.
+
+    with instrumentation.instrumented() as stats:
+        tree.add_multiple(values)
+    print(stats.as_dict())
+
+We wrap the methods on the classes while it is enabled and put the originals back when it is
+disabled, so a disabled instrumentation costs nothing at all. It applies to every node tree
+(BinarySearchTreeNode and subclasses) at once, not to the array storage.
+"""
+import collections
+import contextlib
+import functools
+import time
+import typing
+
+from binary_search_tree import BinarySearchTreeNode
+from cache_manager import CacheManager, cached_property
+from errors import InstrumentationException
+
+# Public tree methods we count and time
+OPERATIONS = (
+    "add", "add_multiple", "remove", "remove_multiple", "contains", "get_ordered_values",
+)
+# Methods that give values one by one, we count the values and time each step
+TRAVERSALS = ("iter_ordered", "range")
+
+
+class TreeStats:
+    """Counters of an instrumentation run, see the module docstring"""
+
+    def __init__(self):
+        self.calls = collections.Counter()
+        self.seconds = collections.defaultdict(float)
+        self.comparisons = collections.Counter()
+        self.nodes_visited = collections.Counter()
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.cache_invalidations = 0
+        self._operations: list[str] = []  # <- operations running right now, outermost first
+
+    @property
+    def current_operation(self) -> str:
+        """Outermost running operation, comparisons of inner calls count for it"""
+        return self._operations[0] if self._operations else "other"
+
+    def comparisons_per_call(self, operation: str) -> float:
+        return self.comparisons[operation] / self.calls[operation] if self.calls[operation] else 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "calls": dict(self.calls),
+            "seconds": dict(self.seconds),
+            "comparisons": dict(self.comparisons),
+            "nodes_visited": dict(self.nodes_visited),
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "cache_invalidations": self.cache_invalidations,
+        }
+
+    def reset(self):
+        self.__init__()
+
+
+# Callback receives the operation name, its seconds, and what it did:
+# {"comparisons": int, "nodes_visited": int}
+Callback = typing.Callable[[str, float, dict], None]
+
+_active: typing.Optional[TreeStats] = None
+_originals: list[tuple[typing.Type, str, typing.Any]] = []  # <- (class, name, original)
+
+
+def _node_classes() -> list[typing.Type[BinarySearchTreeNode]]:
+    """BinarySearchTreeNode and every subclass of it, imported so far"""
+    classes = [BinarySearchTreeNode]
+    for _class in classes:
+        classes.extend(_subclass for _subclass in _class.__subclasses__() if _subclass not in classes)
+    return classes
+
+
+def _patch(owner: typing.Type, name: str, wrapper: typing.Any):
+    _originals.append((owner, name, owner.__dict__[name]))
+    setattr(owner, name, wrapper)
+
+
+def _wrap_operation(stats: TreeStats, callback: typing.Optional[Callback], name: str, method: typing.Callable):
+    @functools.wraps(method)
+    def operation(*args, **kwargs):
+        comparisons = stats.comparisons[name]
+        stats._operations.append(name)
+        start = time.perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            stats._operations.pop()
+            stats.calls[name] += 1
+            stats.seconds[name] += elapsed
+            if callback is not None:
+                callback(name, elapsed, {
+                    "comparisons": stats.comparisons[name] - comparisons, "nodes_visited": 0
+                })
+
+    return operation
+
+
+def _wrap_traversal(stats: TreeStats, callback: typing.Optional[Callback], name: str, method: typing.Callable):
+    @functools.wraps(method)
+    def traversal(*args, **kwargs):
+        iterator = method(*args, **kwargs)
+        visited = 0
+        elapsed = 0.0
+        try:
+            while True:
+                start = time.perf_counter()
+                try:
+                    _value = next(iterator)
+                except StopIteration:
+                    return
+                finally:
+                    elapsed += time.perf_counter() - start  # <- not the time the caller spends
+                visited += 1
+                yield _value
+        finally:
+            stats.calls[name] += 1
+            stats.seconds[name] += elapsed
+            stats.nodes_visited[name] += visited
+            if callback is not None:
+                callback(name, elapsed, {"comparisons": 0, "nodes_visited": visited})
+
+    return traversal
+
+
+def _wrap_search(stats: TreeStats, method: typing.Callable):
+    @functools.wraps(method)
+    def search(self, value):
+        result = method(self, value)
+        path, found_node, _ = result
+        stats.comparisons[stats.current_operation] += len(path) + (found_node is not None)
+        return result
+
+    return search
+
+
+def _wrap_cached_get(stats: TreeStats, method: typing.Callable):
+    @functools.wraps(method)
+    def __get__(self, instance, owner=None):
+        if instance is not None:
+            if instance._cache is not None and self.attribute_name in instance._cache:
+                stats.cache_hits += 1
+            else:
+                stats.cache_misses += 1
+        return method(self, instance, owner)
+
+    return __get__
+
+
+def _wrap_clear_properties(stats: TreeStats, method: typing.Callable):
+    @functools.wraps(method)
+    def clear_cached_properties(self, properties: list[str] = None):
+        if self._cache:
+            stats.cache_invalidations += 1
+        return method(self, properties)
+
+    return clear_cached_properties
+
+
+def _wrap_clear_nodes(stats: TreeStats, method: typing.Callable):
+    @functools.wraps(method)
+    def clear_cached_nodes(nodes):
+        nodes = list(nodes)
+        stats.cache_invalidations += sum(1 for _node in nodes if _node._cache)
+        return method(nodes)
+
+    return clear_cached_nodes
+
+
+def enable(stats: typing.Optional[TreeStats] = None, callback: typing.Optional[Callback] = None) -> TreeStats:
+    """
+    Start counting into stats (a new one by default), and call callback after every
+    operation. Returns the stats. Only one instrumentation can be enabled at a time.
+    """
+    global _active
+    if _active is not None:
+        raise InstrumentationException("Instrumentation is already enabled.")
+    stats = stats if stats is not None else TreeStats()
+
+    for _class in _node_classes():
+        for name in OPERATIONS:
+            if name in _class.__dict__:  # <- subclasses that override it get wrapped too
+                _patch(_class, name, _wrap_operation(stats, callback, name, _class.__dict__[name]))
+        for name in TRAVERSALS:
+            if name in _class.__dict__:
+                _patch(_class, name, _wrap_traversal(stats, callback, name, _class.__dict__[name]))
+        if "_search" in _class.__dict__:
+            _patch(_class, "_search", _wrap_search(stats, _class.__dict__["_search"]))
+    _patch(cached_property, "__get__", _wrap_cached_get(stats, cached_property.__get__))
+    _patch(
+        CacheManager,
+        "clear_cached_properties",
+        _wrap_clear_properties(stats, CacheManager.clear_cached_properties),
+    )
+    _patch(
+        CacheManager,
+        "clear_cached_nodes",
+        staticmethod(_wrap_clear_nodes(stats, CacheManager.clear_cached_nodes)),
+    )
+    _active = stats
+    return stats
+
+
+def disable() -> typing.Optional[TreeStats]:
+    """Put the original methods back, returns the stats we were counting into"""
+    global _active
+    while _originals:
+        owner, name, original = _originals.pop()
+        setattr(owner, name, original)
+    stats, _active = _active, None
+    return stats
+
+
+@contextlib.contextmanager
+def instrumented(
+        stats: typing.Optional[TreeStats] = None, callback: typing.Optional[Callback] = None
+) -> typing.Iterator[TreeStats]:
+    """Instrumentation enabled only inside the with block"""
+    stats = enable(stats, callback)
+    try:
+        yield stats
+    finally:
+        disable()
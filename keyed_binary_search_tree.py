@@ -0,0 +1,71 @@
+import typing
+
+from balanced_binary_search_tree import BalancedBinarySearchTreeNode
+from binary_search_tree import BinarySearchTreeNode
+from errors import InvalidTypeException
+from sorters import BaseSorter
+
+
+class KeyedBinarySearchTreeNode(BinarySearchTreeNode):
+    r"""
+    Node for sorters with a key function (see sorters.KeySorter): every node computes
+    the key of its value once, when it is created, and keeps it next to the value.
+    Consider a case insensitive sorter (key=str.casefold) and adding "Mango", "apple", "Zucchini":
+
+                  "Mango" (mango)
+                  /             \
+        "apple" (apple)    "Zucchini" (zucchini)
+
+    Searching a value (add, remove, find, contains) computes its key once too, then
+    each level down is a native comparison of two keys, instead of a sorter call that
+    computes both keys again. Other queries (range, rank...) still go through the
+    sorter compare, they give the same results, only a bit slower.
+    """
+
+    __slots__ = ("_key",)
+
+    def __init__(
+        self,
+        sorter: typing.Type[BaseSorter],
+        node_value: typing.Any,
+        level: int = 0,
+    ):
+        super().__init__(sorter=sorter, node_value=node_value, level=level)
+        self._key = sorter.key(node_value)
+
+    def _take_value(self, other: "KeyedBinarySearchTreeNode"):
+        super()._take_value(other)
+        self._key = other._key
+
+    def _swap_values(self, other: "KeyedBinarySearchTreeNode"):
+        """Rotations of the balanced flavour move the key with the value"""
+        self.node_value, other.node_value = other.node_value, self.node_value
+        self._key, other._key = other._key, self._key
+
+    def _search(
+            self, value: typing.Any
+    ) -> tuple[list["KeyedBinarySearchTreeNode"], typing.Optional["KeyedBinarySearchTreeNode"], typing.Optional[str]]:
+        """Same than the regular node <_search>, comparing the kept keys natively"""
+        key = self.sorter.key(value)
+        path = []
+        side = None
+        node = self
+        try:
+            while node is not None:
+                node_key = node._key
+                if key == node_key:
+                    return path, node, side
+                path.append(node)
+                if key < node_key:
+                    side, node = "_left_node", node._left_node
+                else:
+                    side, node = "_right_node", node._right_node
+        except TypeError:
+            raise InvalidTypeException(f"We can not compare {value!r} and {node.node_value!r}.")
+        return path, None, side
+
+
+class BalancedKeyedBinarySearchTreeNode(KeyedBinarySearchTreeNode, BalancedBinarySearchTreeNode):
+    """Keyed node (see KeyedBinarySearchTreeNode) that keeps itself balanced like an AVL node"""
+
+    __slots__ = ()
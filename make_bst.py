@@ -1,34 +1,184 @@
+import collections
 import typing
 
+from array_binary_search_tree import ArrayBinarySearchTree
+from balanced_binary_search_tree import BalancedBinarySearchTreeNode
 from binary_search_tree import BinarySearchTreeNode
-from errors import MultipleDataTypesException, TypeSorterNotFoundException, InvalidTypeException
-from sorters import BaseSorter, IntegerSorter, CharSorter, FloatSorter
+from concurrent_binary_search_tree import ConcurrentBinarySearchTree
+from keyed_binary_search_tree import BalancedKeyedBinarySearchTreeNode, KeyedBinarySearchTreeNode
+from map_binary_search_tree import BalancedMapBinarySearchTreeNode, MapBinarySearchTreeNode
+from multiset_binary_search_tree import BalancedMultisetBinarySearchTreeNode, MultisetBinarySearchTreeNode
+from persistent_binary_search_tree import PersistentBinarySearchTreeNode
+from errors import (
+    InvalidStorageException,
+    InvalidTypeException,
+    MultipleDataTypesException,
+    TypeSorterNotFoundException,
+)
+from sorters import BaseSorter, get_sorter_for_type
+import parallel_build
+import vectorized
 
+# Nodes that keep the key of their value, for sorters with a key function
+KEYED_NODE_CLASSES = {
+    BinarySearchTreeNode: KeyedBinarySearchTreeNode,
+    BalancedBinarySearchTreeNode: BalancedKeyedBinarySearchTreeNode,
+}
 
-def get_sorter_for_type(_type: typing.Type) -> typing.Type[BaseSorter]:
-    """Gets the sorter that corresponds to given type"""
-    types_to_sorters_map = {
-        int: IntegerSorter,
-        float: FloatSorter,
-        str: CharSorter,
-    }
-    return types_to_sorters_map.get(_type)
 
+def make_binary_search_tree(
+        values: typing.Sequence[typing.Any],
+        balanced: bool = False,
+        bulk_load: bool = False,
+        storage: str = "nodes",
+        concurrent: bool = False,
+        workers: int = 1,
+        multiset: bool = False,
+        ordered_map: bool = False,
+        sorter: typing.Optional[typing.Type[BaseSorter]] = None,
+) -> typing.Union[BinarySearchTreeNode, ArrayBinarySearchTree, ConcurrentBinarySearchTree]:
+    """
+    Build a BinarySearchTree instance from given values arguments.
+    With balanced=True we get a self balancing (AVL) tree, that keeps depth
+    at O(log n) even when values arrive already sorted.
+    With bulk_load=True we sort and remove duplicates once, then build a minimum height
+    tree in O(n), so the root is the middle value instead of the first one.
+    With storage="array" (ints and floats only) we get an ArrayBinarySearchTree, that keeps
+    nodes in typed arrays instead of one python object per node.
+    With storage="persistent" we get a PersistentBinarySearchTreeNode, whose add and remove
+    give back a new root and leave the old one as it was.
+    Values can also be a numpy array, array.array or memoryview of ints or floats, those
+    are always sorted and deduplicated in bulk and built like bulk_load=True.
+    With concurrent=True the tree comes wrapped in a ConcurrentBinarySearchTree,
+    to share it between threads (not persistent trees, their roots are shared as they are).
+    With workers > 1 values are validated, sorted and deduplicated by that many processes,
+    and the tree is built like bulk_load=True (the same tree for any number of workers).
+    With multiset=True (nodes storage only) duplicates are counted on their node instead
+    of dropped, see MultisetBinarySearchTreeNode. Buffers and bulk_load keep them too.
+    With ordered_map=True (nodes storage only) values are (key, payload) pairs or a mapping,
+    and we get a MapBinarySearchTreeNode sorted by key, a repeated key keeps its last payload.
+    The sorter comes from the registry (see sorters.get_sorter_for_type) by the type of the
+    first value, or give one with sorter=, like StringSorter for strings of any length.
+    Plain and balanced node trees of a sorter with a key function keep the key
+    of each value on its node, see KeyedBinarySearchTreeNode. Buffers keep their own sorter.
+    """
+    if concurrent and storage == "persistent":
+        raise InvalidStorageException("Persistent trees need no lock, changes give a new root.")
+    if concurrent:
+        return ConcurrentBinarySearchTree(
+            make_binary_search_tree(
+                values=values,
+                balanced=balanced,
+                bulk_load=bulk_load,
+                storage=storage,
+                workers=workers,
+                multiset=multiset,
+                ordered_map=ordered_map,
+                sorter=sorter,
+            )
+        )
 
-def make_binary_search_tree(values: list[typing.Any]) -> BinarySearchTreeNode:
-    """Build a BinarySearchTree instance from given values arguments"""
+    if multiset and storage != "nodes":
+        raise InvalidStorageException(f"Storage {storage} does not support multisets.")
+    if multiset and workers > 1:
+        raise InvalidStorageException("Parallel build does not support multisets.")
+    if ordered_map and (storage != "nodes" or multiset or workers > 1):
+        raise InvalidStorageException("Ordered maps need nodes storage, without multiset or workers.")
+
+    if storage == "array":
+        if balanced:
+            raise InvalidStorageException("Array storage does not support balanced trees.")
+        node_class = ArrayBinarySearchTree
+    elif storage == "persistent":
+        if balanced:
+            raise InvalidStorageException("Persistent storage does not support balanced trees.")
+        node_class = PersistentBinarySearchTreeNode
+    elif storage == "nodes" and ordered_map:
+        node_class = BalancedMapBinarySearchTreeNode if balanced else MapBinarySearchTreeNode
+        return make_ordered_map(values, node_class=node_class, bulk_load=bulk_load, sorter=sorter)
+    elif storage == "nodes" and multiset:
+        node_class = BalancedMultisetBinarySearchTreeNode if balanced else MultisetBinarySearchTreeNode
+    elif storage == "nodes":
+        node_class = BalancedBinarySearchTreeNode if balanced else BinarySearchTreeNode
+    else:
+        raise InvalidStorageException(f"Unknown storage {storage}.")
+
+    if vectorized.is_buffer(values) and multiset:
+        sorter = vectorized.get_sorter_for_buffer(values)
+        # Sorted in bulk would drop the duplicates, so we count them first
+        return node_class.from_counts(sorter=sorter, counts=collections.Counter(values.tolist()))
+
+    if vectorized.is_buffer(values):
+        # Every item of a typed buffer has the same type, no need to validate them,
+        # and sorting them in bulk is way cheaper than adding them one by one.
+        sorter = vectorized.get_sorter_for_buffer(values)
+        return node_class.from_sorted(sorter=sorter, values=vectorized.sort_unique_buffer(values))
 
     try:
-        data_type = type(values[0])
-        sorter = get_sorter_for_type(data_type)
         if sorter is None:
-            raise TypeSorterNotFoundException(f"Sorter for type {data_type}.")
+            data_type = type(values[0])
+            sorter = get_sorter_for_type(data_type)
+            if sorter is None:
+                raise TypeSorterNotFoundException(f"Sorter for type {data_type}.")
+        if sorter.key is not None:
+            node_class = KEYED_NODE_CLASSES.get(node_class, node_class)
+
+        if workers > 1:
+            values = parallel_build.sort_unique_parallel(sorter, values, workers=workers)
+            return node_class.from_sorted(sorter=sorter, values=values)
 
-        root_node = BinarySearchTreeNode(sorter=sorter, node_value=values[0])
+        # Validate every value only once here, so the tree can trust them and
+        # skip the validation on each comparison.
+        for _value in values:
+            sorter.validate_value(_value)
+
+        if bulk_load and multiset:
+            return node_class.from_counts(sorter=sorter, counts=collections.Counter(values))
+        if bulk_load:
+            return node_class.from_sorted(sorter=sorter, values=sorter.sort_unique(values))
+
+        root_node = node_class(sorter=sorter, node_value=values[0])
         if len(values) > 1:
-            root_node.add_multiple(values[1:])
+            if storage == "persistent":
+                # Persistent nodes never change, adding values gives back a new root
+                root_node = root_node.add_multiple(values[1:], trusted=True)
+            else:
+                root_node.add_multiple(values[1:], trusted=True)
 
         return root_node
 
     except InvalidTypeException:
         raise MultipleDataTypesException('We receive different data types on input.')
+
+
+def make_ordered_map(
+        items: typing.Union[typing.Mapping, typing.Iterable[tuple[typing.Any, typing.Any]]],
+        node_class: typing.Type[MapBinarySearchTreeNode] = MapBinarySearchTreeNode,
+        bulk_load: bool = False,
+        sorter: typing.Optional[typing.Type[BaseSorter]] = None,
+) -> MapBinarySearchTreeNode:
+    """
+    Ordered map from a mapping or (key, payload) pairs, see make_binary_search_tree.
+    Keys go in the tree in the order they come first, like values do.
+    """
+    payloads = dict(items)  # <- a repeated key keeps its last payload, like on a dict
+    keys = list(payloads)
+    try:
+        if sorter is None:
+            data_type = type(keys[0])
+            sorter = get_sorter_for_type(data_type)
+            if sorter is None:
+                raise TypeSorterNotFoundException(f"Sorter for type {data_type}.")
+        for _key in keys:
+            sorter.validate_value(_key)
+    except InvalidTypeException:
+        raise MultipleDataTypesException('We receive different data types on input.')
+
+    if bulk_load:
+        keys = sorter.sort_unique(keys)
+        return node_class.from_items(sorter=sorter, items=[(_key, payloads[_key]) for _key in keys])
+
+    root_node = node_class(sorter=sorter, node_value=keys[0], payload=payloads[keys[0]])
+    for _key in keys[1:]:
+        root_node.put(_key, payloads[_key])
+    return root_node
@@ -0,0 +1,134 @@
+import typing
+
+from balanced_binary_search_tree import BalancedBinarySearchTreeNode
+from binary_search_tree import BinarySearchTreeNode
+from sorters import BaseSorter
+
+_MISSING = object()  # <- no default given to <pop>
+
+
+class MapBinarySearchTreeNode(BinarySearchTreeNode):
+    r"""
+    Ordered map flavour of the binary search tree node: the node value is a key, sorted
+    by the tree sorter as usual, and every node also holds the payload of its key.
+    So the tree is an index from keys to records, in key order, and a single walk
+    down the tree finds the payload, no separate dict to keep in sync.
+
+            (42, "answer")
+               /      \
+       (7, "days")    (99, "problems")
+
+    Everything of the regular node works on the keys (ordered values, range, rank...),
+    <get>, <put>, <pop>, <items> and <range_items> work with the payloads too.
+    """
+
+    __slots__ = ("payload",)
+
+    def __init__(
+        self,
+        sorter: typing.Type[BaseSorter],
+        node_value: typing.Any,
+        level: int = 0,
+        payload: typing.Any = None,
+    ):
+        super().__init__(sorter=sorter, node_value=node_value, level=level)
+        self.payload = payload
+
+    @classmethod
+    def from_items(
+            cls,
+            sorter: typing.Type[BaseSorter],
+            items: typing.Sequence[tuple[typing.Any, typing.Any]],
+    ) -> "MapBinarySearchTreeNode":
+        """Minimum height tree from (key, payload) items ordered by key, without repeated keys"""
+        root_node = cls.from_sorted(sorter=sorter, values=[key for key, _ in items])
+        for node, (_, payload) in zip(root_node._ordered_nodes(), items):
+            node.payload = payload
+        return root_node
+
+    def _take_value(self, other: "MapBinarySearchTreeNode"):
+        super()._take_value(other)
+        self.payload = other.payload
+
+    def _swap_values(self, other: "MapBinarySearchTreeNode"):
+        """Rotations of the balanced flavour move the payload with the key"""
+        self.node_value, other.node_value = other.node_value, self.node_value
+        self.payload, other.payload = other.payload, self.payload
+
+    def put(self, key: typing.Any, payload: typing.Any):
+        """Set the payload of the key, adding the key when it is not on the tree yet"""
+        self.sorter.validate_value(key)
+        path, node, side = self._search(key)
+        if node is not None:
+            node.payload = payload  # <- cached properties only know about keys
+            return
+        created_node = type(self)(
+            sorter=self.sorter, node_value=key, level=path[-1].level + 1, payload=payload
+        )
+        self.clear_cached_nodes(self._attach(path, side, created_node))
+
+    def get(self, key: typing.Any, default: typing.Any = None) -> typing.Any:
+        """Payload of the key, or default when the key is not on the tree"""
+        node = self.find(key)
+        return default if node is None else node.payload
+
+    def pop(self, key: typing.Any, default: typing.Any = _MISSING) -> typing.Any:
+        """
+        Remove the key and give back its payload, like dict.pop: default when the key
+        is not on the tree, or KeyError without default.
+        """
+        node = self.find(key)
+        if node is None:
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+        payload = node.payload  # <- the node may take other key payload on remove
+        self.remove(key)
+        return payload
+
+    def items(self, reverse: bool = False) -> typing.Iterator[tuple[typing.Any, typing.Any]]:
+        """(key, payload) pairs in key order, one by one (see <iter_ordered>)"""
+        return ((node.node_value, node.payload) for node in self._ordered_nodes(reverse=reverse))
+
+    def range_items(
+            self,
+            low: typing.Any = None,
+            high: typing.Any = None,
+            inclusive: typing.Union[bool, tuple[bool, bool]] = True,
+    ) -> typing.Iterator[tuple[typing.Any, typing.Any]]:
+        """(key, payload) pairs with keys between low and high (see <range>)"""
+        return ((node.node_value, node.payload) for node in self._range_nodes(low, high, inclusive))
+
+    def _merge_values(
+            self,
+            other: "BinarySearchTreeNode",
+            only_self: bool,
+            both: bool,
+            only_other: bool,
+    ) -> list[tuple[typing.Any, typing.Any]]:
+        """Merged keys like the regular node, with their payloads, self payload wins"""
+        keys = super()._merge_values(other, only_self, both, only_other)
+        payloads = dict(other.items()) if isinstance(other, MapBinarySearchTreeNode) else {}
+        payloads.update(self.items())
+        return [(key, payloads.get(key)) for key in keys]
+
+    def _from_sorted_or_none(
+            self, items: list[tuple[typing.Any, typing.Any]]
+    ) -> typing.Optional["MapBinarySearchTreeNode"]:
+        if not items:
+            return None
+        return type(self).from_items(sorter=self.sorter, items=items)
+
+    def split(
+            self, value: typing.Any
+    ) -> tuple[typing.Optional["MapBinarySearchTreeNode"], typing.Optional["MapBinarySearchTreeNode"]]:
+        """Same than the regular node <split>, the payloads go with their keys"""
+        index = self.rank(value)
+        items = list(self.items())
+        return self._from_sorted_or_none(items[:index]), self._from_sorted_or_none(items[index:])
+
+
+class BalancedMapBinarySearchTreeNode(MapBinarySearchTreeNode, BalancedBinarySearchTreeNode):
+    """Map node (see MapBinarySearchTreeNode) that keeps itself balanced like an AVL node"""
+
+    __slots__ = ()
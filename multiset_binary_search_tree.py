@@ -0,0 +1,192 @@
+import collections
+import itertools
+import typing
+
+from balanced_binary_search_tree import BalancedBinarySearchTreeNode
+from binary_search_tree import BinarySearchTreeNode
+from errors import InvalidTypeException
+from sorters import BaseSorter
+import vectorized
+
+
+def _repeated_value(node: "MultisetBinarySearchTreeNode") -> typing.Iterator[typing.Any]:
+    return itertools.repeat(node.node_value, node._count)
+
+
+class MultisetBinarySearchTreeNode(BinarySearchTreeNode):
+    r"""
+    Multiset flavour of the binary search tree node: adding a value that is already
+    on the tree counts it once more on its node instead of dropping it, and removing
+    it takes one copy out, the node goes only with the last one.
+    Consider adding 200, 404, 200, 500, 200:
+
+            200 (x3)
+               \
+               404
+                  \
+                  500
+
+    So very repetitive values (status codes, rounded latencies) need one node per
+    distinct value. Sizes count every copy, so len, rank, select, percentile and the
+    ordered values (where a value shows up as many times as it was added) count them too.
+    """
+
+    __slots__ = ("_count",)
+
+    def __init__(
+        self,
+        sorter: typing.Type[BaseSorter],
+        node_value: typing.Any,
+        level: int = 0,
+    ):
+        super().__init__(sorter=sorter, node_value=node_value, level=level)
+        self._count = 1  # <- copies of the value this node holds
+
+    @classmethod
+    def from_sorted(
+            cls,
+            sorter: typing.Type[BaseSorter],
+            values: typing.Sequence[typing.Any],
+            counts: typing.Optional[typing.Sequence[int]] = None,
+    ) -> "MultisetBinarySearchTreeNode":
+        """
+        Minimum height tree from ordered values. Equal values may repeat, they go
+        on a single node, or give the counts of values (then without duplicates).
+        """
+        if counts is None:
+            runs = [(_value, len(list(group))) for _value, group in itertools.groupby(values)]
+            values, counts = [_value for _value, _ in runs], [count for _, count in runs]
+        root_node = super().from_sorted(sorter=sorter, values=values)
+        if any(count != 1 for count in counts):
+            for node, count in zip(root_node._ordered_nodes(), counts):
+                node._count = count
+            # Sizes count the copies, children first, so in reversed pre-order
+            nodes = []
+            stack = [root_node]
+            while stack:
+                node = stack.pop()
+                nodes.append(node)
+                stack.extend(child for child in (node._left_node, node._right_node) if child is not None)
+            for node in reversed(nodes):
+                node._update_subtree_stats()
+        return root_node
+
+    @classmethod
+    def from_counts(
+            cls,
+            sorter: typing.Type[BaseSorter],
+            counts: typing.Mapping[typing.Any, int],
+    ) -> "MultisetBinarySearchTreeNode":
+        """
+        Minimum height tree from values (already validated) and their counts, like a Counter.
+        Values the sorter considers equal ("a" and "A" for chars) are copies of the
+        first one, their counts add up.
+        """
+        totals = collections.Counter()
+        for _value, count in counts.items():
+            totals[sorter.unique_key(_value)] += count
+        values = sorter.sort_unique(counts)
+        return cls.from_sorted(
+            sorter=sorter, values=values, counts=[totals[sorter.unique_key(_value)] for _value in values]
+        )
+
+    def _update_subtree_stats(self):
+        super()._update_subtree_stats()
+        self._size += self._count - 1  # <- parent class counts one value per node
+
+    def _add_existing(
+            self,
+            path: list["MultisetBinarySearchTreeNode"],
+            node: "MultisetBinarySearchTreeNode",
+            copies: int = 1,
+    ) -> list["MultisetBinarySearchTreeNode"]:
+        node._count += copies
+        path.append(node)
+        for _node in path:
+            _node._size += copies
+        return path
+
+    def _remove_existing(
+            self, path: list["MultisetBinarySearchTreeNode"], node: "MultisetBinarySearchTreeNode"
+    ) -> bool:
+        if node._count == 1:
+            return False
+        node._count -= 1
+        node._size -= 1
+        for _node in path:
+            _node._size -= 1
+        return True
+
+    def _take_value(self, other: "MultisetBinarySearchTreeNode"):
+        super()._take_value(other)
+        self._count = other._count
+
+    def _swap_values(self, other: "MultisetBinarySearchTreeNode"):
+        """Rotations of the balanced flavour move the count with the value"""
+        self.node_value, other.node_value = other.node_value, self.node_value
+        self._count, other._count = other._count, self._count
+
+    def count(self, value: typing.Any) -> int:
+        """How many copies of the value are on the tree, 0 when it is not there"""
+        node = self.find(value)
+        return 0 if node is None else node._count
+
+    def merge(self, other: BinarySearchTreeNode):
+        """
+        Add every copy of the other tree to this one, counts add up like Counter.update
+        (<union> keeps the highest count instead). Like the regular <merge>, this node
+        stays the root of the result. Other can be a regular tree, one copy per value.
+        """
+        self._check_same_sorter(other)
+        counts = collections.Counter()
+        for tree in (self, other):  # <- self values first, they win among equal ones
+            for node in tree._ordered_nodes():
+                counts[node.node_value] += getattr(node, "_count", 1)
+        self._take_tree(type(self).from_counts(sorter=self.sorter, counts=counts))
+
+    def iter_ordered(self, reverse: bool = False) -> typing.Iterator[typing.Any]:
+        return itertools.chain.from_iterable(map(_repeated_value, self._ordered_nodes(reverse=reverse)))
+
+    def range(
+            self,
+            low: typing.Any = None,
+            high: typing.Any = None,
+            inclusive: typing.Union[bool, tuple[bool, bool]] = True,
+    ) -> typing.Iterator[typing.Any]:
+        return itertools.chain.from_iterable(map(_repeated_value, self._range_nodes(low, high, inclusive)))
+
+    def add_multiple(self, values: typing.Iterable, trusted: bool = False):
+        """
+        Add multiple values from this node, typed buffers keep their duplicates too.
+        We count the values first, so every distinct value walks down the tree once
+        (twice when it repeats), whatever the number of copies.
+        The tree ends up with the same shape than adding them one by one,
+        duplicates never change it.
+        """
+        if not isinstance(values, typing.Iterable):
+            raise InvalidTypeException(
+                "Method add_multiple accepts iterable data only for input."
+            )
+        if vectorized.is_buffer(values):
+            vectorized.validate_buffer(values, self.sorter)
+            values, trusted = values.tolist(), True
+        elif not trusted:
+            values = list(values)
+            for _value in values:
+                self.sorter.validate_value(_value)
+
+        dirty_nodes = set()
+        try:
+            for _value, count in collections.Counter(values).items():  # <- first seen order
+                dirty_nodes.update(self._insert(_value))  # <- a new node, or one more copy on it
+                if count > 1:
+                    path, node, _ = self._search(_value)
+                    dirty_nodes.update(self._add_existing(path, node, copies=count - 1))
+        finally:
+            self.clear_cached_nodes(dirty_nodes)  # <- also when a value stops us half way
+
+
+class BalancedMultisetBinarySearchTreeNode(MultisetBinarySearchTreeNode, BalancedBinarySearchTreeNode):
+    """Multiset node (see MultisetBinarySearchTreeNode) that keeps itself balanced like an AVL node"""
+
+    __slots__ = ()
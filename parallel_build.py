@@ -0,0 +1,45 @@
+"""
+Parallel bulk build for very large inputs. Validating every value and sorting them is
+the CPU bound part of building a tree, so we split the values in chunks and worker
+processes validate, sort and deduplicate one chunk each. Sorted chunks are cheap to
+merge back, and the tree is built from the merged values with <from_sorted>, so the
+result is exactly the same tree bulk_load=True gives, whatever the number of workers.
+"""
+import concurrent.futures
+import itertools
+import typing
+
+from errors import InvalidTypeException
+from sorters import BaseSorter
+
+
+def sort_chunk(sorter: typing.Type[BaseSorter], values: list) -> list:
+    """Worker side: validate every value of the chunk, then sort and deduplicate it"""
+    for _value in values:
+        sorter.validate_value(_value)
+    return sorter.sort_unique(values)
+
+
+def sort_unique_parallel(
+        sorter: typing.Type[BaseSorter],
+        values: typing.Sequence[typing.Any],
+        workers: int,
+) -> list:
+    """
+    Same result than sorter.sort_unique(values), with the values validated,
+    using <workers> processes for the chunks. Sorted chunks are runs that python sort
+    merges almost linearly, so the parent only does that and drops duplicates.
+    """
+    chunk_size = -(-len(values) // workers)  # <- rounded up, so we get <workers> chunks
+    chunks = [values[start:start + chunk_size] for start in range(0, len(values), chunk_size)]
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        sorted_chunks = list(executor.map(sort_chunk, itertools.repeat(sorter), chunks))
+
+    if sorter.native_order:
+        # dict keeps the first of equal values, like sort_unique, and runs in C
+        try:
+            return list(dict.fromkeys(sorted(itertools.chain.from_iterable(sorted_chunks))))
+        except TypeError:  # <- chunks that sort alone but not together, see BaseSorter.sort_unique
+            raise InvalidTypeException("We can not compare some of these values.")
+    # Chunks are in input order, so the first value still wins among equal ones
+    return sorter.sort_unique(itertools.chain.from_iterable(sorted_chunks))
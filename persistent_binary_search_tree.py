@@ -0,0 +1,191 @@
+import typing
+
+from binary_search_tree import BinarySearchTreeNode
+from errors import InvalidTypeException, RootNodeDeleteException
+import vectorized
+
+
+class PersistentBinarySearchTreeNode(BinarySearchTreeNode):
+    r"""
+    Immutable flavour of the binary search tree node: add and remove never change a node,
+    they give back a new root, and the old root is still the whole tree as it was.
+    Only the nodes on the path to the change are copied, the new root shares
+    every other node with the old one. Adding 30:
+
+        old root:      50              new root:    50'
+                      /  \                         /   \
+                    25    75                     25'    75  <- same node than the old one
+                                                   \
+                                                    30
+
+    So an add costs O(depth) new nodes, and a snapshot is just keeping a reference to a root.
+    Nodes never change after they are created, so their cached properties never get stale.
+    """
+
+    __slots__ = ()
+
+    def _copy(self) -> "PersistentBinarySearchTreeNode":
+        node = type(self)(sorter=self.sorter, node_value=self.node_value, level=self.level)
+        node._left_node, node._right_node = self._left_node, self._right_node
+        node._size, node._height = self._size, self._height
+        return node
+
+    @staticmethod
+    def _own(node: "PersistentBinarySearchTreeNode", owned: set) -> "PersistentBinarySearchTreeNode":
+        """
+        Copy of the node we can change, the nodes we already copied in the same
+        batch (see <add_multiple>) are not shared with anyone yet, so we reuse them.
+        """
+        if node in owned:
+            return node
+        node = node._copy()
+        owned.add(node)
+        return node
+
+    def _copy_path(
+            self,
+            path: list["PersistentBinarySearchTreeNode"],
+            owned: set,
+            values: typing.Optional[dict] = None,
+    ) -> list["PersistentBinarySearchTreeNode"]:
+        """
+        Copy the path nodes from the top, linking every copy to the copy of the next one.
+        Every path node gets a new value when it is in values. Once the caller changed
+        the bottom of the path, <_update_path_stats> fixes sizes and heights of the copies.
+        """
+        copies = []
+        for node in path:
+            copy = self._own(node, owned)
+            if values is not None and node in values:
+                copy.node_value = values[node]
+            if copies:
+                parent = copies[-1]
+                if parent._left_node is node:
+                    parent._left_node = copy
+                else:
+                    parent._right_node = copy
+            copies.append(copy)
+        return copies
+
+    @staticmethod
+    def _update_path_stats(copies: list["PersistentBinarySearchTreeNode"]) -> "PersistentBinarySearchTreeNode":
+        """Subtree stats of the copies from the bottom up, returns the new root"""
+        for copy in reversed(copies):
+            copy._update_subtree_stats()
+        return copies[0]
+
+    def _added(self, value: typing.Any, owned: set) -> "PersistentBinarySearchTreeNode":
+        path, found_node, side = self._search(value)
+        if found_node is not None:
+            return self  # <- nothing changed, the same tree
+
+        copies = self._copy_path(path, owned)
+        parent = copies[-1]
+        created_node = type(self)(sorter=self.sorter, node_value=value, level=parent.level + 1)
+        owned.add(created_node)
+        setattr(parent, side, created_node)
+        return self._update_path_stats(copies)
+
+    def _removed(self, value: typing.Any, owned: set) -> "PersistentBinarySearchTreeNode":
+        r"""
+        A regular remove moves the child subtree up a level, here that would mean copying
+        the whole subtree (levels are stored on nodes), so instead we only move values:
+        the node takes the value of its successor (or predecessor when there is no right
+        side), that node takes the value of the next one, and so on, until a leaf,
+        which is the only node that leaves. Every node on the way is on a single path.
+        Example:          50                       62'
+                         /  \                      /  \
+                       25    75     remove 50 -> 25    75'
+                            /  \                         \
+                          62    87                        87
+        """
+        path, node, _ = self._search(value)
+        if node is None:
+            return self
+        if node is self and node._left_node is None and node._right_node is None:
+            raise RootNodeDeleteException("Cannot remove the last value of the tree.")
+
+        path.append(node)
+        values = {}
+        while node._left_node is not None or node._right_node is not None:
+            if node._right_node is not None:
+                next_node, towards_value = node._right_node, "_left_node"
+            else:
+                next_node, towards_value = node._left_node, "_right_node"
+            path.append(next_node)
+            while getattr(next_node, towards_value) is not None:
+                next_node = getattr(next_node, towards_value)
+                path.append(next_node)
+            values[node] = next_node.node_value
+            node = next_node
+
+        leaf = path.pop()
+        copies = self._copy_path(path, owned, values=values)
+        parent = copies[-1]
+        if parent._left_node is leaf:
+            parent._left_node = None
+        else:
+            parent._right_node = None
+        return self._update_path_stats(copies)
+
+    def add(self, value: typing.Any, trusted: bool = False) -> "PersistentBinarySearchTreeNode":
+        """
+        Give back a new root with the value added, this tree does not change.
+        It copies O(depth) nodes and shares the rest, when the value is already
+        on the tree we get this same root back.
+        """
+        if not trusted:
+            self.sorter.validate_value(value)
+        return self._added(value, owned=set())
+
+    def remove(self, value: typing.Any) -> "PersistentBinarySearchTreeNode":
+        """
+        Give back a new root without the value, this tree does not change.
+        When the value is not on the tree we get this same root back.
+        """
+        self.sorter.validate_value(value)
+        return self._removed(value, owned=set())
+
+    def add_multiple(
+            self, values: typing.Iterable, trusted: bool = False
+    ) -> "PersistentBinarySearchTreeNode":
+        """
+        Give back a new root with all the values added. Nodes copied for a value of
+        the batch are not shared yet, so next values change them instead of copying again.
+        """
+        if not isinstance(values, typing.Iterable):
+            raise InvalidTypeException(
+                "Method add_multiple accepts iterable data only for input."
+            )
+        if vectorized.is_buffer(values):
+            # See BinarySearchTreeNode.add_multiple
+            vectorized.validate_buffer(values, self.sorter)
+            values = vectorized.middle_first(vectorized.sort_unique_buffer(values))
+            trusted = True
+
+        root, owned = self, set()
+        for _value in values:
+            if not trusted:
+                self.sorter.validate_value(_value)
+            root = root._added(_value, owned)
+        return root
+
+    def remove_multiple(self, values: typing.Iterable) -> "PersistentBinarySearchTreeNode":
+        """Give back a new root without all the values, like <add_multiple>"""
+        if not isinstance(values, typing.Iterable):
+            raise InvalidTypeException(
+                "Method remove_multiple accepts iterable data only for input."
+            )
+        root, owned = self, set()
+        for _value in values:
+            self.sorter.validate_value(_value)
+            root = root._removed(_value, owned)
+        return root
+
+    def merge(self, other: BinarySearchTreeNode) -> "PersistentBinarySearchTreeNode":
+        """Nodes never change, so this is <union>: a new root with the values of both trees"""
+        return self.union(other)
+
+    def snapshot(self) -> "PersistentBinarySearchTreeNode":
+        """This root is already a snapshot, nothing below it is going to change"""
+        return self
@@ -0,0 +1,250 @@
+"""
+Compact binary format for trees, so big trees can be saved once and loaded at start up
+without placing every value again. The file has the tree shape, not only its values:
+
+    header        magic b"BST1", sorter code, node class code, number of nodes
+    keys          node values in pre-order, 8 bytes ints / floats, 4 bytes chars
+    right         pre-order index of the right child of every node, -1 when it has none
+    left          1 when the node has a left child (it is always the next node in pre-order)
+
+Loading needs no comparison at all, every node goes straight to its place.
+Files of numeric trees can also be opened with mmap (see MappedBinarySearchTree),
+then queries read the keys from the file pages, without loading or copying them.
+"""
+import array
+import mmap
+import os
+import struct
+import sys
+import typing
+
+from balanced_binary_search_tree import BalancedBinarySearchTreeNode
+from binary_search_tree import BinarySearchTreeNode
+from errors import InvalidStorageException
+from persistent_binary_search_tree import PersistentBinarySearchTreeNode
+from sorters import CharSorter, FloatSorter, IntegerSorter
+
+MAGIC = b"BST1"
+HEADER = struct.Struct("<4sBBxxQ")  # <- 16 bytes, so 8 bytes keys start aligned
+
+# Codes are written to files, never change or reuse them
+SORTER_CODES = {IntegerSorter: 1, FloatSorter: 2, CharSorter: 3}
+NODE_CLASS_CODES = {
+    BinarySearchTreeNode: 0,
+    BalancedBinarySearchTreeNode: 1,
+    PersistentBinarySearchTreeNode: 2,
+}
+# Typecodes of the keys array, chars are saved as their code point
+KEY_TYPECODES = {IntegerSorter: "q", FloatSorter: "d", CharSorter: "i"}
+
+SORTERS = {code: sorter for sorter, code in SORTER_CODES.items()}
+NODE_CLASSES = {code: node_class for node_class, code in NODE_CLASS_CODES.items()}
+
+
+def _to_little_endian(values: array.array) -> array.array:
+    if sys.byteorder != "little":
+        values.byteswap()
+    return values
+
+
+def dumps(tree: BinarySearchTreeNode) -> bytes:
+    """Tree (from this node down) in the binary format, see <dump>"""
+    sorter = tree.sorter
+    if sorter not in SORTER_CODES or type(tree) not in NODE_CLASS_CODES:
+        raise InvalidStorageException(
+            f"Binary format does not support {type(tree).__name__} with {sorter.__name__}."
+        )
+
+    keys = array.array(KEY_TYPECODES[sorter])
+    right = array.array("q")
+    left = bytearray()
+    # Pre-order with an explicit stack, every item is a node with the index of the node
+    # whose right child it is (-1 when it is a left child or the top node)
+    stack = [(tree, -1)]
+    try:
+        while stack:
+            node, right_of = stack.pop()
+            index = len(right)
+            if right_of >= 0:
+                right[right_of] = index
+            keys.append(ord(node.node_value) if sorter is CharSorter else node.node_value)
+            right.append(-1)
+            left.append(node._left_node is not None)
+            if node._right_node is not None:
+                stack.append((node._right_node, index))
+            if node._left_node is not None:
+                stack.append((node._left_node, -1))
+    except OverflowError:
+        raise InvalidStorageException("Binary format only accepts 64 bits integers.")
+
+    header = HEADER.pack(MAGIC, SORTER_CODES[sorter], NODE_CLASS_CODES[type(tree)], len(right))
+    return b"".join(
+        (header, _to_little_endian(keys).tobytes(), _to_little_endian(right).tobytes(), left)
+    )
+
+
+def dump(tree: BinarySearchTreeNode, file: typing.BinaryIO):
+    """Write the tree to a file opened in binary mode"""
+    file.write(dumps(tree))
+
+
+def _read_header(data: typing.Union[bytes, memoryview, mmap.mmap]) -> tuple:
+    """Sorter, node class and number of nodes of the file, after checking it is one of ours"""
+    if len(data) < HEADER.size:
+        raise InvalidStorageException("Not a binary search tree file.")
+    magic, sorter_code, node_class_code, size = HEADER.unpack_from(data)
+    if magic != MAGIC or sorter_code not in SORTERS or node_class_code not in NODE_CLASSES:
+        raise InvalidStorageException("Not a binary search tree file.")
+
+    sorter = SORTERS[sorter_code]
+    key_size = array.array(KEY_TYPECODES[sorter]).itemsize
+    if len(data) != HEADER.size + size * (key_size + 9):
+        raise InvalidStorageException("Binary search tree file is truncated.")
+    return sorter, NODE_CLASSES[node_class_code], size, key_size
+
+
+def loads(data: bytes) -> BinarySearchTreeNode:
+    """Rebuild a tree from <dumps> output, see <load>"""
+    sorter, node_class, size, key_size = _read_header(data)
+    keys_end = HEADER.size + size * key_size
+    keys = array.array(KEY_TYPECODES[sorter])
+    keys.frombytes(data[HEADER.size:keys_end])
+    right = array.array("q")
+    right.frombytes(data[keys_end:keys_end + size * 8])
+    left = data[keys_end + size * 8:]
+    _to_little_endian(keys)
+    _to_little_endian(right)
+    if sorter is CharSorter:
+        keys = [chr(item) for item in keys]
+
+    # Children always come after their parent in pre-order, so going forward every
+    # node knows its level, and going backwards every node has its children ready.
+    levels = [0] * size
+    nodes = []
+    for index in range(size):
+        level = levels[index]
+        nodes.append(node_class(sorter=sorter, node_value=keys[index], level=level))
+        if left[index]:
+            levels[index + 1] = level + 1
+        if right[index] >= 0:
+            levels[right[index]] = level + 1
+
+    for index in range(size - 1, -1, -1):
+        node = nodes[index]
+        if left[index]:
+            node._left_node = nodes[index + 1]
+        if right[index] >= 0:
+            node._right_node = nodes[right[index]]
+        node._update_subtree_stats()  # <- sizes (and heights of balanced nodes)
+    return nodes[0]
+
+
+def load(file: typing.BinaryIO) -> BinarySearchTreeNode:
+    """
+    Read a tree written by <dump> from a file opened in binary mode.
+    It has the same sorter, node class and shape than the tree we saved,
+    and no value is compared to place it.
+    """
+    return loads(file.read())
+
+
+class MappedBinarySearchTree:
+    """
+    Read only tree over a file written by <dump>, mapped in memory with mmap.
+    Keys and children indexes are memoryviews of the file pages, so opening it costs
+    the same for any size, and the OS loads the pages the queries touch, nothing else.
+    Only numeric sorters, chars are not saved the way they are compared.
+
+        with MappedBinarySearchTree("tree.bst") as tree:
+            assert 42 in tree
+    """
+
+    def __init__(self, path: typing.Union[str, os.PathLike]):
+        if sys.byteorder != "little":
+            raise InvalidStorageException("Mapped trees need a little endian machine.")
+
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self.sorter, _, self._size, key_size = _read_header(self._mmap)
+            if self.sorter is CharSorter:
+                raise InvalidStorageException("Mapped trees only support numeric sorters.")
+        except InvalidStorageException:
+            self._mmap.close()
+            raise
+
+        keys_end = HEADER.size + self._size * key_size
+        self._buffer = memoryview(self._mmap)
+        self._keys = self._buffer[HEADER.size:keys_end].cast(KEY_TYPECODES[self.sorter])
+        self._right = self._buffer[keys_end:keys_end + self._size * 8].cast("q")
+        self._left = self._buffer[keys_end + self._size * 8:]
+
+    def close(self):
+        """Release the file, views have to go before the map can be closed"""
+        for view in (self._keys, self._right, self._left, self._buffer):
+            view.release()
+        self._mmap.close()
+
+    def __enter__(self) -> "MappedBinarySearchTree":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def node_value(self) -> typing.Any:
+        """Value of the root node"""
+        return self._keys[0]
+
+    @property
+    def min_value(self) -> typing.Any:
+        """Get the lowest value of whole tree, the left child is the next index"""
+        index = 0
+        while self._left[index]:
+            index += 1
+        return self._keys[index]
+
+    @property
+    def max_value(self) -> typing.Any:
+        """Get the higher value of whole tree"""
+        index = 0
+        while self._right[index] >= 0:
+            index = self._right[index]
+        return self._keys[index]
+
+    def contains(self, value: typing.Any) -> bool:
+        """Check if the value is on the tree, walking down the saved shape"""
+        self.sorter.validate_value(value)
+        keys, left, right = self._keys, self._left, self._right
+        index = 0
+        while index >= 0:
+            key = keys[index]
+            if value == key:
+                return True
+            if value < key:
+                index = index + 1 if left[index] else -1
+            else:
+                index = right[index]
+        return False
+
+    def __contains__(self, value: typing.Any) -> bool:
+        return self.contains(value)
+
+    def get_ordered_values(self) -> list[typing.Any]:
+        """Get a list of all tree values ordered, with an explicit stack"""
+        keys, left, right = self._keys, self._left, self._right
+        result = []
+        stack = []
+        index = 0
+        while stack or index >= 0:
+            if index >= 0:
+                stack.append(index)
+                index = index + 1 if left[index] else -1
+                continue
+            index = stack.pop()
+            result.append(keys[index])
+            index = right[index]
+        return result
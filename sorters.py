@@ -3,11 +3,19 @@ Here we write "sorters" classes to be used from binary search tree nodes.
 The only goal of these sorters is to check if a value is considered lower than others.
 So there should a sorter for every data type that you want to store on the
 binary search trees.
+Trees find the sorter of their values type on a registry (see get_sorter_for_type),
+that register_sorter extends with sorters of our own.
 """
+import datetime
 import typing
 
 from errors import InvalidCharLenException, InvalidTypeException, EqualValuesException
 
+# Results of a three-way comparison (see BaseSorter.compare)
+LOWER = -1
+EQUAL = 0
+HIGHER = 1
+
 
 class BaseSorter:
     """
@@ -15,6 +23,12 @@ class BaseSorter:
     we put here some common logic.
     """
     allowed_type: typing.Type = None
+    # The allowed type own "<" and "==" give the same order as the sorter, so trees
+    # can compare values directly instead of calling <compare> on every level.
+    native_order: bool = True
+    # Function that gives the key a value is ordered by, computed once per value
+    # (see KeySorter), None when values are ordered by themselves.
+    key: typing.Optional[typing.Callable[[typing.Any], typing.Any]] = None
 
     @classmethod
     def validate_values(cls, a, b):
@@ -29,13 +43,58 @@ class BaseSorter:
         if a == b:
             raise EqualValuesException(f"Both values are equal.")
 
+    @classmethod
+    def validate_value(cls, value):
+        """
+        Validate a single value, we run it once when the value gets into the tree
+        so comparisons on the way down can trust it.
+        """
+        if not isinstance(value, cls.allowed_type):
+            raise InvalidTypeException(f"We allow {cls.allowed_type} value types only.")
+
     @classmethod
     def is_lower_than(cls, a, b) -> bool:
         """
         Check if first value is considered lower than the second.
         """
         cls.validate_values(a, b)
-        return a < b
+        try:
+            return a < b
+        except TypeError:
+            raise InvalidTypeException(f"We can not compare {a!r} and {b!r}.")
+
+    @classmethod
+    def unique_key(cls, value) -> typing.Hashable:
+        """Hashable that is the same for every value the sorter considers equal to this one"""
+        return value
+
+    @classmethod
+    def sort_unique(cls, values: typing.Iterable) -> list:
+        """
+        Order values the way a tree would, dropping duplicates (the first one wins),
+        this is what BinarySearchTreeNode.from_sorted expects to receive.
+        """
+        try:
+            return sorted(set(values))
+        except TypeError:
+            raise InvalidTypeException("We can not compare some of these values.")
+
+    @classmethod
+    def compare(cls, a, b) -> int:
+        """
+        Trusted three-way comparison: LOWER, EQUAL or HIGHER for a against b.
+        It does not validate anything and equal values are a result, not an exception,
+        values should be validated with <validate_value> before. Values of the allowed
+        type that still can not be compared raise InvalidTypeException.
+        """
+        try:
+            if a < b:
+                return LOWER
+            if b < a:
+                return HIGHER
+        except TypeError:
+            raise InvalidTypeException(f"We can not compare {a!r} and {b!r}.")
+        return EQUAL
 
 
 class IntegerSorter(BaseSorter):
@@ -46,11 +105,98 @@ class FloatSorter(BaseSorter):
     allowed_type = float
 
 
+class StringSorter(BaseSorter):
+    """Strings of any length, in python own order (the unicode number of each char)"""
+    allowed_type = str
+
+
+class BytesSorter(BaseSorter):
+    allowed_type = bytes
+
+
+class DateTimeSorter(BaseSorter):
+    """
+    Datetimes in time order. Naive and aware datetimes can not be compared,
+    so a tree holds only one of both kinds, the other raises InvalidTypeException.
+    """
+    allowed_type = datetime.datetime
+
+    @classmethod
+    def validate_values(cls, a: datetime.datetime, b: datetime.datetime):
+        if isinstance(a, cls.allowed_type) and isinstance(b, cls.allowed_type):
+            if (a.utcoffset() is None) != (b.utcoffset() is None):
+                raise InvalidTypeException("We can not compare naive and aware datetimes.")
+        super().validate_values(a, b)
+
+
+class TupleSorter(BaseSorter):
+    """
+    Tuples in python own order, item by item, so items at the same position
+    should be comparable between them (a composite key like (date, id)).
+    """
+    allowed_type = tuple
+
+
+class KeySorter(BaseSorter):
+    """
+    Sorter that orders values by a key of them, like sorted(values, key=...) does:
+    values with equal keys are the same value for the tree. Subclasses give the
+    allowed type and the key function:
+
+        class CaseInsensitiveSorter(KeySorter):
+            allowed_type = str
+            key = staticmethod(str.casefold)
+
+    Trees compute the key once per value, when it gets in, and keep it on the node
+    (see KeyedBinarySearchTreeNode), so the way down compares keys natively
+    instead of calling the key function on every level.
+    """
+    native_order = False
+
+    @staticmethod
+    def key(value: typing.Any) -> typing.Any:
+        raise NotImplementedError("Key sorters should define their key function.")
+
+    @classmethod
+    def validate_values(cls, a, b):
+        if not isinstance(a, cls.allowed_type) or not isinstance(b, cls.allowed_type):
+            raise InvalidTypeException(f"We allow {cls.allowed_type} value types only.")
+        if cls.key(a) == cls.key(b):
+            raise EqualValuesException(f"Both values are equal.")
+
+    @classmethod
+    def is_lower_than(cls, a, b) -> bool:
+        cls.validate_values(a, b)
+        return cls.key(a) < cls.key(b)
+
+    @classmethod
+    def unique_key(cls, value) -> typing.Hashable:
+        return cls.key(value)
+
+    @classmethod
+    def sort_unique(cls, values: typing.Iterable) -> list:
+        """Values with equal keys are duplicates (the first one wins), ordered by key"""
+        unique_values = {}
+        for value in values:
+            unique_values.setdefault(cls.key(value), value)
+        return [unique_values[key] for key in sorted(unique_values)]
+
+    @classmethod
+    def compare(cls, a, b) -> int:
+        a_key, b_key = cls.key(a), cls.key(b)
+        if a_key < b_key:
+            return LOWER
+        if b_key < a_key:
+            return HIGHER
+        return EQUAL
+
+
 class CharSorter(BaseSorter):
     """
     Note that this sorter requires some extra behavior to compare / validate values
     """
     allowed_type = str
+    native_order = False
 
     @classmethod
     def validate_values(cls, a: str, b: str):
@@ -66,9 +212,69 @@ class CharSorter(BaseSorter):
         if len(_a) > 1 or len(_b) > 1:
             raise InvalidCharLenException("We only accept string of length 1.")
 
+    @classmethod
+    def validate_value(cls, value: str):
+        super().validate_value(value)
+        if len(value) > 1:
+            raise InvalidCharLenException("We only accept string of length 1.")
+
+    @classmethod
+    def compare(cls, a: str, b: str) -> int:
+        """Chars are equal ignoring case, otherwise we compare the unicode number"""
+        if a.lower() == b.lower():
+            return EQUAL
+        return LOWER if ord(a) < ord(b) else HIGHER
+
+    @classmethod
+    def unique_key(cls, value: str) -> str:
+        """Chars are equal ignoring case"""
+        return value.lower()
+
+    @classmethod
+    def sort_unique(cls, values: typing.Iterable[str]) -> list[str]:
+        """Chars are duplicates when equal ignoring case, then we order by the unicode number"""
+        unique_values = {}
+        for value in values:
+            unique_values.setdefault(cls.unique_key(value), value)
+        return sorted(unique_values.values(), key=ord)
+
     @classmethod
     def is_lower_than(cls, a: str, b: str) -> bool:
         """Special handling for chars"""
         cls.validate_values(a, b)
         # In this case, we compare both by getting the unicode number of the char
         return ord(a) < ord(b)
+
+
+# Sorter of every type trees can hold, str keeps the single char sorter by default
+# (register StringSorter for longer strings)
+SORTERS_BY_TYPE: dict[typing.Type, typing.Type[BaseSorter]] = {
+    int: IntegerSorter,
+    float: FloatSorter,
+    str: CharSorter,
+    bytes: BytesSorter,
+    datetime.datetime: DateTimeSorter,
+    tuple: TupleSorter,
+}
+
+
+def register_sorter(_type: typing.Type, sorter: typing.Type[BaseSorter]):
+    """
+    Trees of values of the type use the sorter from now on, instead of the one
+    it had, if any. Only values of exactly that type get it (see get_sorter_for_type).
+    """
+    if not isinstance(sorter, type) or not issubclass(sorter, BaseSorter):
+        raise InvalidTypeException("Sorters should be BaseSorter subclasses.")
+    SORTERS_BY_TYPE[_type] = sorter
+
+
+def get_sorter_for_type(_type: typing.Type) -> typing.Optional[typing.Type[BaseSorter]]:
+    """
+    Gets the sorter registered for given type, None when there is no sorter.
+    Subclasses don't get the sorter of their parent class (bool is not an int tree),
+    but tuple ones do, so named tuples are tuples.
+    """
+    sorter = SORTERS_BY_TYPE.get(_type)
+    if sorter is None and issubclass(_type, tuple):
+        sorter = SORTERS_BY_TYPE.get(tuple)
+    return sorter
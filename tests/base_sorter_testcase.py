@@ -1,7 +1,7 @@
 import unittest
 
 from errors import InvalidTypeException, EqualValuesException
-from sorters import BaseSorter
+from sorters import BaseSorter, EQUAL, HIGHER, LOWER
 
 
 class BaseSorterTestCase:
@@ -71,3 +71,29 @@ class BaseSorterTestCase:
                     self.correct_value_bigger, self.correct_value_lower
                 )
             )
+
+        def test_validate_value(self):
+            """
+            Single value validation, trees run it once when a value gets in
+            so they can use the trusted compare on the way down.
+            """
+            self.sorter.validate_value(self.correct_value_lower)
+            with self.assertRaises(InvalidTypeException):
+                self.sorter.validate_value(self.incorrect_value)
+
+        def test_three_way_compare(self):
+            """
+            Trusted compare does not raise for equal values, equality is just another result
+            """
+            self.assertEqual(
+                self.sorter.compare(self.correct_value_lower, self.correct_value_bigger),
+                LOWER,
+            )
+            self.assertEqual(
+                self.sorter.compare(self.correct_value_bigger, self.correct_value_lower),
+                HIGHER,
+            )
+            self.assertEqual(
+                self.sorter.compare(self.correct_value_lower, self.correct_value_lower),
+                EQUAL,
+            )
@@ -0,0 +1,101 @@
+import random
+import unittest
+
+from array_binary_search_tree import ArrayBinarySearchTree
+from errors import InvalidStorageException, RootNodeDeleteException
+from make_bst import make_binary_search_tree
+from sorters import IntegerSorter
+
+
+class ArrayBinarySearchTreeTestCase(unittest.TestCase):
+    """
+    The array storage should give the very same answers than the node tree,
+    so most tests here build both and compare them.
+    """
+
+    def assert_same_tree(self, array_bst: ArrayBinarySearchTree, node_bst):
+        self.assertEqual(array_bst.get_ordered_values(), node_bst.get_ordered_values())
+        self.assertEqual(
+            array_bst.get_ordered_values(reverse=True),
+            node_bst.get_ordered_values(reverse=True),
+        )
+        self.assertEqual(array_bst.node_value, node_bst.node_value)
+        self.assertEqual(array_bst.min_value, node_bst.min_value)
+        self.assertEqual(array_bst.max_value, node_bst.max_value)
+        self.assertEqual(array_bst.depth, node_bst.depth)
+        self.assertEqual(array_bst.deepest_nodes, node_bst.deepest_nodes)
+
+    def test_make_array_tree(self):
+        int_bst = make_binary_search_tree(values=[12, 11, 90, 82, 7, 9], storage="array")
+        self.assertTrue(isinstance(int_bst, ArrayBinarySearchTree))
+        self.assertEqual(int_bst.sorter, IntegerSorter)
+        self.assertEqual(int_bst.get_ordered_values(), [7, 9, 11, 12, 82, 90])
+        self.assertEqual(int_bst.deepest_nodes, (3, [9]))
+        self.assertEqual(len(int_bst), 6)
+
+    def test_same_results_than_nodes(self):
+        values = [random.Random(i).randint(0, 1000) for i in range(500)]
+        self.assert_same_tree(
+            make_binary_search_tree(values=values, storage="array"),
+            make_binary_search_tree(values=values),
+        )
+        float_values = [i / 7 for i in values]
+        self.assert_same_tree(
+            make_binary_search_tree(values=float_values, storage="array"),
+            make_binary_search_tree(values=float_values),
+        )
+
+    def test_bulk_load(self):
+        values = list(range(1000, 0, -3))
+        array_bst = make_binary_search_tree(values=values, storage="array", bulk_load=True)
+        self.assertEqual(array_bst.sorter, IntegerSorter)
+        self.assert_same_tree(array_bst, make_binary_search_tree(values=values, bulk_load=True))
+
+    def test_remove_single_node(self):
+        values = [50, 25, 75, 12, 37, 62, 87, 30]
+        array_bst = make_binary_search_tree(values=values, storage="array")
+        node_bst = make_binary_search_tree(values=values)
+        self.assertTrue(array_bst.remove(25))
+        self.assertTrue(node_bst.remove(25))
+        self.assertTrue(array_bst.remove(30))  # <- it was a child of 25, still there
+        self.assertTrue(node_bst.remove(30))
+        self.assertFalse(array_bst.remove(31))
+        self.assert_same_tree(array_bst, node_bst)
+        self.assertEqual(len(array_bst), 6)
+
+        # Freed indexes are reused by next values
+        array_bst.add_multiple([10, 20, 5])
+        node_bst.add_multiple([10, 20, 5])
+        self.assert_same_tree(array_bst, node_bst)
+        self.assertEqual(len(array_bst._keys), len(values) + 1)
+
+    def test_remove_multiple_same_results_than_nodes(self):
+        values = [random.Random(i).randint(0, 1000) for i in range(300)]
+        array_bst = make_binary_search_tree(values=values, storage="array")
+        node_bst = make_binary_search_tree(values=values)
+        removed = values[::2] + [values[0]] + [1001]
+        self.assertEqual(
+            array_bst.remove_multiple(removed), node_bst.remove_multiple(removed)
+        )
+        self.assert_same_tree(array_bst, node_bst)
+
+    def test_remove_root(self):
+        float_bst = make_binary_search_tree(values=[0.5, 0.25], storage="array")
+        self.assertTrue(float_bst.remove(0.5))
+        self.assertEqual(float_bst.node_value, 0.25)
+        self.assertEqual(float_bst.depth, 0)
+        with self.assertRaises(RootNodeDeleteException):
+            float_bst.remove(0.25)  # <- last value
+
+    def test_chars_not_supported(self):
+        with self.assertRaises(InvalidStorageException):
+            make_binary_search_tree(values=["a", "b"], storage="array")
+
+    def test_balanced_not_supported(self):
+        with self.assertRaises(InvalidStorageException):
+            make_binary_search_tree(values=[1, 2], storage="array", balanced=True)
+
+    def test_int_out_of_64_bits(self):
+        int_bst = make_binary_search_tree(values=[1, 2], storage="array")
+        with self.assertRaises(InvalidStorageException):
+            int_bst.add(2 ** 64)
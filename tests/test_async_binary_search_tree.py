@@ -0,0 +1,98 @@
+import asyncio
+import datetime
+import unittest
+from unittest import mock
+
+from async_binary_search_tree import AsyncBinarySearchTree
+from balanced_binary_search_tree import BalancedBinarySearchTreeNode
+from errors import InvalidTypeException
+from make_bst import make_binary_search_tree
+
+
+async def produce(values: list):
+    for value in values:
+        await asyncio.sleep(0)
+        yield value
+
+
+class AsyncBinarySearchTreeTestCase(unittest.IsolatedAsyncioTestCase):
+    """
+    Adds from many coroutines should end up in a few add_multiple calls,
+    and the values should be on the tree once the adds return.
+    """
+
+    def setUp(self):
+        self.tree = make_binary_search_tree(values=[500], balanced=True)
+
+    async def test_concurrent_adds_are_batched(self):
+        async_tree = AsyncBinarySearchTree(self.tree, batch_size=100)
+        with mock.patch.object(
+            BalancedBinarySearchTreeNode,
+            "add_multiple",
+            autospec=True,
+            side_effect=BalancedBinarySearchTreeNode.add_multiple,
+        ) as add_multiple:
+            await asyncio.gather(*(async_tree.add(value) for value in range(1000)))
+        self.assertEqual(add_multiple.call_count, 10)
+        self.assertEqual(self.tree.get_ordered_values(), list(range(1000)))
+        self.assertEqual(len(async_tree), 1000)  # <- 500 was already there
+
+    async def test_adds_arriving_while_a_batch_runs(self):
+        async_tree = AsyncBinarySearchTree(self.tree, batch_size=10)
+        first_adds = [asyncio.create_task(async_tree.add(value)) for value in range(50)]
+        await asyncio.sleep(0)  # <- the first batch starts
+        second_adds = [asyncio.create_task(async_tree.add(value)) for value in range(50, 60)]
+        await asyncio.gather(*first_adds, *second_adds)
+        self.assertEqual(await async_tree.get_ordered_values(), list(range(60)) + [500])
+
+    async def test_add_invalid_value(self):
+        async_tree = AsyncBinarySearchTree(self.tree)
+        with self.assertRaises(InvalidTypeException):
+            await async_tree.add("a")
+        await async_tree.add(1)
+        self.assertTrue(await async_tree.contains(1))
+
+    async def test_value_that_can_not_be_compared_fails_alone(self):
+        """It passes validate_value and stops the batch half way, the rest of it still gets in"""
+        start = datetime.datetime(2020, 1, 1)
+        aware = datetime.datetime(2022, 1, 1, tzinfo=datetime.timezone.utc)
+        for multiset in (False, True):
+            datetime_bst = make_binary_search_tree(values=[start], multiset=multiset)
+            self.assertEqual(datetime_bst.max_value, start)
+            async_tree = AsyncBinarySearchTree(datetime_bst)
+            values = [
+                datetime.datetime(2021, 1, 1), datetime.datetime(2021, 1, 1), aware, datetime.datetime(2023, 1, 1)
+            ]
+            results = await asyncio.gather(*(async_tree.add(value) for value in values), return_exceptions=True)
+            with self.subTest(multiset=multiset):
+                self.assertEqual(results[:2] + results[3:], [None, None, None])
+                self.assertIsInstance(results[2], InvalidTypeException)
+                self.assertEqual(len(datetime_bst), 4 if multiset else 3)
+                self.assertEqual(datetime_bst.max_value, datetime.datetime(2023, 1, 1))
+
+    async def test_add_many(self):
+        async_tree = AsyncBinarySearchTree(self.tree, batch_size=7)
+        await async_tree.add_many(range(0, 100, 2))
+        await async_tree.add_many(produce(list(range(1, 100, 2))))
+        self.assertEqual(await async_tree.get_ordered_values(), list(range(100)) + [500])
+        self.assertEqual(
+            await async_tree.get_ordered_values(reverse=True), [500] + list(range(99, -1, -1))
+        )
+
+    async def test_flush(self):
+        async_tree = AsyncBinarySearchTree(self.tree)
+        task = asyncio.create_task(async_tree.add(1))
+        await asyncio.sleep(0)  # <- the add is pending, not on the tree yet
+        self.assertFalse(self.tree.contains(1))
+        await async_tree.flush()
+        self.assertTrue(self.tree.contains(1))
+        await task
+
+    async def test_queries(self):
+        async_tree = AsyncBinarySearchTree(self.tree)
+        await async_tree.add_many([100, 200, 300])
+        self.assertEqual(await async_tree.floor(250), 200)
+        self.assertEqual(await async_tree.rank(300), 2)
+        self.assertEqual(await async_tree.select(-1), 500)
+        with self.assertRaises(AttributeError):
+            async_tree.remove(100)
@@ -0,0 +1,120 @@
+import random
+import unittest
+
+from balanced_binary_search_tree import BalancedBinarySearchTreeNode
+from errors import RootNodeDeleteException
+from make_bst import make_binary_search_tree
+
+
+class BalancedBinarySearchTreeNodeTestCase(unittest.TestCase):
+    """
+    A balanced tree should behave exactly like a regular one from outside,
+    the only difference is the shape, so we check both things here.
+    """
+
+    def assert_valid_tree(self, tree: BalancedBinarySearchTreeNode):
+        """Walk the whole tree checking levels, heights, sizes and AVL balance of every node"""
+        stack = [tree]
+        while stack:
+            node = stack.pop()
+            self.assertIn(node.balance_factor, (-1, 0, 1))
+            for child in (node._left_node, node._right_node):
+                if child is not None:
+                    self.assertEqual(child.level, node.level + 1)
+                    stack.append(child)
+            node_height, node_size = node._height, node._size
+            node._update_subtree_stats()
+            self.assertEqual((node._height, node._size), (node_height, node_size))
+
+    def test_make_balanced_tree(self):
+        int_bst = make_binary_search_tree(values=[1, 2, 3], balanced=True)
+        self.assertTrue(isinstance(int_bst, BalancedBinarySearchTreeNode))
+        self.assertEqual(int_bst.node_value, 2)
+        self.assertTrue(int_bst.is_root)
+        self.assertEqual(int_bst._left_node.node_value, 1)
+        self.assertEqual(int_bst._right_node.node_value, 3)
+
+    def test_sorted_input_keeps_logarithmic_depth(self):
+        """
+        This is the whole point, 2047 sorted values would make a 2046 depth linked list,
+        balanced it should be a perfect tree of depth 10.
+        """
+        int_bst = make_binary_search_tree(values=list(range(2047)), balanced=True)
+        self.assertEqual(int_bst.depth, 10)
+        self.assertEqual(int_bst.get_ordered_values(), list(range(2047)))
+        self.assertEqual(int_bst.min_value, 0)
+        self.assertEqual(int_bst.max_value, 2046)
+        self.assert_valid_tree(int_bst)
+
+    def test_reverse_sorted_input(self):
+        float_bst = make_binary_search_tree(
+            values=[i / 10 for i in range(500, 0, -1)], balanced=True
+        )
+        self.assertLessEqual(float_bst.depth, 9)
+        self.assertEqual(
+            float_bst.get_ordered_values(), [i / 10 for i in range(1, 501)]
+        )
+        self.assert_valid_tree(float_bst)
+
+    def test_deepest_nodes_after_rotations(self):
+        """
+        Adding 1..5 leaves the following tree:
+
+                        2
+                       / \
+                      1   4
+                         / \
+                        3   5     <- deepest_nodes = (2, [3, 5])
+        """
+        int_bst = make_binary_search_tree(values=[1, 2, 3, 4, 5], balanced=True)
+        self.assertEqual(int_bst.deepest_nodes, (2, [3, 5]))
+
+    def test_cached_properties_refresh_after_add(self):
+        int_bst = make_binary_search_tree(values=[10, 20, 30], balanced=True)
+        self.assertEqual(int_bst.max_value, 30)
+        self.assertEqual(int_bst.depth, 1)
+        int_bst.add_multiple([40, 50, 60])
+        self.assertEqual(int_bst.max_value, 60)
+        self.assertEqual(int_bst.depth, 2)
+        self.assertEqual(int_bst.deepest_nodes, (2, [10, 30, 60]))
+
+    def test_duplicates_are_ignored(self):
+        char_bst = make_binary_search_tree(values=["b", "a", "c", "a", "b"], balanced=True)
+        self.assertEqual(char_bst.get_ordered_values(), ["a", "b", "c"])
+
+    def test_remove_keeps_balance(self):
+        values = list(range(300))
+        random.Random(7).shuffle(values)
+        int_bst = make_binary_search_tree(values=values, balanced=True)
+        removed = [i for i in values[1:] if i % 3]
+        for value in removed:
+            self.assertTrue(int_bst.remove(value))
+        self.assertEqual(
+            int_bst.get_ordered_values(),
+            sorted(set(values) - set(removed)),
+        )
+        self.assert_valid_tree(int_bst)
+
+    def test_remove_missing_value(self):
+        int_bst = make_binary_search_tree(values=[5, 3, 8], balanced=True)
+        self.assertFalse(int_bst.remove(42))
+        self.assertEqual(int_bst.get_ordered_values(), [3, 5, 8])
+
+    def test_remove_root(self):
+        int_bst = make_binary_search_tree(values=[5, 3, 8], balanced=True)
+        self.assertTrue(int_bst.remove(5))
+        self.assertEqual(int_bst.get_ordered_values(), [3, 8])
+        self.assertTrue(int_bst.remove(8))
+        self.assertEqual(int_bst.get_ordered_values(), [3])
+        self.assert_valid_tree(int_bst)
+        with self.assertRaises(RootNodeDeleteException):
+            int_bst.remove(3)  # <- last value
+
+    def test_remove_multiple_keeps_balance(self):
+        values = list(range(500))
+        random.Random(11).shuffle(values)
+        int_bst = make_binary_search_tree(values=values, balanced=True)
+        self.assertEqual(int_bst.remove_multiple(values[:400] + [1000]), 400)
+        self.assertEqual(int_bst.get_ordered_values(), sorted(values[400:]))
+        self.assertEqual(len(int_bst), 100)
+        self.assert_valid_tree(int_bst)
@@ -0,0 +1,56 @@
+import itertools
+import unittest
+
+from make_bst import make_binary_search_tree
+
+
+class BinarySearchTreeIterationTestCase(unittest.TestCase):
+    """
+    Iterating a tree gives its ordered values one by one, without building the whole list.
+    """
+
+    def setUp(self):
+        self.values = [50, 25, 75, 12, 37, 62, 87, 30, 40]
+        self.int_bst = make_binary_search_tree(values=self.values)
+
+    def test_iter(self):
+        self.assertEqual(list(self.int_bst), sorted(self.values))
+        self.assertEqual(list(reversed(self.int_bst)), sorted(self.values, reverse=True))
+        self.assertEqual(
+            list(self.int_bst.iter_ordered(reverse=True)), sorted(self.values, reverse=True)
+        )
+
+    def test_iter_first_values(self):
+        self.assertEqual(list(itertools.islice(self.int_bst, 3)), [12, 25, 30])
+
+    def test_iter_is_lazy(self):
+        """The iterator should not read anything until asked to"""
+        values = self.int_bst.iter_ordered()
+        self.int_bst.add(1)
+        self.assertEqual(next(values), 1)
+
+    def test_range(self):
+        self.assertEqual(list(self.int_bst.range(30, 62)), [30, 37, 40, 50, 62])
+        self.assertEqual(list(self.int_bst.range(31, 61)), [37, 40, 50])
+        self.assertEqual(list(self.int_bst.range(30, 62, inclusive=False)), [37, 40, 50])
+        self.assertEqual(
+            list(self.int_bst.range(30, 62, inclusive=(False, True))), [37, 40, 50, 62]
+        )
+        self.assertEqual(list(self.int_bst.range(63, 70)), [])
+
+    def test_range_open_limits(self):
+        self.assertEqual(list(self.int_bst.range(high=30)), [12, 25, 30])
+        self.assertEqual(list(self.int_bst.range(low=62)), [62, 75, 87])
+        self.assertEqual(list(self.int_bst.range()), sorted(self.values))
+
+    def test_range_against_ordered_values(self):
+        float_bst = make_binary_search_tree(values=[i / 4 for i in range(200)], balanced=True)
+        for low, high in ((0.0, 10.0), (3.3, 7.7), (-1.0, 100.0), (49.75, 49.75)):
+            self.assertEqual(
+                list(float_bst.range(low, high)),
+                [i for i in float_bst.get_ordered_values() if low <= i <= high],
+            )
+
+    def test_range_chars(self):
+        char_bst = make_binary_search_tree(values=["m", "c", "x", "a", "q"])
+        self.assertEqual(list(char_bst.range("b", "q")), ["c", "m", "q"])
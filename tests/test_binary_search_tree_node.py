@@ -1,6 +1,10 @@
+import random
 import unittest
 
+import binary_search_tree
+from errors import InvalidTypeException, RootNodeDeleteException
 from make_bst import make_binary_search_tree
+from sorters import IntegerSorter
 
 
 class BinarySearchTreeNode(unittest.TestCase):
@@ -80,6 +84,48 @@ class BinarySearchTreeNode(unittest.TestCase):
         char_bst = make_binary_search_tree(values=["M", "D", "Y", "C"])
         self.assertEqual(char_bst.deepest_nodes, (2, ["C"]))
 
+    def test_deepest_nodes_of_a_subtree(self):
+        int_bst = make_binary_search_tree(values=[50, 25, 75, 10, 30, 80, 5, 35])
+        self.assertEqual(int_bst.deepest_nodes, (3, [5, 35]))
+        self.assertEqual(int_bst._right_node.deepest_nodes, (2, [80]))
+
+    def test_heights_follow_adds_and_removes(self):
+        """
+        Every node keeps the height of its subtree, so depth is its level plus its height,
+        it should be the same than the deepest leaf level after any change.
+        """
+        generator = random.Random(7)
+        int_bst = make_binary_search_tree(values=[500])
+        for _ in range(300):
+            value = generator.randint(0, 1000)
+            if generator.random() < 0.3 and len(int_bst) > 1:
+                int_bst.remove(value)
+            else:
+                int_bst.add(value)
+            self.assertEqual(int_bst.depth, max(node.level for node in int_bst.leaf_nodes))
+        stack = [int_bst]
+        while stack:
+            node = stack.pop()
+            node_height = node._height
+            node._update_subtree_stats()
+            self.assertEqual(node._height, node_height)
+            stack.extend(child for child in (node._left_node, node._right_node) if child is not None)
+
+    def test_level_histogram(self):
+        """
+        Check the following tree:
+                    77          <- 1 node
+                   /  \
+                 55    94       <- 2 nodes
+                /
+               13               <- 1 node
+        """
+        int_bst = make_binary_search_tree(values=[77, 55, 94, 13])
+        self.assertEqual(int_bst.level_histogram(), [1, 2, 1])
+        self.assertEqual(int_bst._left_node.level_histogram(), [1, 1])
+        sorted_bst = make_binary_search_tree(values=list(range(5)))
+        self.assertEqual(sorted_bst.level_histogram(), [1, 1, 1, 1, 1])
+
     def test_min_value(self):
         """
         This value should the lowest one in the tree (or down bellow the node where it was read).
@@ -127,6 +173,62 @@ class BinarySearchTreeNode(unittest.TestCase):
         char_bst.remove("z")
         self.assertEqual(char_bst.max_value, "x")
 
+    def test_remove_keeps_children(self):
+        r"""
+        Only the node goes away, 25 has two children so 30 (its successor) takes its place,
+        and 37 moves up a level.
+                    50                      50
+                   /  \                    /  \
+                 25    75       ->       30    75
+                /  \                    /  \
+              12    37                12    37
+                   /
+                 30
+        """
+        int_bst = make_binary_search_tree(values=[50, 25, 75, 12, 37, 30])
+        self.assertEqual(int_bst.depth, 3)
+        self.assertTrue(int_bst.remove(25))
+        self.assertEqual(int_bst.get_ordered_values(), [12, 30, 37, 50, 75])
+        self.assertEqual(int_bst._left_node.node_value, 30)
+        self.assertEqual(int_bst.deepest_nodes, (2, [12, 37]))
+        self.assertEqual(len(int_bst), 5)
+        self.assertFalse(int_bst.remove(25))
+
+    def test_remove_root(self):
+        """The root object stays the root, it takes the value of the node that replaces it"""
+        int_bst = make_binary_search_tree(values=[10, 5, 3])
+        self.assertTrue(int_bst.remove(10))
+        self.assertEqual(int_bst.node_value, 5)
+        self.assertEqual(int_bst._left_node.level, 1)
+        self.assertEqual(int_bst.deepest_nodes, (1, [3]))
+        self.assertTrue(int_bst.remove(5))
+        self.assertEqual(int_bst.get_ordered_values(), [3])
+        with self.assertRaises(RootNodeDeleteException):
+            int_bst.remove(3)  # <- last value
+
+    def test_remove_multiple(self):
+        values = list(range(200))
+        random.Random(5).shuffle(values)
+        int_bst = make_binary_search_tree(values=values)
+        self.assertEqual(int_bst.min_value, 0)
+        self.assertEqual(int_bst.remove_multiple(range(0, 200, 2)), 100)
+        self.assertEqual(int_bst.remove_multiple([0, 2]), 0)
+        self.assertEqual(int_bst.get_ordered_values(), list(range(1, 200, 2)))
+        self.assertEqual(int_bst.min_value, 1)
+        self.assertEqual(len(int_bst), 100)
+        with self.assertRaises(InvalidTypeException):
+            int_bst.remove_multiple([1, "a"])
+
+    def test_add_invalid_type(self):
+        """
+        Values get validated once when they get into the tree
+        """
+        int_bst = make_binary_search_tree(values=[5, 7, 1])
+        with self.assertRaises(InvalidTypeException):
+            int_bst.add("a")
+        with self.assertRaises(InvalidTypeException):
+            int_bst.add_multiple([8, 9.5])
+
     def test_add_multiple(self):
         """
         Test add_multiple by checking ordered_values
@@ -146,3 +248,29 @@ class BinarySearchTreeNode(unittest.TestCase):
     def test_challenge_example_2(self):
         int_bst = make_binary_search_tree(values=[26, 82, 16, 92, 33])
         self.assertEqual(int_bst.deepest_nodes, (2, [33, 92]))
+
+    def test_skewed_tree_deeper_than_recursion_limit(self):
+        """
+        Sorted values make a tree that is actually a linked list, every operation should
+        still work when it is way deeper than the interpreter recursion limit.
+        We link the nodes by hand, adding them one by one would take too long.
+        """
+        size = 5000
+        int_bst = node = binary_search_tree.BinarySearchTreeNode(sorter=IntegerSorter, node_value=0)
+        for value in range(1, size):
+            node._right_node = binary_search_tree.BinarySearchTreeNode(
+                sorter=IntegerSorter, node_value=value, level=value
+            )
+            node = node._right_node
+
+        int_bst.add(size)
+        self.assertEqual(int_bst.get_ordered_values(), list(range(size + 1)))
+        self.assertEqual(
+            int_bst.get_ordered_values(reverse=True), list(range(size, -1, -1))
+        )
+        self.assertEqual(int_bst.min_value, 0)
+        self.assertEqual(int_bst.max_value, size)
+        self.assertEqual(int_bst.deepest_nodes, (size, [size]))
+        self.assertTrue(int_bst.remove(size))
+        self.assertEqual(int_bst.max_value, size - 1)
+        self.assertEqual([i.node_value for i in int_bst.leaf_nodes], [size - 1])
@@ -0,0 +1,112 @@
+import random
+import unittest
+
+from errors import InvalidTypeException
+from make_bst import make_binary_search_tree
+
+
+class BinarySearchTreeOrderStatisticsTestCase(unittest.TestCase):
+    """
+    Every node knows the size of its subtree, so positions can be answered
+    without walking the values. We check them against the ordered values list
+    on every kind of tree, and after the changes that move sizes around.
+    """
+
+    def make_trees(self, values: list) -> dict:
+        return {
+            "regular": make_binary_search_tree(values=values),
+            "balanced": make_binary_search_tree(values=values, balanced=True),
+            "bulk_load": make_binary_search_tree(values=values, bulk_load=True),
+        }
+
+    def assert_sizes(self, tree):
+        """Walk the whole tree checking that every node size matches its children"""
+        stack = [tree]
+        while stack:
+            node = stack.pop()
+            expected_size = 1
+            for child in (node._left_node, node._right_node):
+                if child is not None:
+                    expected_size += child._size
+                    stack.append(child)
+            self.assertEqual(node._size, expected_size)
+
+    def setUp(self):
+        self.values = list(range(0, 400, 2))
+        random.Random(3).shuffle(self.values)
+        self.ordered_values = sorted(self.values)
+
+    def test_len(self):
+        for name, tree in self.make_trees(self.values).items():
+            with self.subTest(name):
+                self.assertEqual(len(tree), 200)
+                self.assert_sizes(tree)
+
+    def test_rank(self):
+        for name, tree in self.make_trees(self.values).items():
+            with self.subTest(name):
+                for index, value in enumerate(self.ordered_values):
+                    self.assertEqual(tree.rank(value), index)
+                    self.assertEqual(tree.rank(value + 1), index + 1)  # <- not on tree
+                self.assertEqual(tree.rank(-1), 0)
+
+    def test_rank_invalid_type(self):
+        with self.assertRaises(InvalidTypeException):
+            make_binary_search_tree(values=[5, 3, 8]).rank("a")
+
+    def test_select(self):
+        for name, tree in self.make_trees(self.values).items():
+            with self.subTest(name):
+                for index, value in enumerate(self.ordered_values):
+                    self.assertEqual(tree.select(index), value)
+                self.assertEqual(tree.select(-1), 398)
+                for index in (200, -201):
+                    with self.assertRaises(IndexError):
+                        tree.select(index)
+
+    def test_count_between(self):
+        int_bst = make_binary_search_tree(values=[50, 25, 75, 12, 37, 62, 87])
+        self.assertEqual(int_bst.count_between(25, 75), 5)
+        self.assertEqual(int_bst.count_between(25, 75, inclusive=False), 3)
+        self.assertEqual(int_bst.count_between(25, 75, inclusive=(True, False)), 4)
+        self.assertEqual(int_bst.count_between(26, 74), 3)
+        self.assertEqual(int_bst.count_between(75, 25), 0)
+        self.assertEqual(int_bst.count_between(0, 100), 7)
+
+    def test_count_between_matches_range(self):
+        tree = make_binary_search_tree(values=self.values, balanced=True)
+        for low, high in ((0, 398), (13, 101), (100, 100), (101, 101)):
+            self.assertEqual(
+                tree.count_between(low, high), len(list(tree.range(low, high)))
+            )
+
+    def test_percentile(self):
+        int_bst = make_binary_search_tree(values=list(range(1, 101)))
+        self.assertEqual(int_bst.percentile(0), 1)
+        self.assertEqual(int_bst.percentile(50), 50)
+        self.assertEqual(int_bst.percentile(99.5), 100)
+        self.assertEqual(int_bst.percentile(100), 100)
+        for percent in (-1, 101):
+            with self.assertRaises(ValueError):
+                int_bst.percentile(percent)
+
+    def test_char_tree(self):
+        char_bst = make_binary_search_tree(values=["d", "b", "a", "c", "e"])
+        self.assertEqual(char_bst.rank("c"), 2)
+        self.assertEqual(char_bst.select(3), "d")
+
+    def test_sizes_after_changes(self):
+        for name, tree in self.make_trees(self.values).items():
+            with self.subTest(name):
+                tree.add(1)
+                tree.add(1)  # <- duplicates do not change sizes
+                tree.add_multiple([3, 5, 401])
+                self.assertEqual(len(tree), 204)
+                self.assert_sizes(tree)
+
+                tree.remove_multiple(self.values[:40])
+                self.assertEqual(len(tree), len(tree.get_ordered_values()))
+                self.assert_sizes(tree)
+                for index, value in enumerate(tree.get_ordered_values()):
+                    self.assertEqual(tree.select(index), value)
+                    self.assertEqual(tree.rank(value), index)
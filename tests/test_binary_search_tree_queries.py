@@ -0,0 +1,85 @@
+import unittest
+
+from errors import InvalidTypeException
+from make_bst import make_binary_search_tree
+
+
+class BinarySearchTreeQueriesTestCase(unittest.TestCase):
+    """
+    Lookups follow the tree structure, one comparison per level. Tests use this tree:
+
+                    50
+                  /    \\
+                25      75
+               /  \\    /  \\
+             12    37  62   87
+    """
+
+    def setUp(self):
+        self.values = [50, 25, 75, 12, 37, 62, 87]
+        self.int_bst = make_binary_search_tree(values=self.values)
+
+    def test_find(self):
+        node = self.int_bst.find(37)
+        self.assertEqual(node.node_value, 37)
+        self.assertEqual(node.level, 2)
+        self.assertIsNone(self.int_bst.find(38))
+
+    def test_contains(self):
+        for value in self.values:
+            self.assertTrue(self.int_bst.contains(value))
+            self.assertIn(value, self.int_bst)
+        self.assertFalse(self.int_bst.contains(51))
+        self.assertNotIn(0, self.int_bst)
+
+    def test_contains_invalid_type(self):
+        with self.assertRaises(InvalidTypeException):
+            self.int_bst.contains("a")
+
+    def test_floor(self):
+        self.assertEqual(self.int_bst.floor(37), 37)
+        self.assertEqual(self.int_bst.floor(40), 37)
+        self.assertEqual(self.int_bst.floor(61), 50)
+        self.assertEqual(self.int_bst.floor(1000), 87)
+        self.assertIsNone(self.int_bst.floor(11))
+
+    def test_ceiling(self):
+        self.assertEqual(self.int_bst.ceiling(37), 37)
+        self.assertEqual(self.int_bst.ceiling(40), 50)
+        self.assertEqual(self.int_bst.ceiling(13), 25)
+        self.assertEqual(self.int_bst.ceiling(-5), 12)
+        self.assertIsNone(self.int_bst.ceiling(88))
+
+    def test_predecessor(self):
+        self.assertEqual(self.int_bst.predecessor(50), 37)
+        self.assertEqual(self.int_bst.predecessor(62), 50)
+        self.assertEqual(self.int_bst.predecessor(63), 62)
+        self.assertIsNone(self.int_bst.predecessor(12))
+
+    def test_successor(self):
+        self.assertEqual(self.int_bst.successor(50), 62)
+        self.assertEqual(self.int_bst.successor(37), 50)
+        self.assertEqual(self.int_bst.successor(0), 12)
+        self.assertIsNone(self.int_bst.successor(87))
+
+    def test_every_value_against_ordered_values(self):
+        ordered_values = self.int_bst.get_ordered_values()
+        for value in range(0, 100):
+            lower = [i for i in ordered_values if i < value]
+            higher = [i for i in ordered_values if i > value]
+            self.assertEqual(self.int_bst.predecessor(value), lower[-1] if lower else None)
+            self.assertEqual(self.int_bst.successor(value), higher[0] if higher else None)
+
+    def test_chars(self):
+        char_bst = make_binary_search_tree(values=["m", "c", "x", "a"])
+        self.assertIn("A", char_bst)  # <- chars are equal ignoring case
+        self.assertEqual(char_bst.floor("d"), "c")
+        self.assertEqual(char_bst.ceiling("n"), "x")
+
+    def test_balanced_tree(self):
+        float_bst = make_binary_search_tree(
+            values=[i / 2 for i in range(100)], balanced=True
+        )
+        self.assertIn(10.5, float_bst)
+        self.assertEqual(float_bst.floor(10.7), 10.5)
+        self.assertEqual(float_bst.successor(10.5), 11.0)
@@ -0,0 +1,109 @@
+import random
+import unittest
+
+from balanced_binary_search_tree import BalancedBinarySearchTreeNode
+from errors import InvalidTypeException, SorterMismatchException
+from make_bst import make_binary_search_tree
+
+
+class BinarySearchTreeSetOperationsTestCase(unittest.TestCase):
+    """
+    Set operations merge the ordered values of both trees in a single pass,
+    we check them against python sets, and that both trees are left untouched.
+    """
+
+    def setUp(self):
+        generator = random.Random(1)
+        self.values = [generator.randint(0, 300) for _ in range(200)]
+        self.other_values = [generator.randint(150, 450) for _ in range(200)]
+        self.int_bst = make_binary_search_tree(values=self.values)
+        self.other_bst = make_binary_search_tree(values=self.other_values, balanced=True)
+
+    def assert_untouched(self):
+        self.assertEqual(self.int_bst.get_ordered_values(), sorted(set(self.values)))
+        self.assertEqual(self.other_bst.get_ordered_values(), sorted(set(self.other_values)))
+
+    def test_union(self):
+        union_bst = self.int_bst.union(self.other_bst)
+        self.assertEqual(
+            union_bst.get_ordered_values(), sorted(set(self.values) | set(self.other_values))
+        )
+        self.assertEqual(len(union_bst), len(set(self.values) | set(self.other_values)))
+        self.assertEqual(union_bst.depth, len(union_bst).bit_length() - 1)  # <- minimum height
+        self.assert_untouched()
+
+    def test_intersection(self):
+        intersection_bst = self.int_bst.intersection(self.other_bst)
+        self.assertEqual(
+            intersection_bst.get_ordered_values(),
+            sorted(set(self.values) & set(self.other_values)),
+        )
+        self.assert_untouched()
+
+    def test_difference(self):
+        self.assertEqual(
+            self.int_bst.difference(self.other_bst).get_ordered_values(),
+            sorted(set(self.values) - set(self.other_values)),
+        )
+        self.assertEqual(
+            self.other_bst.difference(self.int_bst).get_ordered_values(),
+            sorted(set(self.other_values) - set(self.values)),
+        )
+        self.assert_untouched()
+
+    def test_empty_results(self):
+        int_bst = make_binary_search_tree(values=[1, 2, 3])
+        self.assertIsNone(int_bst.intersection(make_binary_search_tree(values=[4, 5])))
+        self.assertIsNone(int_bst.difference(make_binary_search_tree(values=[3, 2, 1])))
+
+    def test_result_class(self):
+        self.assertTrue(
+            isinstance(self.other_bst.union(self.int_bst), BalancedBinarySearchTreeNode)
+        )
+        self.assertFalse(
+            isinstance(self.int_bst.union(self.other_bst), BalancedBinarySearchTreeNode)
+        )
+
+    def test_merge(self):
+        """The root object is still the root, and the tree works as usual after it"""
+        root = self.int_bst
+        self.assertEqual(root.max_value, max(self.values))
+        root.merge(self.other_bst)
+        expected_values = sorted(set(self.values) | set(self.other_values))
+        self.assertIs(self.int_bst, root)
+        self.assertEqual(root.get_ordered_values(), expected_values)
+        self.assertEqual(root.max_value, max(self.other_values))
+        self.assertEqual(len(root), len(expected_values))
+        self.assertEqual(root.select(10), expected_values[10])
+        root.add(1000)
+        root.remove(expected_values[0])
+        self.assertEqual(root.get_ordered_values(), expected_values[1:] + [1000])
+
+    def test_merge_balanced(self):
+        int_bst = make_binary_search_tree(values=[1, 2, 3], balanced=True)
+        int_bst.merge(make_binary_search_tree(values=list(range(3, 100))))
+        int_bst.add_multiple(range(100, 200))
+        self.assertEqual(int_bst.get_ordered_values(), list(range(1, 200)))
+        self.assertLessEqual(int_bst.depth, 9)
+
+    def test_split(self):
+        lower_bst, upper_bst = self.int_bst.split(150)
+        self.assertEqual(
+            lower_bst.get_ordered_values(), sorted(i for i in set(self.values) if i < 150)
+        )
+        self.assertEqual(
+            upper_bst.get_ordered_values(), sorted(i for i in set(self.values) if i >= 150)
+        )
+        lower_bst, upper_bst = self.int_bst.split(-1)
+        self.assertIsNone(lower_bst)
+        self.assertEqual(len(upper_bst), len(self.int_bst))
+        self.assertIsNone(self.int_bst.split(1000)[1])
+        self.assert_untouched()
+
+    def test_sorter_mismatch(self):
+        float_bst = make_binary_search_tree(values=[0.5, 1.5])
+        for operation in ("union", "intersection", "difference", "merge"):
+            with self.assertRaises(SorterMismatchException):
+                getattr(self.int_bst, operation)(float_bst)
+        with self.assertRaises(InvalidTypeException):
+            self.int_bst.split(0.5)
@@ -0,0 +1,82 @@
+import random
+import unittest
+
+from balanced_binary_search_tree import BalancedBinarySearchTreeNode
+from binary_search_tree import BinarySearchTreeNode
+from make_bst import make_binary_search_tree
+from sorters import CharSorter, IntegerSorter
+
+
+class BulkLoadTestCase(unittest.TestCase):
+    """
+    Bulk load sorts and removes duplicates once, then builds the tree from the middle value,
+    so no comparison is needed to place the nodes and the depth is the minimum possible.
+    """
+
+    def assert_levels(self, tree: BinarySearchTreeNode):
+        """Every child should be exactly one level below its parent"""
+        stack = [tree]
+        while stack:
+            node = stack.pop()
+            for child in (node._left_node, node._right_node):
+                if child is not None:
+                    self.assertEqual(child.level, node.level + 1)
+                    stack.append(child)
+
+    def test_from_sorted(self):
+        r"""
+        [1, 2, 3, 4, 5, 6, 7] makes a perfect tree:
+
+                    4
+                  /   \
+                 2     6
+                / \   / \
+               1   3 5   7
+        """
+        int_bst = BinarySearchTreeNode.from_sorted(
+            sorter=IntegerSorter, values=[1, 2, 3, 4, 5, 6, 7]
+        )
+        self.assertEqual(int_bst.node_value, 4)
+        self.assertTrue(int_bst.is_root)
+        self.assertEqual(int_bst._left_node.node_value, 2)
+        self.assertEqual(int_bst._right_node.node_value, 6)
+        self.assertEqual(int_bst.deepest_nodes, (2, [1, 3, 5, 7]))
+        self.assert_levels(int_bst)
+
+    def test_bulk_load_sorts_and_removes_duplicates(self):
+        values = [random.Random(3).randint(0, 500) for _ in range(2000)]
+        int_bst = make_binary_search_tree(values=values, bulk_load=True)
+        self.assertEqual(int_bst.get_ordered_values(), sorted(set(values)))
+        self.assertEqual(int_bst.depth, len(set(values)).bit_length() - 1)
+        self.assertEqual(int_bst.min_value, min(values))
+        self.assertEqual(int_bst.max_value, max(values))
+        self.assert_levels(int_bst)
+
+    def test_bulk_load_sorted_input(self):
+        """Sorted input is the worst case for one by one adds, here it does not matter"""
+        float_bst = make_binary_search_tree(
+            values=[i / 4 for i in range(10000)], bulk_load=True
+        )
+        self.assertEqual(float_bst.depth, 13)
+        self.assertEqual(float_bst.get_ordered_values(), [i / 4 for i in range(10000)])
+
+    def test_bulk_load_chars(self):
+        """Chars equal ignoring case are duplicates, the first one is kept"""
+        char_bst = make_binary_search_tree(values=["d", "B", "a", "b", "c"], bulk_load=True)
+        self.assertEqual(char_bst.sorter, CharSorter)
+        self.assertEqual(char_bst.get_ordered_values(), ["B", "a", "c", "d"])
+
+    def test_bulk_load_balanced(self):
+        """A bulk loaded balanced tree should keep balancing on later adds"""
+        int_bst = make_binary_search_tree(values=list(range(100)), balanced=True, bulk_load=True)
+        self.assertTrue(isinstance(int_bst, BalancedBinarySearchTreeNode))
+        int_bst.add_multiple(range(100, 1000))
+        self.assertEqual(int_bst.get_ordered_values(), list(range(1000)))
+        self.assertLessEqual(int_bst.depth, 13)
+        self.assert_levels(int_bst)
+
+    def test_add_after_bulk_load(self):
+        int_bst = make_binary_search_tree(values=[10, 20, 30], bulk_load=True)
+        int_bst.add(25)
+        self.assertEqual(int_bst.get_ordered_values(), [10, 20, 25, 30])
+        self.assertEqual(int_bst.deepest_nodes, (2, [25]))
@@ -0,0 +1,11 @@
+from sorters import BytesSorter
+from tests.base_sorter_testcase import BaseSorterTestCase
+
+
+class BytesSorterTestCase(BaseSorterTestCase.TestCase):
+    """
+    Tests collection for BytesSorter
+    """
+    sorter = BytesSorter
+    correct_value_lower = b"\x00\xff"
+    correct_value_bigger = b"\x01"
@@ -0,0 +1,101 @@
+import unittest
+
+from binary_search_tree import BinarySearchTreeNode
+from errors import InvalidTypeException
+from make_bst import make_binary_search_tree
+
+
+class CacheManagerTestCase(unittest.TestCase):
+    """
+    Cached properties make reads cheap, but a stale cache is worse than no cache at all.
+    Here we check that we clear what changed, and only that.
+    """
+
+    def test_cached_properties_registry(self):
+        """Every class knows its cached properties since it is created, no dir() scan needed"""
+        self.assertEqual(
+            set(BinarySearchTreeNode._cached_properties),
+            {"leaf_nodes", "depth", "deepest_nodes", "min_value", "max_value", "_sorted_keys"},
+        )
+
+    def test_nodes_have_no_dict(self):
+        """
+        Nodes are slotted to keep them small, the cache dict only exists after some read
+        """
+        for balanced in (False, True):
+            int_bst = make_binary_search_tree(values=[5, 3, 8], balanced=balanced)
+            self.assertFalse(hasattr(int_bst, "__dict__"))
+            self.assertIsNone(int_bst._left_node._cache)
+            self.assertEqual(int_bst.depth, 1)
+            self.assertEqual(int_bst._cache["depth"], 1)
+            self.assertIsNone(int_bst._left_node._cache)
+
+    def test_clear_some_cached_properties(self):
+        int_bst = make_binary_search_tree(values=[5, 3, 8])
+        self.assertEqual((int_bst.min_value, int_bst.max_value), (3, 8))
+        int_bst.clear_cached_properties(properties=["min_value"])
+        self.assertNotIn("min_value", int_bst._cache)
+        self.assertIn("max_value", int_bst._cache)
+
+    def test_add_clears_path_only(self):
+        """
+        Adding 2 goes through 10 and 5, the right side of root knows nothing about it
+        so its cached values should survive.
+
+                    10
+                   /  \
+                  5    20
+                 /
+                2
+        """
+        int_bst = make_binary_search_tree(values=[10, 5, 20])
+        right_node = int_bst._right_node
+        self.assertEqual(right_node.max_value, 20)
+        self.assertEqual(int_bst.min_value, 5)
+        int_bst.add(2)
+        self.assertIn("max_value", right_node._cache)
+        self.assertEqual(int_bst.min_value, 2)
+
+    def test_add_with_bypass_cache_clear(self):
+        """The caller asked to clear the cache by itself, so the old value is still there"""
+        int_bst = make_binary_search_tree(values=[10, 5, 20])
+        self.assertEqual(int_bst.min_value, 5)
+        int_bst.add(2, bypass_cache_clear=True)
+        self.assertEqual(int_bst.min_value, 5)
+        int_bst.clear_cached_properties()
+        self.assertEqual(int_bst.min_value, 2)
+
+    def test_add_with_bypass_cache_clear_gives_dirty_nodes(self):
+        """Clearing the root only leaves the subtrees stale, the nodes add gives back are all of them"""
+        int_bst = make_binary_search_tree(values=[50, 25, 75, 10])
+        left_node = int_bst._left_node
+        self.assertEqual(left_node.min_value, 10)
+        dirty_nodes = int_bst.add(5, bypass_cache_clear=True)
+        self.assertEqual([node.node_value for node in dirty_nodes], [50, 25, 10])
+        int_bst.clear_cached_nodes(dirty_nodes)
+        self.assertEqual(left_node.min_value, 5)
+        self.assertIsNone(int_bst.add(5, bypass_cache_clear=True))  # <- already there, nothing stale
+
+    def test_add_multiple_clears_dirty_nodes_when_a_value_fails(self):
+        """Values added before the invalid one stay on the tree, their paths should not be stale"""
+        int_bst = make_binary_search_tree(values=[50, 25, 75])
+        self.assertEqual((int_bst.max_value, int_bst.depth), (75, 1))
+        with self.assertRaises(InvalidTypeException):
+            int_bst.add_multiple([100, 200, "x"])
+        self.assertEqual((int_bst.max_value, int_bst.depth), (200, 3))
+
+        # Tuples pass the validation, the one we can not compare fails on the way down
+        tuple_bst = make_binary_search_tree(values=[(5, "a"), (2, "a"), (7, "a")], multiset=True)
+        self.assertEqual((tuple_bst.max_value, tuple_bst.depth), ((7, "a"), 1))
+        with self.assertRaises(InvalidTypeException):
+            tuple_bst.add_multiple([(9, "a"), (9, "a"), (5, 1)])
+        self.assertEqual((tuple_bst.max_value, tuple_bst.depth), ((9, "a"), 2))
+
+    def test_add_multiple_clears_dirty_nodes(self):
+        int_bst = make_binary_search_tree(values=[10, 5, 20])
+        left_node = int_bst._left_node
+        self.assertEqual(int_bst.deepest_nodes, (1, [5, 20]))
+        self.assertEqual(left_node.min_value, 5)
+        int_bst.add_multiple([1, 30, 25])
+        self.assertEqual(int_bst.deepest_nodes, (3, [25]))
+        self.assertEqual(left_node.min_value, 1)
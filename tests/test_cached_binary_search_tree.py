@@ -0,0 +1,106 @@
+import unittest
+from unittest import mock
+
+from binary_search_tree import BinarySearchTreeNode
+from cached_binary_search_tree import CachedBinarySearchTree, QueryCache
+from errors import InvalidTypeException
+from make_bst import make_binary_search_tree
+
+
+class QueryCacheTestCase(unittest.TestCase):
+
+    def test_lru_eviction(self):
+        cache = QueryCache(maxsize=2)
+        self.assertEqual(cache.get("a", 0, lambda: 1), 1)
+        self.assertEqual(cache.get("b", 0, lambda: 2), 2)
+        self.assertEqual(cache.get("a", 0, lambda: None), 1)  # <- "b" is now the oldest
+        self.assertEqual(cache.get("c", 0, lambda: 3), 3)
+        self.assertEqual(cache.get("b", 0, lambda: 4), 4)
+        self.assertEqual(cache.info(), (1, 4, 2, 2, 2))
+
+    def test_newer_version_drops_everything(self):
+        cache = QueryCache()
+        cache.get("a", 0, lambda: 1)
+        self.assertEqual(cache.get("a", 1, lambda: 2), 2)
+        self.assertEqual(cache.info().currsize, 1)
+
+
+class CachedBinarySearchTreeTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tree = make_binary_search_tree(values=[50, 25, 75, 10, 30], balanced=True)
+        self.cached_tree = CachedBinarySearchTree(self.tree, maxsize=16)
+
+    def test_repeated_reads_are_hits(self):
+        with mock.patch.object(
+            BinarySearchTreeNode,
+            "get_ordered_values",
+            autospec=True,
+            side_effect=BinarySearchTreeNode.get_ordered_values,
+        ) as get_ordered_values:
+            for _ in range(3):
+                self.assertEqual(self.cached_tree.get_ordered_values(), [10, 25, 30, 50, 75])
+                self.assertEqual(
+                    self.cached_tree.get_ordered_values(reverse=True), [75, 50, 30, 25, 10]
+                )
+        self.assertEqual(get_ordered_values.call_count, 2)
+        self.assertEqual(self.cached_tree.cache_info()[:2], (4, 2))
+
+    def test_queries(self):
+        self.assertEqual(self.cached_tree.min_value, 10)
+        self.assertEqual(self.cached_tree.max_value, 75)
+        self.assertEqual(self.cached_tree.deepest_nodes, self.tree.deepest_nodes)
+        self.assertEqual(self.cached_tree.depth, self.tree.depth)
+        self.assertEqual(self.cached_tree.range(20, 60), [25, 30, 50])
+        self.assertEqual(self.cached_tree.range(20, 60, inclusive=False), [25, 30, 50])
+        self.assertEqual(self.cached_tree.rank(30), 2)
+        self.assertEqual(self.cached_tree.select(-1), 75)
+        self.assertIn(25, self.cached_tree)
+        self.assertEqual(len(self.cached_tree), 5)
+        with self.assertRaises(AttributeError):
+            self.cached_tree.find(25)
+
+    def test_changes_make_results_stale(self):
+        self.assertEqual(self.cached_tree.max_value, 75)
+        self.cached_tree.add(100)
+        self.assertEqual(self.cached_tree.max_value, 100)
+        self.cached_tree.remove_multiple([100, 75])
+        self.assertEqual(self.cached_tree.max_value, 50)
+        self.assertEqual(self.cached_tree.version, 2)
+
+    def test_no_change_keeps_results(self):
+        self.cached_tree.get_ordered_values()
+        self.cached_tree.add(50)
+        self.assertFalse(self.cached_tree.remove(1))
+        self.cached_tree.get_ordered_values()
+        self.assertEqual(self.cached_tree.version, 0)
+        self.assertEqual(self.cached_tree.cache_info().hits, 1)
+
+    def test_unhashable_arguments_are_not_cached(self):
+        self.assertEqual(self.cached_tree.count_between(10, 30, inclusive=[True, False]), 2)
+        self.assertEqual(self.cached_tree.cache_info().currsize, 0)
+
+    def test_equal_arguments_of_other_type_are_validated(self):
+        """1 and 1.0 are equal dict keys, a kept answer for one should not skip validating the other"""
+        float_tree = CachedBinarySearchTree(make_binary_search_tree(values=[2.0, 1.0, 3.0]))
+        self.assertTrue(float_tree.contains(2.0))
+        with self.assertRaises(InvalidTypeException):
+            float_tree.contains(2)
+        self.assertEqual(float_tree.rank(3.0), 2)
+        with self.assertRaises(InvalidTypeException):
+            float_tree.rank(3)
+
+    def test_list_results_are_copies(self):
+        values = self.cached_tree.get_ordered_values()
+        values.append(99)
+        depth, deepest_nodes = self.cached_tree.deepest_nodes
+        deepest_nodes.append(99)
+        self.cached_tree.range(10, 30).append(99)
+        self.assertNotIn(99, self.cached_tree.get_ordered_values())
+        self.assertNotIn(99, self.cached_tree.deepest_nodes[1])
+        self.assertNotIn(99, self.cached_tree.range(10, 30))
+
+    def test_cache_clear(self):
+        self.cached_tree.min_value
+        self.cached_tree.cache_clear()
+        self.assertEqual(self.cached_tree.cache_info(), (0, 0, 0, 16, 0))
@@ -1,5 +1,5 @@
 from errors import InvalidCharLenException
-from sorters import CharSorter
+from sorters import CharSorter, EQUAL
 from tests.base_sorter_testcase import BaseSorterTestCase
 
 
@@ -18,3 +18,10 @@ class CharSorterTestCase(BaseSorterTestCase.TestCase):
         """
         with self.assertRaises(InvalidCharLenException):
             self.sorter.is_lower_than("aaa", "b")
+
+    def test_validate_value_receive_string_not_char(self):
+        with self.assertRaises(InvalidCharLenException):
+            self.sorter.validate_value("aaa")
+
+    def test_compare_ignores_case_for_equality(self):
+        self.assertEqual(self.sorter.compare("a", "A"), EQUAL)
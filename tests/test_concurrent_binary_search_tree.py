@@ -0,0 +1,131 @@
+import random
+import threading
+import time
+import unittest
+from unittest import mock
+
+from concurrent_binary_search_tree import ConcurrentBinarySearchTree, ReadWriteLock
+from make_bst import make_binary_search_tree
+
+
+class ReadWriteLockTestCase(unittest.TestCase):
+
+    def test_readers_share_the_lock(self):
+        lock = ReadWriteLock()
+        with lock.read_locked():
+            finished = threading.Event()
+
+            def read():
+                with lock.read_locked():
+                    finished.set()
+
+            threading.Thread(target=read).start()
+            self.assertTrue(finished.wait(timeout=5))
+
+    def test_writer_waits_for_readers(self):
+        lock = ReadWriteLock()
+        events = []
+        lock.acquire_read()
+
+        def write():
+            with lock.write_locked():
+                events.append("write")
+
+        writer = threading.Thread(target=write)
+        writer.start()
+        time.sleep(0.05)
+        events.append("read done")
+        lock.release_read()
+        writer.join(timeout=5)
+        self.assertEqual(events, ["read done", "write"])
+
+
+class ConcurrentBinarySearchTreeTestCase(unittest.TestCase):
+    """
+    A writer keeps adding and removing values while many readers check that every
+    answer they get is consistent with the rest of the tree at that moment.
+    """
+
+    def assert_consistent(self, tree):
+        """Every cached property should match the values, called under the read lock"""
+        ordered_values = tree.get_ordered_values()
+        self.assertEqual(ordered_values, sorted(set(ordered_values)))
+        self.assertEqual(len(tree), len(ordered_values))
+        self.assertEqual(tree.min_value, ordered_values[0])
+        self.assertEqual(tree.max_value, ordered_values[-1])
+        leaf_levels = [node.level for node in tree.leaf_nodes]
+        self.assertEqual(tree.depth, max(leaf_levels))
+        self.assertEqual(tree.deepest_nodes[0], tree.depth)
+
+    def test_make_concurrent_tree(self):
+        concurrent_bst = make_binary_search_tree(values=[5, 3, 8], concurrent=True)
+        self.assertTrue(isinstance(concurrent_bst, ConcurrentBinarySearchTree))
+        concurrent_bst.add(4)
+        self.assertEqual(list(concurrent_bst), [3, 4, 5, 8])
+        self.assertEqual(concurrent_bst.range(4, 8, inclusive=False), [5])
+        self.assertIn(4, concurrent_bst)
+        self.assertEqual(concurrent_bst.max_value, 8)
+        self.assertEqual(concurrent_bst.rank(5), 2)
+        with self.assertRaises(AttributeError):
+            concurrent_bst.find(4)  # <- nodes would escape the lock
+
+    def test_methods_take_the_lock_once(self):
+        """Looking a method up reads nothing of the tree, only the call takes the lock"""
+        concurrent_bst = make_binary_search_tree(values=[5, 3, 8], concurrent=True)
+        with (
+            mock.patch.object(
+                ReadWriteLock, "acquire_write", autospec=True, side_effect=ReadWriteLock.acquire_write
+            ) as acquire_write,
+            mock.patch.object(
+                ReadWriteLock, "acquire_read", autospec=True, side_effect=ReadWriteLock.acquire_read
+            ) as acquire_read,
+        ):
+            concurrent_bst.add(4)
+            concurrent_bst.remove_multiple([3])
+            self.assertEqual(acquire_write.call_count, 2)
+            self.assertEqual(concurrent_bst.rank(5), 1)
+            self.assertEqual(concurrent_bst.min_value, 4)  # <- properties are read under the lock
+            self.assertEqual(acquire_read.call_count, 2)
+
+    def test_stress(self):
+        for balanced in (False, True):
+            with self.subTest(balanced=balanced):
+                self.run_stress(balanced)
+
+    def run_stress(self, balanced: bool):
+        concurrent_bst = make_binary_search_tree(
+            values=[500_000], balanced=balanced, concurrent=True
+        )
+        errors = []
+        writer_done = threading.Event()
+
+        def write():
+            generator = random.Random(0)
+            try:
+                for _ in range(60):
+                    values = [generator.randint(0, 1_000_000) for _ in range(100)]
+                    concurrent_bst.add_multiple(values)
+                    concurrent_bst.remove_multiple(values[:20])
+            finally:
+                writer_done.set()
+
+        def read():
+            try:
+                while not writer_done.is_set():
+                    self.assertLessEqual(concurrent_bst.min_value, concurrent_bst.node_value)
+                    concurrent_bst.contains_many([1, 2, 3])
+                    with concurrent_bst.read_locked() as tree:
+                        self.assert_consistent(tree)
+            except Exception as error:  # <- assertions inside threads do not fail the test
+                errors.append(error)
+
+        threads = [threading.Thread(target=read) for _ in range(8)]
+        threads.append(threading.Thread(target=write))
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=60)
+
+        self.assertEqual(errors, [])
+        with concurrent_bst.read_locked() as tree:
+            self.assert_consistent(tree)
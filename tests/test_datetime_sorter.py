@@ -0,0 +1,37 @@
+import datetime
+
+from errors import InvalidTypeException, MultipleDataTypesException
+from make_bst import make_binary_search_tree
+from sorters import DateTimeSorter
+from tests.base_sorter_testcase import BaseSorterTestCase
+
+
+class DateTimeSorterTestCase(BaseSorterTestCase.TestCase):
+    """
+    Tests collection for DateTimeSorter
+    """
+    sorter = DateTimeSorter
+    correct_value_lower = datetime.datetime(2024, 1, 1, 12, 0)
+    correct_value_bigger = datetime.datetime(2024, 1, 1, 12, 0, 1)
+    incorrect_value = datetime.date(2024, 1, 1)
+
+    def test_naive_and_aware_values_exception(self):
+        aware_value = self.correct_value_bigger.replace(tzinfo=datetime.timezone.utc)
+        with self.assertRaises(InvalidTypeException):
+            self.sorter.validate_values(self.correct_value_lower, aware_value)
+        with self.assertRaises(InvalidTypeException):
+            self.sorter.compare(self.correct_value_lower, aware_value)
+
+    def test_trees_reject_naive_and_aware_values(self):
+        """Trees trust validate_value, comparing both kinds on the way down raises the same"""
+        aware_value = self.correct_value_bigger.replace(tzinfo=datetime.timezone.utc)
+        values = [self.correct_value_lower, aware_value]
+        for options in ({}, {"balanced": True}, {"bulk_load": True}, {"multiset": True, "bulk_load": True}):
+            with self.subTest(**options), self.assertRaises(MultipleDataTypesException):
+                make_binary_search_tree(values=values, **options)
+
+        datetime_bst = make_binary_search_tree(values=[self.correct_value_lower])
+        for method in (datetime_bst.add, datetime_bst.contains, datetime_bst.remove, datetime_bst.rank):
+            with self.subTest(method=method.__name__), self.assertRaises(InvalidTypeException):
+                method(aware_value)
+        self.assertEqual(datetime_bst.get_ordered_values(), [self.correct_value_lower])
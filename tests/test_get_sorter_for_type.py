@@ -1,7 +1,8 @@
 import decimal
 import unittest
 
-from make_bst import get_sorter_for_type
+from errors import TypeSorterNotFoundException
+from make_bst import get_sorter_for_type, make_binary_search_tree
 from sorters import IntegerSorter, FloatSorter, CharSorter
 
 
@@ -22,3 +23,9 @@ class GetSorterForTypeTestCase(unittest.TestCase):
 
     def test_unsupported_type_receive_none(self):
         self.assertEqual(get_sorter_for_type(decimal.Decimal), None)
+
+    def test_subclass_receive_none(self):
+        """bool is an int subclass, but not an int tree value"""
+        self.assertEqual(get_sorter_for_type(bool), None)
+        with self.assertRaises(TypeSorterNotFoundException):
+            make_binary_search_tree(values=[True, False])
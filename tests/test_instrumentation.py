@@ -0,0 +1,85 @@
+import unittest
+
+import instrumentation
+from binary_search_tree import BinarySearchTreeNode
+from cache_manager import cached_property
+from errors import InstrumentationException
+from make_bst import make_binary_search_tree
+
+
+class InstrumentationTestCase(unittest.TestCase):
+    """
+    Example tree:    50
+                    /  \
+                  25    75
+                 /
+               10
+    """
+
+    def setUp(self):
+        self.tree = make_binary_search_tree(values=[50, 25, 75, 10])
+
+    def tearDown(self):
+        instrumentation.disable()
+
+    def test_comparisons_follow_the_search_path(self):
+        with instrumentation.instrumented() as stats:
+            self.tree.add(30)  # <- 50, 25, then falls off on the right of 25
+            self.tree.add(10)  # <- 50, 25, found at 10
+            self.tree.remove(75)  # <- found at 50's right
+            self.assertTrue(self.tree.contains(30))
+        self.assertEqual(stats.calls["add"], 2)
+        self.assertEqual(stats.comparisons["add"], 5)
+        self.assertEqual(stats.comparisons["remove"], 2)
+        self.assertEqual(stats.comparisons["contains"], 3)
+        self.assertEqual(stats.comparisons_per_call("add"), 2.5)
+        self.assertGreater(stats.seconds["add"], 0)
+
+    def test_nodes_visited(self):
+        with instrumentation.instrumented() as stats:
+            self.tree.get_ordered_values()
+            self.assertEqual(list(self.tree.range(20, 60)), [25, 50])
+        self.assertEqual(stats.nodes_visited["iter_ordered"], 4)
+        self.assertEqual(stats.nodes_visited["range"], 2)
+        self.assertEqual(stats.calls["get_ordered_values"], 1)
+
+    def test_cache_counters(self):
+        with instrumentation.instrumented() as stats:
+            self.tree.min_value
+            self.tree.min_value
+            self.tree._left_node.min_value
+            self.tree._right_node.max_value
+            self.tree.add(5)  # <- clears the cache of 50 and 25, 75 is not on the path
+        self.assertEqual(stats.cache_hits, 1)
+        self.assertEqual(stats.cache_misses, 3)
+        self.assertEqual(stats.cache_invalidations, 2)
+
+    def test_callback(self):
+        calls = []
+        with instrumentation.instrumented(callback=lambda *args: calls.append(args)):
+            self.tree.add(30)
+            self.tree.remove(30)
+        self.assertEqual([(name, details) for name, _, details in calls], [
+            ("add", {"comparisons": 2, "nodes_visited": 0}),
+            ("remove", {"comparisons": 3, "nodes_visited": 0}),
+        ])
+
+    def test_balanced_trees(self):
+        tree = make_binary_search_tree(values=[1, 2, 3], balanced=True)
+        with instrumentation.instrumented() as stats:
+            tree.add_multiple([4, 5])
+        self.assertEqual(stats.calls["add_multiple"], 1)
+        self.assertEqual(stats.comparisons["add_multiple"], 5)  # <- 2, 3 then 2, 3, 4
+
+    def test_disable_puts_originals_back(self):
+        add = BinarySearchTreeNode.add
+        get = cached_property.__get__
+        stats = instrumentation.enable()
+        with self.assertRaises(InstrumentationException):
+            instrumentation.enable()
+        self.assertIsNot(BinarySearchTreeNode.add, add)
+        self.assertIs(instrumentation.disable(), stats)
+        self.assertIs(BinarySearchTreeNode.add, add)
+        self.assertIs(cached_property.__get__, get)
+        self.tree.add(30)
+        self.assertEqual(stats.calls["add"], 0)
@@ -0,0 +1,27 @@
+from sorters import EQUAL, KeySorter
+from tests.base_sorter_testcase import BaseSorterTestCase
+
+
+class CaseInsensitiveSorter(KeySorter):
+    allowed_type = str
+    key = staticmethod(str.casefold)
+
+
+class KeySorterTestCase(BaseSorterTestCase.TestCase):
+    """
+    Tests collection for KeySorter, values are ordered by their keys
+    """
+    sorter = CaseInsensitiveSorter
+    correct_value_lower = "Apple"
+    correct_value_bigger = "banana"
+    incorrect_value = 1
+
+    def test_compare_by_key(self):
+        self.assertEqual(self.sorter.compare("APPLE", "apple"), EQUAL)
+        self.assertTrue(self.sorter.is_lower_than("apple", "Banana"))
+
+    def test_sort_unique_by_key(self):
+        """First of the values with equal keys wins, like the other sorters"""
+        self.assertEqual(
+            self.sorter.sort_unique(["banana", "Apple", "BANANA", "apple"]), ["Apple", "banana"]
+        )
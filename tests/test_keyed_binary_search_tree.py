@@ -0,0 +1,124 @@
+import collections
+import datetime
+import random
+import unittest
+
+from errors import InvalidTypeException, TypeSorterNotFoundException
+from keyed_binary_search_tree import BalancedKeyedBinarySearchTreeNode, KeyedBinarySearchTreeNode
+from make_bst import make_binary_search_tree, make_ordered_map
+from sorters import (
+    SORTERS_BY_TYPE,
+    CharSorter,
+    DateTimeSorter,
+    IntegerSorter,
+    KeySorter,
+    StringSorter,
+    TupleSorter,
+    get_sorter_for_type,
+    register_sorter,
+)
+
+
+class CaseInsensitiveSorter(KeySorter):
+    allowed_type = str
+    key = staticmethod(str.casefold)
+
+
+class KeyedBinarySearchTreeNodeTestCase(unittest.TestCase):
+    """
+    Trees of key sorters keep the key of every value on its node,
+    searches compare those keys and should agree with the sorter compare.
+    """
+
+    def assert_keys(self, tree):
+        """Every node key is the key of its value, even after values moved between nodes"""
+        stack = [tree]
+        while stack:
+            node = stack.pop()
+            self.assertEqual(node._key, node.sorter.key(node.node_value))
+            stack.extend(child for child in (node._left_node, node._right_node) if child is not None)
+
+    def test_make_keyed_tree(self):
+        str_bst = make_binary_search_tree(values=["Mango", "apple", "Zucchini", "APPLE"], sorter=CaseInsensitiveSorter)
+        self.assertIsInstance(str_bst, KeyedBinarySearchTreeNode)
+        self.assertEqual(str_bst.get_ordered_values(), ["apple", "Mango", "Zucchini"])
+        self.assertTrue(str_bst.contains("MANGO"))
+        self.assertEqual(str_bst.find("zucchini").node_value, "Zucchini")
+        self.assertEqual(list(str_bst.range("b", "n")), ["Mango"])
+        self.assertEqual(str_bst.rank("mango"), 1)
+
+        balanced_bst = make_binary_search_tree(values=["a", "b", "c"], sorter=CaseInsensitiveSorter, balanced=True)
+        self.assertIsInstance(balanced_bst, BalancedKeyedBinarySearchTreeNode)
+        self.assertEqual(balanced_bst.node_value, "b")  # <- rotated, key moved with the value
+        self.assert_keys(balanced_bst)
+
+    def test_bulk_load_keyed_tree(self):
+        str_bst = make_binary_search_tree(values=["b", "A", "a", "C"], sorter=CaseInsensitiveSorter, bulk_load=True)
+        self.assertIsInstance(str_bst, KeyedBinarySearchTreeNode)
+        self.assertEqual(str_bst.get_ordered_values(), ["A", "b", "C"])
+        self.assert_keys(str_bst)
+
+    def test_keys_under_random_operations(self):
+        generator = random.Random(7)
+        words = ["".join(generator.choice("abcABC") for _ in range(3)) for _ in range(300)]
+        for balanced in (False, True):
+            str_bst = make_binary_search_tree(values=words[:1], sorter=CaseInsensitiveSorter, balanced=balanced)
+            expected = {words[0].casefold(): words[0]}
+            for word in words[1:]:
+                if generator.random() < 0.3:
+                    str_bst.remove(word)
+                    expected.pop(word.casefold(), None)
+                else:
+                    str_bst.add(word)
+                    expected.setdefault(word.casefold(), word)
+            self.assertEqual(str_bst.get_ordered_values(), [expected[key] for key in sorted(expected)])
+            self.assert_keys(str_bst)
+
+    def test_other_storages_use_sorter_compare(self):
+        multiset_bst = make_binary_search_tree(values=["b", "B", "a"], sorter=CaseInsensitiveSorter, multiset=True)
+        self.assertEqual(multiset_bst.get_ordered_values(), ["a", "b", "b"])
+        persistent_bst = make_binary_search_tree(values=["b", "a"], sorter=CaseInsensitiveSorter, storage="persistent")
+        self.assertEqual(persistent_bst.add("A").get_ordered_values(), ["a", "b"])
+        str_map = make_ordered_map([("b", 1), ("A", 2)], sorter=CaseInsensitiveSorter)
+        self.assertEqual(str_map.get("a"), 2)
+
+
+class SorterRegistryTestCase(unittest.TestCase):
+    """New sorters come with a registry, trees get them by the type of their values"""
+
+    def test_registered_types(self):
+        self.assertEqual(get_sorter_for_type(datetime.datetime), DateTimeSorter)
+        self.assertEqual(get_sorter_for_type(tuple), TupleSorter)
+        self.assertEqual(get_sorter_for_type(collections.namedtuple("Point", "x y")), TupleSorter)
+
+    def test_trees_of_new_types(self):
+        start = datetime.datetime(2024, 1, 1)
+        datetime_bst = make_binary_search_tree(values=[start + datetime.timedelta(hours=hour) for hour in (5, 1, 3)])
+        self.assertEqual(datetime_bst.min_value, start + datetime.timedelta(hours=1))
+        tuple_bst = make_binary_search_tree(values=[("b", 1), ("a", 2), ("b", 0)], balanced=True)
+        self.assertEqual(tuple_bst.get_ordered_values(), [("a", 2), ("b", 0), ("b", 1)])
+        bytes_bst = make_binary_search_tree(values=[b"\x02", b"\x01\xff"], bulk_load=True)
+        self.assertEqual(bytes_bst.get_ordered_values(), [b"\x01\xff", b"\x02"])
+
+    def test_register_sorter(self):
+        self.addCleanup(SORTERS_BY_TYPE.__setitem__, str, CharSorter)
+        register_sorter(str, StringSorter)
+        str_bst = make_binary_search_tree(values=["pear", "fig", "banana"])
+        self.assertEqual(str_bst.sorter, StringSorter)
+        self.assertEqual(str_bst.get_ordered_values(), ["banana", "fig", "pear"])
+
+    def test_register_sorter_for_new_type(self):
+        self.addCleanup(SORTERS_BY_TYPE.pop, datetime.date)
+        with self.assertRaises(TypeSorterNotFoundException):
+            make_binary_search_tree(values=[datetime.date(2024, 1, 2)])
+
+        class DateSorter(IntegerSorter):
+            allowed_type = datetime.date
+
+        register_sorter(datetime.date, DateSorter)
+        date_bst = make_binary_search_tree(values=[datetime.date(2024, 1, 2), datetime.date(2024, 1, 1)])
+        self.assertEqual(date_bst.min_value, datetime.date(2024, 1, 1))
+
+    def test_register_invalid_sorter(self):
+        with self.assertRaises(InvalidTypeException):
+            register_sorter(str, str.casefold)
@@ -2,7 +2,7 @@ import decimal
 import unittest
 
 from binary_search_tree import BinarySearchTreeNode
-from errors import MultipleDataTypesException, TypeSorterNotFoundException
+from errors import InvalidCharLenException, MultipleDataTypesException, TypeSorterNotFoundException
 from make_bst import make_binary_search_tree
 from sorters import CharSorter
 
@@ -47,3 +47,12 @@ class MakeBinarySearchTreeTestCase(unittest.TestCase):
         """
         char_bst = make_binary_search_tree(values=["a", "b", "c"])
         self.assertEqual(char_bst.node_value, "a")
+
+    def test_values_are_validated_before_building(self):
+        """
+        We validate every value once at the start, comparisons inside the tree trust them
+        """
+        with self.assertRaises(MultipleDataTypesException):
+            make_binary_search_tree(values=[1, 2, 3, 4.5])
+        with self.assertRaises(InvalidCharLenException):
+            make_binary_search_tree(values=["a", "b", "cd"])
@@ -0,0 +1,102 @@
+import random
+import unittest
+
+from errors import InvalidStorageException, MultipleDataTypesException, RootNodeDeleteException
+from make_bst import make_binary_search_tree
+from map_binary_search_tree import BalancedMapBinarySearchTreeNode, MapBinarySearchTreeNode
+
+
+class MapBinarySearchTreeNodeTestCase(unittest.TestCase):
+    """
+    Ordered maps sort by key with the usual sorters, and every key keeps its payload
+    through adds, removes, rotations and set operations.
+    """
+
+    def setUp(self):
+        self.records = {42: "answer", 7: "days", 99: "problems", 1: "one", 50: "fifty"}
+
+    def test_make_ordered_map(self):
+        for balanced, node_class in (
+            (False, MapBinarySearchTreeNode), (True, BalancedMapBinarySearchTreeNode)
+        ):
+            int_map = make_binary_search_tree(values=self.records, balanced=balanced, ordered_map=True)
+            self.assertIsInstance(int_map, node_class)
+            self.assertEqual(list(int_map.items()), sorted(self.records.items()))
+            self.assertEqual(int_map.get_ordered_values(), [1, 7, 42, 50, 99])
+
+    def test_pairs_and_bulk_load(self):
+        int_map = make_binary_search_tree(
+            values=[(3, "c"), (1, "a"), (2, "b"), (1, "A")], bulk_load=True, ordered_map=True
+        )
+        self.assertEqual(int_map.node_value, 2)
+        self.assertEqual(list(int_map.items(reverse=True)), [(3, "c"), (2, "b"), (1, "A")])
+
+    def test_get_put_pop(self):
+        int_map = make_binary_search_tree(values=self.records, ordered_map=True)
+        self.assertEqual(int_map.get(7), "days")
+        self.assertIsNone(int_map.get(8))
+        self.assertEqual(int_map.get(8, "none"), "none")
+        int_map.put(7, "week")
+        int_map.put(8, "eight")
+        self.assertEqual((int_map.get(7), int_map.get(8), len(int_map)), ("week", "eight", 6))
+        self.assertEqual(int_map.pop(42), "answer")  # <- root with two children
+        self.assertEqual(int_map.node_value, 50)
+        self.assertEqual(int_map.get(50), "fifty")
+        self.assertEqual(int_map.pop(42, None), None)
+        with self.assertRaises(KeyError):
+            int_map.pop(42)
+        self.assertEqual(int_map.max_value, 99)
+
+    def test_pop_last_key(self):
+        int_map = make_binary_search_tree(values={1: "one"}, ordered_map=True)
+        with self.assertRaises(RootNodeDeleteException):
+            int_map.pop(1)
+
+    def test_range_items(self):
+        int_map = make_binary_search_tree(values=self.records, ordered_map=True)
+        self.assertEqual(list(int_map.range_items(5, 50)), [(7, "days"), (42, "answer"), (50, "fifty")])
+        self.assertEqual(list(int_map.range_items(5, 50, inclusive=False)), [(7, "days"), (42, "answer")])
+
+    def test_random_operations(self):
+        generator = random.Random(5)
+        for balanced in (False, True):
+            records = {500: 0}
+            int_map = make_binary_search_tree(values=records, balanced=balanced, ordered_map=True)
+            for step in range(500):
+                key = generator.randint(0, 100)
+                if generator.random() < 0.3 and len(records) > 1:
+                    self.assertEqual(int_map.pop(key, None), records.pop(key, None))
+                else:
+                    int_map.put(key, step)
+                    records[key] = step
+            self.assertEqual(list(int_map.items()), sorted(records.items()))
+            self.assertEqual(len(int_map), len(records))
+
+    def test_set_operations_keep_payloads(self):
+        left_map = make_binary_search_tree(values={1: "a", 2: "b", 3: "c"}, ordered_map=True)
+        right_map = make_binary_search_tree(values={3: "C", 4: "D"}, ordered_map=True)
+        self.assertEqual(
+            list(left_map.union(right_map).items()), [(1, "a"), (2, "b"), (3, "c"), (4, "D")]
+        )
+        self.assertEqual(list(left_map.intersection(right_map).items()), [(3, "c")])
+        self.assertEqual(list(left_map.difference(right_map).items()), [(1, "a"), (2, "b")])
+        lower_map, upper_map = left_map.split(2)
+        self.assertEqual((list(lower_map.items()), list(upper_map.items())), ([(1, "a")], [(2, "b"), (3, "c")]))
+        left_map.merge(right_map)
+        self.assertEqual(left_map.get(4), "D")
+
+    def test_invalid_ordered_maps(self):
+        with self.assertRaises(MultipleDataTypesException):
+            make_binary_search_tree(values={1: "one", "b": "two"}, ordered_map=True)
+        with self.assertRaises(InvalidStorageException):
+            make_binary_search_tree(values={1: "one"}, storage="array", ordered_map=True)
+        with self.assertRaises(InvalidStorageException):
+            make_binary_search_tree(values={1: "one"}, multiset=True, ordered_map=True)
+
+    def test_concurrent_ordered_map(self):
+        shared_map = make_binary_search_tree(values=self.records, ordered_map=True, concurrent=True)
+        shared_map.put(8, "eight")
+        self.assertEqual(shared_map.pop(8), "eight")
+        self.assertEqual(shared_map.get(7), "days")
+        self.assertEqual(shared_map.items()[0], (1, "one"))
+        self.assertEqual(shared_map.range_items(90), [(99, "problems")])
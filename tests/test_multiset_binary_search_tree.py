@@ -0,0 +1,136 @@
+import array
+import collections
+import random
+import unittest
+
+from errors import InvalidStorageException
+from make_bst import make_binary_search_tree
+from multiset_binary_search_tree import (
+    BalancedMultisetBinarySearchTreeNode,
+    MultisetBinarySearchTreeNode,
+)
+from sorters import KeySorter
+
+
+class CaseInsensitiveSorter(KeySorter):
+    allowed_type = str
+    key = staticmethod(str.casefold)
+
+
+class MultisetBinarySearchTreeNodeTestCase(unittest.TestCase):
+    """
+    Multiset trees keep one node per distinct value with its count,
+    every size based query should count the copies.
+    """
+
+    def assert_valid_tree(self, tree, counter: collections.Counter):
+        """Sizes count copies, heights and values match a Counter of what we added"""
+        stack = [tree]
+        nodes = 0
+        while stack:
+            node = stack.pop()
+            nodes += 1
+            self.assertGreater(node._count, 0)
+            node_size, node_height = node._size, node._height
+            node._update_subtree_stats()
+            self.assertEqual((node._size, node._height), (node_size, node_height))
+            stack.extend(child for child in (node._left_node, node._right_node) if child is not None)
+        self.assertEqual(nodes, len(counter))
+        self.assertEqual(len(tree), sum(counter.values()))
+        self.assertEqual(tree.get_ordered_values(), sorted(counter.elements()))
+
+    def test_make_multiset_tree(self):
+        int_bst = make_binary_search_tree(values=[200, 404, 200, 500, 200], multiset=True)
+        self.assertIsInstance(int_bst, MultisetBinarySearchTreeNode)
+        self.assertEqual(int_bst.get_ordered_values(), [200, 200, 200, 404, 500])
+        self.assertEqual(int_bst.count(200), 3)
+        self.assertEqual(int_bst.count(201), 0)
+        self.assertEqual(len(int_bst), 5)
+        self.assertEqual(int_bst.depth, 2)  # <- three nodes
+
+    def test_order_statistics_count_copies(self):
+        int_bst = make_binary_search_tree(values=[5, 1, 5, 3, 5, 3], multiset=True)
+        self.assertEqual(int_bst.rank(5), 3)
+        self.assertEqual(int_bst.count_between(3, 5), 5)
+        self.assertEqual([int_bst.select(index) for index in range(6)], [1, 3, 3, 5, 5, 5])
+        self.assertEqual(int_bst.select(-1), 5)
+        self.assertEqual(int_bst.percentile(50), 3)
+        self.assertEqual(list(int_bst.range(2, 4)), [3, 3])
+        self.assertEqual(list(int_bst.rank_many([1, 3, 5, 6])), [0, 1, 3, 6])
+
+    def test_remove_one_copy(self):
+        int_bst = make_binary_search_tree(values=[50, 25, 75, 25, 60], multiset=True)
+        self.assertTrue(int_bst.remove(25))
+        self.assertEqual(int_bst.count(25), 1)
+        self.assertTrue(int_bst.remove(50))  # <- two children, 60 takes its place
+        self.assertEqual(int_bst.get_ordered_values(), [25, 60, 75])
+        self.assertFalse(int_bst.remove(50))
+
+    def test_random_operations(self):
+        generator = random.Random(3)
+        for balanced in (False, True):
+            counter = collections.Counter([50])
+            int_bst = make_binary_search_tree(values=[50], balanced=balanced, multiset=True)
+            for _ in range(500):
+                value = generator.randint(0, 30)
+                if generator.random() < 0.4 and sum(counter.values()) > 1:
+                    self.assertEqual(int_bst.remove(value), counter[value] > 0)
+                    counter[value] -= 1
+                    counter += collections.Counter()  # <- drops the values at 0
+                else:
+                    int_bst.add(value)
+                    counter[value] += 1
+            self.assert_valid_tree(int_bst, counter)
+            if balanced:
+                self.assertLessEqual(int_bst.depth, 7)
+
+    def test_balanced_multiset(self):
+        int_bst = make_binary_search_tree(values=[1, 2, 3, 3, 4, 5], balanced=True, multiset=True)
+        self.assertIsInstance(int_bst, BalancedMultisetBinarySearchTreeNode)
+        self.assert_valid_tree(int_bst, collections.Counter([1, 2, 3, 3, 4, 5]))
+        self.assertEqual(int_bst.count(3), 2)  # <- the count moved with the value on rotations
+
+    def test_bulk_load(self):
+        values = [7, 7, 1, 3, 7, 1]
+        int_bst = make_binary_search_tree(values=values, bulk_load=True, multiset=True)
+        self.assertEqual(int_bst.node_value, 3)
+        self.assert_valid_tree(int_bst, collections.Counter(values))
+
+    def test_bulk_load_counts_sorter_equal_values(self):
+        """Values equal for the sorter only are copies too, bulk and one by one builds agree"""
+        for values, sorter in ((["a", "A", "b"], None), (["Apple", "apple", "pear"], CaseInsensitiveSorter)):
+            bulk_bst = make_binary_search_tree(values=values, multiset=True, bulk_load=True, sorter=sorter)
+            added_bst = make_binary_search_tree(values=values, multiset=True, sorter=sorter)
+            with self.subTest(values=values):
+                self.assertEqual(bulk_bst.count(values[0]), 2)
+                self.assertEqual(len(bulk_bst), 3)
+                self.assertEqual(bulk_bst.get_ordered_values(), added_bst.get_ordered_values())
+
+    def test_buffers_keep_duplicates(self):
+        int_bst = make_binary_search_tree(values=array.array("q", [3, 1, 3, 3]), multiset=True)
+        int_bst.add_multiple(array.array("q", [1, 5]))
+        self.assert_valid_tree(int_bst, collections.Counter([3, 1, 3, 3, 1, 5]))
+
+    def test_merge_adds_counts(self):
+        """Merging trees of separate workers keeps every copy, unlike union"""
+        left_bst = make_binary_search_tree(values=[200, 200, 200, 404], multiset=True)
+        left_bst.merge(make_binary_search_tree(values=[200, 200, 500], multiset=True))
+        self.assert_valid_tree(left_bst, collections.Counter({200: 5, 404: 1, 500: 1}))
+        self.assertEqual(left_bst.count(200), 5)
+        left_bst.merge(make_binary_search_tree(values=[404, 1]))
+        self.assert_valid_tree(left_bst, collections.Counter({200: 5, 404: 2, 500: 1, 1: 1}))
+
+    def test_set_operations(self):
+        """Like Counter operators: union keeps the highest count, intersection the lowest"""
+        left_bst = make_binary_search_tree(values=[1, 1, 1, 2, 3], multiset=True)
+        right_bst = make_binary_search_tree(values=[1, 3, 3, 4], multiset=True)
+        left, right = collections.Counter([1, 1, 1, 2, 3]), collections.Counter([1, 3, 3, 4])
+        self.assert_valid_tree(left_bst.union(right_bst), left | right)
+        self.assert_valid_tree(left_bst.intersection(right_bst), left & right)
+        self.assert_valid_tree(left_bst.difference(right_bst), left - right)
+
+    def test_multiset_needs_nodes_storage(self):
+        with self.assertRaises(InvalidStorageException):
+            make_binary_search_tree(values=[1, 1], storage="array", multiset=True)
+        with self.assertRaises(InvalidStorageException):
+            make_binary_search_tree(values=[1, 1], multiset=True, workers=2)
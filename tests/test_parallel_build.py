@@ -0,0 +1,60 @@
+import random
+import unittest
+
+import parallel_build
+from errors import MultipleDataTypesException
+from make_bst import make_binary_search_tree
+from sorters import CharSorter, IntegerSorter
+
+
+class ParallelBuildTestCase(unittest.TestCase):
+    """
+    The number of workers should only change how fast we build,
+    never the tree we get: it must be the same one bulk_load=True gives.
+    """
+
+    def assert_same_tree(self, tree, expected_tree):
+        self.assertIs(type(tree), type(expected_tree))
+        self.assertIs(tree.sorter, expected_tree.sorter)
+        stack = [(tree, expected_tree)]
+        while stack:
+            node, expected_node = stack.pop()
+            self.assertEqual(
+                (node.node_value, node.level, node._size),
+                (expected_node.node_value, expected_node.level, expected_node._size),
+            )
+            for side in ("_left_node", "_right_node"):
+                child, expected_child = getattr(node, side), getattr(expected_node, side)
+                self.assertEqual(child is None, expected_child is None)
+                if expected_child is not None:
+                    stack.append((child, expected_child))
+
+    def test_same_tree_as_bulk_load(self):
+        generator = random.Random(6)
+        values = [generator.randint(0, 5000) for _ in range(3000)]
+        expected_tree = make_binary_search_tree(values=values, bulk_load=True)
+        for workers in (2, 3):
+            with self.subTest(workers=workers):
+                self.assert_same_tree(
+                    make_binary_search_tree(values=values, workers=workers), expected_tree
+                )
+
+    def test_balanced_and_chars(self):
+        self.assert_same_tree(
+            make_binary_search_tree(values=list(range(100, 0, -1)), balanced=True, workers=2),
+            make_binary_search_tree(values=list(range(100, 0, -1)), balanced=True, bulk_load=True),
+        )
+        char_values = ["b", "A", "c", "a", "B", "d"]
+        self.assertEqual(
+            parallel_build.sort_unique_parallel(CharSorter, char_values, workers=3),
+            CharSorter.sort_unique(char_values),
+        )
+
+    def test_more_workers_than_values(self):
+        self.assertEqual(
+            parallel_build.sort_unique_parallel(IntegerSorter, [3, 1, 3], workers=8), [1, 3]
+        )
+
+    def test_invalid_values(self):
+        with self.assertRaises(MultipleDataTypesException):
+            make_binary_search_tree(values=[1, 2, 3, 4.5], workers=2)
@@ -0,0 +1,132 @@
+import random
+import unittest
+
+from async_binary_search_tree import AsyncBinarySearchTree
+from cached_binary_search_tree import CachedBinarySearchTree
+from concurrent_binary_search_tree import ConcurrentBinarySearchTree
+from errors import InvalidStorageException, RootNodeDeleteException
+from make_bst import make_binary_search_tree
+from persistent_binary_search_tree import PersistentBinarySearchTreeNode
+
+
+def iter_nodes(tree):
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        yield node
+        for child in (node._left_node, node._right_node):
+            if child is not None:
+                stack.append(child)
+
+
+class PersistentBinarySearchTreeNodeTestCase(unittest.TestCase):
+    """
+    Every version of a persistent tree should keep its values forever,
+    while sharing everything that did not change with the next versions.
+    """
+
+    def assert_valid_tree(self, tree):
+        """Levels, sizes and heights of every node should match its place on the tree"""
+        for node in iter_nodes(tree):
+            size, height = 1, 0
+            for child in (node._left_node, node._right_node):
+                if child is not None:
+                    self.assertEqual(child.level, node.level + 1)
+                    size += child._size
+                    height = max(height, child._height + 1)
+            self.assertEqual((node._size, node._height), (size, height))
+
+    def test_make_persistent_tree(self):
+        int_bst = make_binary_search_tree(values=[50, 25, 75, 62], storage="persistent")
+        self.assertTrue(isinstance(int_bst, PersistentBinarySearchTreeNode))
+        self.assertEqual(int_bst.get_ordered_values(), [25, 50, 62, 75])
+        self.assertEqual(int_bst.deepest_nodes, (2, [62]))
+        with self.assertRaises(InvalidStorageException):
+            make_binary_search_tree(values=[1], storage="persistent", balanced=True)
+
+    def test_wrappers_reject_persistent_trees(self):
+        """Wrappers change the tree in place, they would drop the new roots"""
+        with self.assertRaises(InvalidStorageException):
+            make_binary_search_tree(values=[5, 3, 8], storage="persistent", concurrent=True)
+        int_bst = make_binary_search_tree(values=[5, 3, 8], storage="persistent")
+        for wrapper in (ConcurrentBinarySearchTree, AsyncBinarySearchTree, CachedBinarySearchTree):
+            with self.subTest(wrapper=wrapper.__name__), self.assertRaises(InvalidStorageException):
+                wrapper(int_bst)
+
+    def test_add_copies_path_only(self):
+        old_root = make_binary_search_tree(values=[50, 25, 75], storage="persistent")
+        new_root = old_root.add(30)
+        self.assertEqual(old_root.get_ordered_values(), [25, 50, 75])
+        self.assertEqual(new_root.get_ordered_values(), [25, 30, 50, 75])
+        self.assertIsNot(new_root, old_root)
+        self.assertIsNot(new_root._left_node, old_root._left_node)
+        self.assertIs(new_root._right_node, old_root._right_node)  # <- shared
+        self.assertIs(new_root.add(30), new_root)  # <- already there, nothing changed
+
+    def test_add_allocates_depth_nodes(self):
+        values = list(range(1000))
+        random.Random(2).shuffle(values)
+        old_root = make_binary_search_tree(values=values, storage="persistent")
+        new_root = old_root.add(1000)
+        old_nodes = set(iter_nodes(old_root))
+        new_nodes = [node for node in iter_nodes(new_root) if node not in old_nodes]
+        self.assertEqual(len(new_nodes), new_root.find(1000).level + 1)
+        self.assert_valid_tree(new_root)
+
+    def test_cached_properties_of_old_versions(self):
+        old_root = make_binary_search_tree(values=[50, 25, 75], storage="persistent")
+        self.assertEqual((old_root.depth, old_root.max_value), (1, 75))
+        new_root = old_root.add(80)
+        self.assertEqual((new_root.depth, new_root.max_value), (2, 80))
+        self.assertEqual((old_root.depth, old_root.max_value), (1, 75))
+
+    def test_remove(self):
+        r"""
+        Removing 50 moves values down a single path, instead of moving subtrees up:
+                      50                       62'
+                     /  \                      /  \
+                   25    75     remove 50 -> 25    75'
+                        /  \                         \
+                      62    87                        87
+        """
+        old_root = make_binary_search_tree(values=[50, 25, 75, 62, 87], storage="persistent")
+        new_root = old_root.remove(50)
+        self.assertEqual(new_root.get_ordered_values(), [25, 62, 75, 87])
+        self.assertEqual(new_root.node_value, 62)
+        self.assertIs(new_root._left_node, old_root._left_node)
+        self.assertIs(new_root._right_node._right_node, old_root._right_node._right_node)
+        self.assertEqual(old_root.get_ordered_values(), [25, 50, 62, 75, 87])
+        self.assertIs(new_root.remove(50), new_root)
+        self.assert_valid_tree(new_root)
+
+    def test_remove_last_value(self):
+        int_bst = make_binary_search_tree(values=[2, 1], storage="persistent")
+        int_bst = int_bst.remove(2)
+        self.assertEqual(int_bst.get_ordered_values(), [1])
+        with self.assertRaises(RootNodeDeleteException):
+            int_bst.remove(1)
+
+    def test_versions(self):
+        """Random changes, every version keeps the values it had when it was created"""
+        generator = random.Random(4)
+        root = make_binary_search_tree(values=[500], storage="persistent")
+        expected_values = {500}
+        versions = []
+        for _ in range(30):
+            added = [generator.randint(0, 1000) for _ in range(20)]
+            removed = generator.sample(sorted(expected_values), min(5, len(expected_values) - 1))
+            root = root.add_multiple(added).remove_multiple(removed)
+            expected_values = (expected_values | set(added)) - set(removed)
+            versions.append((root, sorted(expected_values)))
+
+        for version, expected in versions:
+            self.assertEqual(version.get_ordered_values(), expected)
+            self.assertEqual(len(version), len(expected))
+            self.assert_valid_tree(version)
+
+    def test_merge_gives_new_root(self):
+        int_bst = make_binary_search_tree(values=[1, 2], storage="persistent")
+        merged_bst = int_bst.merge(make_binary_search_tree(values=[3], storage="persistent"))
+        self.assertEqual(merged_bst.get_ordered_values(), [1, 2, 3])
+        self.assertEqual(int_bst.get_ordered_values(), [1, 2])
+        self.assertIs(int_bst.snapshot(), int_bst)
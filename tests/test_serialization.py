@@ -0,0 +1,121 @@
+import io
+import os
+import random
+import tempfile
+import unittest
+from unittest import mock
+
+import serialization
+from balanced_binary_search_tree import BalancedBinarySearchTreeNode
+from errors import InvalidStorageException, InvalidTypeException
+from make_bst import make_binary_search_tree
+from serialization import MappedBinarySearchTree
+from sorters import IntegerSorter
+
+
+class SerializationTestCase(unittest.TestCase):
+    """
+    A loaded tree should be the very same tree we saved: values, shape, levels
+    and sizes, and it should work as usual afterwards.
+    """
+
+    def assert_same_tree(self, loaded_bst, saved_bst):
+        self.assertIs(type(loaded_bst), type(saved_bst))
+        self.assertIs(loaded_bst.sorter, saved_bst.sorter)
+        stack = [(loaded_bst, saved_bst)]
+        while stack:
+            loaded_node, saved_node = stack.pop()
+            self.assertEqual(loaded_node.node_value, saved_node.node_value)
+            self.assertEqual(loaded_node.level, saved_node.level)
+            self.assertEqual(loaded_node._size, saved_node._size)
+            for side in ("_left_node", "_right_node"):
+                loaded_child, saved_child = getattr(loaded_node, side), getattr(saved_node, side)
+                self.assertEqual(loaded_child is None, saved_child is None)
+                if saved_child is not None:
+                    stack.append((loaded_child, saved_child))
+
+    def round_trip(self, tree):
+        file = io.BytesIO()
+        serialization.dump(tree, file)
+        file.seek(0)
+        return serialization.load(file)
+
+    def test_round_trip(self):
+        values = [random.Random(i).randint(-1000, 1000) for i in range(500)]
+        for tree in (
+            make_binary_search_tree(values=values),
+            make_binary_search_tree(values=[i / 3 for i in values], bulk_load=True),
+            make_binary_search_tree(values=["m", "a", "z", "B", "ñ"]),
+            make_binary_search_tree(values=values, storage="persistent"),
+            make_binary_search_tree(values=[7]),
+        ):
+            with self.subTest(sorter=tree.sorter, node_class=type(tree)):
+                self.assert_same_tree(self.round_trip(tree), tree)
+
+    def test_balanced_round_trip(self):
+        int_bst = make_binary_search_tree(values=list(range(1000)), balanced=True)
+        loaded_bst = self.round_trip(int_bst)
+        self.assert_same_tree(loaded_bst, int_bst)
+        self.assertEqual(loaded_bst._height, int_bst._height)
+        loaded_bst.add_multiple(range(1000, 2000))
+        self.assertTrue(isinstance(loaded_bst, BalancedBinarySearchTreeNode))
+        self.assertEqual(loaded_bst.depth, 10)
+
+    def test_load_does_not_compare(self):
+        data = serialization.dumps(make_binary_search_tree(values=[5, 3, 8, 1, 4]))
+        with mock.patch.object(IntegerSorter, "compare", side_effect=AssertionError), \
+                mock.patch.object(IntegerSorter, "is_lower_than", side_effect=AssertionError):
+            loaded_bst = serialization.loads(data)
+        self.assertEqual(loaded_bst.get_ordered_values(), [1, 3, 4, 5, 8])
+
+    def test_compact_size(self):
+        """16 bytes header, and 8 bytes key + 8 bytes right index + 1 byte flag per int node"""
+        int_bst = make_binary_search_tree(values=list(range(100)), bulk_load=True)
+        self.assertEqual(len(serialization.dumps(int_bst)), 16 + 100 * 17)
+
+    def test_invalid_data(self):
+        truncated = serialization.dumps(make_binary_search_tree(values=[1, 2]))[:-1]
+        for data in (b"", b"not a tree file at all", truncated):
+            with self.assertRaises(InvalidStorageException):
+                serialization.loads(data)
+        with self.assertRaises(InvalidStorageException):
+            serialization.dumps(make_binary_search_tree(values=[2 ** 70]))
+
+
+class MappedBinarySearchTreeTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.values = [random.Random(i).randint(-1000, 1000) for i in range(500)]
+        self.int_bst = make_binary_search_tree(values=self.values, balanced=True)
+        file_descriptor, self.path = tempfile.mkstemp(suffix=".bst")
+        with os.fdopen(file_descriptor, "wb") as file:
+            serialization.dump(self.int_bst, file)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_queries(self):
+        with MappedBinarySearchTree(self.path) as mapped_bst:
+            self.assertEqual(len(mapped_bst), len(self.int_bst))
+            self.assertEqual(mapped_bst.node_value, self.int_bst.node_value)
+            self.assertEqual(mapped_bst.get_ordered_values(), self.int_bst.get_ordered_values())
+            self.assertEqual(mapped_bst.min_value, self.int_bst.min_value)
+            self.assertEqual(mapped_bst.max_value, self.int_bst.max_value)
+            for value in range(-1010, 1010, 3):
+                self.assertEqual(value in mapped_bst, value in self.int_bst)
+            with self.assertRaises(InvalidTypeException):
+                mapped_bst.contains(0.5)
+
+    def test_float_tree(self):
+        float_bst = make_binary_search_tree(values=[0.5, 0.25, 0.75])
+        with open(self.path, "wb") as file:
+            serialization.dump(float_bst, file)
+        with MappedBinarySearchTree(self.path) as mapped_bst:
+            self.assertTrue(mapped_bst.contains(0.25))
+            self.assertFalse(mapped_bst.contains(0.3))
+
+    def test_char_tree_not_supported(self):
+        with open(self.path, "wb") as file:
+            serialization.dump(make_binary_search_tree(values=["a", "b"]), file)
+        with self.assertRaises(InvalidStorageException):
+            MappedBinarySearchTree(self.path)
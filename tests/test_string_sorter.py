@@ -0,0 +1,12 @@
+from sorters import StringSorter
+from tests.base_sorter_testcase import BaseSorterTestCase
+
+
+class StringSorterTestCase(BaseSorterTestCase.TestCase):
+    """
+    Tests collection for StringSorter, strings of any length
+    """
+    sorter = StringSorter
+    correct_value_lower = "apple"
+    correct_value_bigger = "apples"
+    incorrect_value = b"apple"
@@ -0,0 +1,23 @@
+from errors import InvalidTypeException, MultipleDataTypesException
+from make_bst import make_binary_search_tree
+from sorters import TupleSorter
+from tests.base_sorter_testcase import BaseSorterTestCase
+
+
+class TupleSorterTestCase(BaseSorterTestCase.TestCase):
+    """
+    Tests collection for TupleSorter, ordered item by item
+    """
+    sorter = TupleSorter
+    correct_value_lower = ("2024-01-01", 99)
+    correct_value_bigger = ("2024-01-02", 1)
+    incorrect_value = ["2024-01-01", 99]
+
+    def test_trees_reject_tuples_that_can_not_be_compared(self):
+        with self.assertRaises(MultipleDataTypesException):
+            make_binary_search_tree(values=[(1, "a"), (1, 2)])
+        with self.assertRaises(MultipleDataTypesException):
+            make_binary_search_tree(values=[(1, "a"), (1, 2)], bulk_load=True)
+        tuple_bst = make_binary_search_tree(values=[(1, "a"), (2, "b")])
+        with self.assertRaises(InvalidTypeException):
+            tuple_bst.add((2, 3))
@@ -0,0 +1,128 @@
+import array
+import random
+import unittest
+
+import vectorized
+from array_binary_search_tree import ArrayBinarySearchTree
+from balanced_binary_search_tree import BalancedBinarySearchTreeNode
+from errors import InvalidTypeException, TypeSorterNotFoundException
+from make_bst import make_binary_search_tree
+from sorters import FloatSorter, IntegerSorter, StringSorter
+from vectorized import numpy
+
+
+class VectorizedTestCase(unittest.TestCase):
+    """
+    Typed buffers skip the per value work, but the trees we get
+    and the answers we read from them should be the same ones.
+    """
+
+    def setUp(self):
+        self.values = [random.Random(i).randint(-500, 500) for i in range(300)]
+        self.expected_bst = make_binary_search_tree(values=self.values, bulk_load=True)
+
+    def test_make_tree_from_array(self):
+        int_bst = make_binary_search_tree(values=array.array("q", self.values))
+        self.assertEqual(int_bst.sorter, IntegerSorter)
+        self.assertEqual(int_bst.get_ordered_values(), self.expected_bst.get_ordered_values())
+        self.assertEqual(int_bst.node_value, self.expected_bst.node_value)
+        self.assertEqual(len(int_bst), len(set(self.values)))
+
+    def test_make_tree_from_memoryview(self):
+        float_values = array.array("d", [i / 3 for i in self.values])
+        for storage, node_class in (
+            ("nodes", BalancedBinarySearchTreeNode),
+            ("array", ArrayBinarySearchTree),
+        ):
+            float_bst = make_binary_search_tree(
+                values=memoryview(float_values), balanced=storage == "nodes", storage=storage
+            )
+            self.assertTrue(isinstance(float_bst, node_class))
+            self.assertEqual(float_bst.sorter, FloatSorter)
+            self.assertEqual(float_bst.get_ordered_values(), sorted(set(float_values)))
+
+    def test_unsupported_buffer(self):
+        with self.assertRaises(TypeSorterNotFoundException):
+            make_binary_search_tree(values=memoryview(b"abc").cast("c"))
+
+    def test_middle_first(self):
+        self.assertEqual(vectorized.middle_first([1, 2, 3, 4, 5, 6, 7]), [4, 2, 6, 1, 3, 5, 7])
+        self.assertEqual(vectorized.middle_first([]), [])
+
+    def test_add_multiple_buffer(self):
+        """Sorted buffers are added middle first, so they do not become a list"""
+        int_bst = make_binary_search_tree(values=[0])
+        int_bst.add_multiple(array.array("i", range(1, 1024)))
+        self.assertEqual(int_bst.get_ordered_values(), list(range(1024)))
+        self.assertEqual(int_bst.depth, 10)
+
+        array_bst = make_binary_search_tree(values=[0], storage="array")
+        array_bst.add_multiple(array.array("i", range(1, 1024)))
+        self.assertEqual(array_bst.depth, 10)
+
+        with self.assertRaises(InvalidTypeException):
+            int_bst.add_multiple(array.array("d", [0.5]))
+
+    def test_contains_many_and_rank_many(self):
+        queries = list(range(-510, 510, 7))
+        for int_bst in (
+            make_binary_search_tree(values=self.values),
+            make_binary_search_tree(values=self.values, balanced=True),
+        ):
+            self.assertEqual(
+                list(int_bst.contains_many(queries)), [int_bst.contains(i) for i in queries]
+            )
+            self.assertEqual(
+                list(int_bst.rank_many(array.array("q", queries))),
+                [int_bst.rank(i) for i in queries],
+            )
+
+    def test_batch_lookups_after_changes(self):
+        """The ordered values snapshot is a cached property, changes clear it"""
+        int_bst = make_binary_search_tree(values=[5, 3, 8])
+        self.assertEqual(list(int_bst.contains_many([4, 8])), [False, True])
+        int_bst.add(4)
+        int_bst.remove(8)
+        self.assertEqual(list(int_bst.contains_many([4, 8])), [True, False])
+        self.assertEqual(list(int_bst.rank_many([4, 8])), [1, 3])
+
+    def test_batch_lookups_char_tree(self):
+        char_bst = make_binary_search_tree(values=["d", "b", "a"])
+        self.assertEqual(char_bst.contains_many(["a", "B", "c"]), [True, True, False])
+        self.assertEqual(char_bst.rank_many(["a", "c"]), [0, 2])
+
+    def test_batch_lookups_other_sorters(self):
+        """Tuples, bytes and strings search value by value, numpy arrays of them don't sort like the tree"""
+        tuple_bst = make_binary_search_tree(values=[(2, 1), (1, 2)])
+        self.assertEqual(tuple_bst.contains_many([(1, 2), (1, 3)]), [True, False])
+        self.assertEqual(tuple_bst.rank_many([(2, 1), (3, 0)]), [1, 2])
+        bytes_bst = make_binary_search_tree(values=[b"a", b"b"])
+        self.assertEqual(bytes_bst.contains_many([b"a\x00", b"a"]), [False, True])
+        string_bst = make_binary_search_tree(values=["a", "b"], sorter=StringSorter)
+        self.assertEqual(string_bst.contains_many(["a\x00", "a"]), [False, True])
+
+    def test_batch_lookups_invalid_type(self):
+        int_bst = make_binary_search_tree(values=[5, 3, 8])
+        with self.assertRaises(InvalidTypeException):
+            int_bst.contains_many([1, "a"])
+        with self.assertRaises(InvalidTypeException):
+            int_bst.rank_many(array.array("d", [1.5]))
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_numpy_arrays(self):
+        int_bst = make_binary_search_tree(values=numpy.array(self.values, dtype=numpy.int64))
+        self.assertEqual(int_bst.get_ordered_values(), self.expected_bst.get_ordered_values())
+        self.assertTrue(all(isinstance(i, int) for i in int_bst.get_ordered_values()))
+
+        queries = numpy.arange(-510, 510, 7)
+        found = int_bst.contains_many(queries)
+        self.assertTrue(isinstance(found, numpy.ndarray))
+        self.assertEqual(found.tolist(), [int_bst.contains(int(i)) for i in queries])
+        self.assertEqual(
+            int_bst.rank_many(queries).tolist(), [int_bst.rank(int(i)) for i in queries]
+        )
+
+        float_bst = make_binary_search_tree(values=numpy.array([0.5, 0.25, 0.5]))
+        self.assertEqual(float_bst.get_ordered_values(), [0.25, 0.5])
+        with self.assertRaises(InvalidTypeException):
+            float_bst.add_multiple(numpy.array([1, 2]))
@@ -0,0 +1,123 @@
+"""
+Bulk helpers for values that come in typed buffers: numpy arrays, array.array and memoryview.
+Every item of a typed buffer has the same type, so we don't need to validate them one by one,
+and sorting, removing duplicates and batch lookups can run as a few calls over the
+whole buffer instead of a python loop per value.
+numpy is optional, without it we fall back to sorted(), set() and bisect.
+"""
+import array
+import bisect
+import collections
+import typing
+
+from errors import InvalidTypeException, TypeSorterNotFoundException
+from sorters import BaseSorter, FloatSorter, IntegerSorter
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# array.array typecodes and memoryview formats (struct module) of numeric items
+INTEGER_FORMATS = set("bBhHiIlLqQnN")
+FLOAT_FORMATS = set("efd")
+
+
+def is_buffer(values: typing.Any) -> bool:
+    """Check if values come in a typed buffer, so we can take the bulk path"""
+    if isinstance(values, (array.array, memoryview)):
+        return True
+    return numpy is not None and isinstance(values, numpy.ndarray)
+
+
+def get_sorter_for_buffer(values: typing.Any) -> typing.Type[BaseSorter]:
+    """Gets the sorter that corresponds to the items type of the buffer"""
+    if isinstance(values, array.array):
+        item_format = values.typecode
+    elif isinstance(values, memoryview):
+        item_format = values.format[-1:]  # <- "<q", "=d"... the last char is the type
+    else:
+        item_format = {"i": "q", "u": "Q", "f": "d"}.get(values.dtype.kind, "")
+
+    if item_format in INTEGER_FORMATS:
+        return IntegerSorter
+    if item_format in FLOAT_FORMATS:
+        return FloatSorter
+    raise TypeSorterNotFoundException(f"Sorter for buffer items {item_format or values.dtype}.")
+
+
+def validate_buffer(values: typing.Any, sorter: typing.Type[BaseSorter]):
+    """The check that sorter.validate_value does per value, once for the whole buffer"""
+    if get_sorter_for_buffer(values) is not sorter:
+        raise InvalidTypeException(f"We allow {sorter.allowed_type} value types only.")
+
+
+def sort_unique_buffer(values: typing.Any) -> list:
+    """
+    Same result than BaseSorter.sort_unique, ready for from_sorted.
+    numpy sorts and drops duplicates in C, the result has python ints and floats.
+    """
+    if numpy is not None:
+        return numpy.unique(numpy.asarray(values)).tolist()
+    return sorted(set(values))
+
+
+def middle_first(values: typing.Sequence) -> list:
+    """
+    Order sorted values level by level of the minimum height tree they would make
+    (see BinarySearchTreeNode.from_sorted), adding them in this order to an existing tree
+    keeps them as balanced as possible between them, in sorted order they would make a list.
+    [1, 2, 3, 4, 5, 6, 7]  ->  [4, 2, 6, 1, 3, 5, 7]
+    """
+    result = []
+    queue = collections.deque([(0, len(values))])
+    while queue:
+        low, high = queue.popleft()
+        if low >= high:
+            continue
+        middle = (low + high - 1) // 2
+        result.append(values[middle])
+        queue.append((low, middle))
+        queue.append((middle + 1, high))
+    return result
+
+
+def supports_sorter(sorter: typing.Type[BaseSorter]) -> bool:
+    """
+    Only ints and floats make numeric arrays that sort like the tree: tuples of the same
+    length would make a 2-D array, and str or bytes fixed width ones that drop trailing NULs.
+    """
+    return sorter in (IntegerSorter, FloatSorter)
+
+
+def make_sorted_keys(ordered_values: list) -> typing.Any:
+    """Snapshot of tree values to search in, a numpy array when we have numpy"""
+    if numpy is not None:
+        return numpy.asarray(ordered_values)
+    return ordered_values
+
+
+def rank_many(sorted_keys: typing.Any, values: typing.Any) -> typing.Any:
+    """Position of every value on the sorted keys, like BinarySearchTreeNode.rank"""
+    if numpy is not None:
+        return numpy.searchsorted(sorted_keys, numpy.asarray(values), side="left")
+    return [bisect.bisect_left(sorted_keys, _value) for _value in values]
+
+
+def contains_many(sorted_keys: typing.Any, values: typing.Any) -> typing.Any:
+    """Check for every value if it is on the sorted keys"""
+    if numpy is not None:
+        values = numpy.asarray(values)
+        positions = numpy.searchsorted(sorted_keys, values, side="left")
+        inside = positions < len(sorted_keys)
+        result = numpy.zeros(len(values), dtype=bool)
+        result[inside] = sorted_keys[positions[inside]] == values[inside]
+        return result
+
+    size = len(sorted_keys)
+    result = []
+    for _value in values:
+        position = bisect.bisect_left(sorted_keys, _value)
+        result.append(position < size and sorted_keys[position] == _value)
+    return result